@@ -0,0 +1,18 @@
+-- ===================================================================
+-- 활동 로그 커서 페이지네이션 인덱스 마이그레이션 스크립트
+-- 목적: GET /api/v1/logs/{project_id}?cursor= 의 (timestamp, log_id) keyset 조회 지원
+-- ===================================================================
+
+CREATE INDEX IF NOT EXISTS ix_activity_logs_project_timestamp_log_id
+    ON public.activity_logs (project_id, "timestamp" DESC, log_id DESC);
+
+-- entity_type 필터
+-- (타입별 부분 인덱스 대신 복합 인덱스: entity_type은 NOT NULL이고 값이 몇 개뿐이라
+--  부분 인덱스의 이점이 없고, 필터 값이 바인드 파라미터인 일반 실행 계획에서도 인덱스 사용 가능)
+CREATE INDEX IF NOT EXISTS ix_activity_logs_project_entity_timestamp_log_id
+    ON public.activity_logs (project_id, entity_type, "timestamp" DESC, log_id DESC);
+
+-- user_id 필터 (탈퇴 사용자의 NULL 로그 제외)
+CREATE INDEX IF NOT EXISTS ix_activity_logs_project_user_timestamp_log_id
+    ON public.activity_logs (project_id, user_id, "timestamp" DESC, log_id DESC)
+    WHERE user_id IS NOT NULL;
@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, Text, DateTime, Boolean, ForeignKey, String, Table
+from sqlalchemy import Column, Integer, Text, DateTime, Boolean, ForeignKey, String, Table, Index
 from backend.database.base import Base
 import asyncio
 from pydantic import BaseModel
@@ -44,6 +44,25 @@ class ActivityLog(Base):
     details = Column(Text, nullable=True)         # 상세 내용(댓글/업무제목)
     timestamp = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
 
+    __table_args__ = (
+        # 프로젝트 활동 로그 커서 페이지네이션 (timestamp DESC, log_id DESC)
+        Index("ix_activity_logs_project_timestamp_log_id", project_id, timestamp.desc(), log_id.desc()),
+        # entity_type 필터 + 커서 페이지네이션
+        # 타입별 부분 인덱스 대신 복합 인덱스 하나를 사용: entity_type은 NULL이 없고 값이 몇 개뿐이라
+        # 부분 인덱스로 줄어드는 행이 없으며, 필터 값이 바인드 파라미터여도 항상 인덱스가 사용됨
+        Index(
+            "ix_activity_logs_project_entity_timestamp_log_id",
+            project_id, entity_type, timestamp.desc(), log_id.desc()
+        ),
+        # user_id 필터 + 커서 페이지네이션 (탈퇴 사용자의 NULL 로그 제외 부분 인덱스)
+        Index(
+            "ix_activity_logs_project_user_timestamp_log_id",
+            project_id, user_id, timestamp.desc(), log_id.desc(),
+            postgresql_where=user_id.isnot(None),
+            sqlite_where=user_id.isnot(None)
+        ),
+    )
+
 
 class LogResponse(BaseModel):
     log_id: int
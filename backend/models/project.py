@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, Text, DateTime, Boolean, ForeignKey, String
+from sqlalchemy import Column, Integer, Text, DateTime, Boolean, ForeignKey, String, Date
 from backend.database.base import Base
 
 class Project(Base):
@@ -19,4 +19,31 @@ class ProjectMember(Base):
     project_id = Column(Integer, ForeignKey("projects.project_id", ondelete="CASCADE"), primary_key=True)
     user_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"), primary_key=True)
     role = Column(Text, nullable=False, default="member")  # owner, admin, member, viewer
-    notify_email = Column(Boolean, nullable=False, default=False)
\ No newline at end of file
+    notify_email = Column(Boolean, nullable=False, default=False)
+
+class ProjectTaskVersion(Base):
+    __tablename__ = "project_task_versions"
+
+    # 프로젝트 업무 목록 버전 (업무/태그/멤버 변경 시 증가, ETag 생성용)
+    project_id = Column(Integer, ForeignKey("projects.project_id", ondelete="CASCADE"), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+class ProjectTaskStat(Base):
+    __tablename__ = "project_task_stats"
+
+    # 프로젝트 업무 집계 카운터 (상태 x 담당자 x 태그별 업무 수, 업무 변경 시 증감)
+    # assignee_id 0 = 담당자 없음, tag_name "" = 태그와 무관한 업무 단위 행
+    project_id = Column(Integer, ForeignKey("projects.project_id", ondelete="CASCADE"), primary_key=True)
+    status = Column(Text, primary_key=True)
+    assignee_id = Column(Integer, primary_key=True)
+    tag_name = Column(Text, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+class ProjectStatusSnapshot(Base):
+    __tablename__ = "project_status_snapshot"
+
+    # 프로젝트 일별 상태별 업무 수 (번다운 / 누적 흐름도용, 매일 스케줄러가 기록)
+    project_id = Column(Integer, ForeignKey("projects.project_id", ondelete="CASCADE"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    status = Column(Text, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Text, ForeignKey
+from sqlalchemy import Column, Integer, Text, ForeignKey, Index
 from backend.database.base import Base
 
 
@@ -15,3 +15,7 @@ class TaskTag(Base):
     task_id = Column(Integer, ForeignKey("tasks.task_id", ondelete="CASCADE"), primary_key=True)
     tag_name = Column(Text, nullable=False, primary_key=True)
 
+    __table_args__ = (
+        # 태그 이름으로 업무 필터링
+        Index("ix_task_tags_tag_name_task_id", "tag_name", "task_id"),
+    )
@@ -1,6 +1,7 @@
 from datetime import datetime, timezone, date
-from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey, Date, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey, Date, Boolean, Index, DDL, event
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from backend.database.base import Base
 
 
@@ -19,12 +20,75 @@ class Task(Base):
     status = Column(Text, nullable=False, default="todo")
     is_parent_task = Column(Boolean, nullable=False, default=False)
     updated_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    sync_version = Column(Integer, nullable=False, default=0)  # 마지막 변경 시점의 프로젝트 업무 버전 (변경 동기화용)
+    version = Column(Integer, nullable=False, default=1, server_default="1")  # 업무 행 버전 (낙관적 동시성 제어, If-Match)
+    # 전문 검색용 tsvector (제목 A, 설명 B, 댓글 C 가중치). PostgreSQL 전용이며 목록 조회 시에는 로드하지 않음
+    search_vector = deferred(Column(Text().with_variant(TSVECTOR(), "postgresql"), nullable=True))
 
     assignee = relationship("User", back_populates="tasks")
     parent_task = relationship("Task", remote_side=[task_id], backref="subtasks")
 
+    # ORM UPDATE마다 "SET version = 새 버전 WHERE version = 읽은 버전"으로 실행되어
+    # 읽은 뒤 다른 요청이 먼저 수정했으면 StaleDataError 발생
+    __mapper_args__ = {"version_id_col": version}
+
+    __table_args__ = (
+        # 업무 목록 커서 페이지네이션 (updated_at, task_id)
+        Index("ix_tasks_project_updated_at_task_id", "project_id", "updated_at", "task_id"),
+        # 업무 목록 서버 측 필터
+        Index("ix_tasks_project_status", "project_id", "status"),
+        Index("ix_tasks_project_assignee", "project_id", "assignee_id"),
+        Index("ix_tasks_project_due_date", "project_id", "due_date"),
+        # 타임라인(간트) 기간 조회
+        Index("ix_tasks_project_start_due", "project_id", "start_date", "due_date"),
+        # 대시보드 상위 업무 진행률 집계 (parent_task_id x status 인덱스 전용 스캔)
+        Index("ix_tasks_project_parent_status", "project_id", "parent_task_id", "status"),
+        # 변경 동기화 (sync_version 이후 변경분 조회)
+        Index("ix_tasks_project_sync_version", "project_id", "sync_version"),
+        # 전문 검색 (PostgreSQL GIN 인덱스)
+        Index("ix_tasks_search_vector", "search_vector", postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
+
+
+# SQLite(단일 노드 배포)용 전문 검색 FTS5 테이블 (rowid = task_id)
+# 기존 SQLite DB에는 backfill_task_tables.py(ensure_task_search)가 같은 DDL로 생성
+TASK_SEARCH_FTS5_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS task_search "
+    "USING fts5(title, description, comments, project_id UNINDEXED, tokenize='unicode61')"
+)
+event.listen(Task.__table__, "after_create", DDL(TASK_SEARCH_FTS5_DDL).execute_if(dialect="sqlite"))
+
+
 class TaskMember(Base):
     __tablename__ = "task_members"
 
     task_id = Column(Integer, ForeignKey("tasks.task_id", ondelete="CASCADE"), primary_key=True)
     user_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"), primary_key=True)
+
+
+class TaskTombstone(Base):
+    __tablename__ = "task_tombstones"
+
+    # 삭제된 업무 기록 (변경 동기화 클라이언트에 삭제 사실 전달용)
+    task_id = Column(Integer, primary_key=True)
+    project_id = Column(Integer, ForeignKey("projects.project_id", ondelete="CASCADE"), nullable=False)
+    sync_version = Column(Integer, nullable=False)
+    deleted_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    __table_args__ = (
+        Index("ix_task_tombstones_project_sync_version", "project_id", "sync_version"),
+    )
+
+
+class TaskClosure(Base):
+    __tablename__ = "task_closure"
+
+    # 업무 계층 클로저 테이블 (모든 상위-하위 쌍, 자기 자신은 depth 0)
+    ancestor_id = Column(Integer, ForeignKey("tasks.task_id", ondelete="CASCADE"), primary_key=True)
+    descendant_id = Column(Integer, ForeignKey("tasks.task_id", ondelete="CASCADE"), primary_key=True)
+    depth = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        # 상위 업무 조회 (descendant_id 기준)
+        Index("ix_task_closure_descendant_depth", "descendant_id", "depth"),
+    )
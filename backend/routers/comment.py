@@ -11,6 +11,7 @@ from backend.routers.notifications import create_notification, create_comment_no
 from backend.models.logs_notification import ActivityLog
 from backend.websocket.events import event_emitter
 from backend.utils.activity_logger import log_comment_activity
+from backend.utils.task_search import refresh_task_search
 import re
 
 
@@ -47,6 +48,8 @@ async def create_comment(comment: CommentCreate, db: Session = Depends(get_db),
         is_updated=0
     )
     db.add(db_comment)
+    db.flush()
+    refresh_task_search(db, [comment.task_id])
     db.commit()
     db.refresh(db_comment)
 
@@ -176,6 +179,8 @@ async def update_comment(comment_id: int, comment: CommentUpdate, db: Session =
     db_comment.content = comment.content
     db_comment.is_updated = 1
     db_comment.updated_at = datetime.now(timezone.utc)
+    db.flush()
+    refresh_task_search(db, [db_comment.task_id])
     db.commit()
     db.refresh(db_comment)
     
@@ -255,6 +260,8 @@ async def delete_comment(comment_id: int, db: Session = Depends(get_db), current
             print(f"댓글 삭제 로그 작성 실패: {e}")
     
     db.delete(db_comment)
+    db.flush()
+    refresh_task_search(db, [comment_info["task_id"]])
     db.commit()
     
     # WebSocket 이벤트 발행 (댓글 삭제)
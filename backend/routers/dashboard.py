@@ -1,15 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, desc
-from typing import List, Dict, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import SingletonThreadPool, StaticPool
+from sqlalchemy import case, func, desc
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from datetime import date, timedelta
 
 from backend.database.base import get_db
 from backend.models.task import Task
 from backend.models.user import User
-from backend.models.project import ProjectMember
-from backend.models.tag import Tag, TaskTag
+from backend.models.project import Project, ProjectMember, ProjectStatusSnapshot
+from backend.models.workspace import Workspace
+from backend.models.workspace_project_order import WorkspaceProjectOrder
 from backend.models.logs_notification import Notification
 from backend.middleware.auth import verify_token
+from backend.utils.tag_registry import get_project_tag_names
+from backend.utils.dashboard_cache import get_cached_dashboard
+from backend.utils.task_stats import (
+    TASK_STATUSES, UNASSIGNED, get_assignee_status_counts, get_grouped_status_counts, get_status_counts
+)
 from pydantic import BaseModel
 
 router = APIRouter(prefix="/api/v1/dashboard", tags=["dashboard"])
@@ -51,20 +61,231 @@ class ParentTaskProgress(BaseModel):
     complete: int
     
 class DashboardData(BaseModel):
+    # sections 파라미터로 요청하지 않은 항목은 응답에서 제외
+    status_overview: Optional[StatusOverview] = None
+    personal_overview: Optional[StatusOverview] = None
+    recent_activities: Optional[List[RecentActivity]] = None
+    tag_usage: Optional[List[TagUsage]] = None
+    team_workload: Optional[List[TeamWorkload]] = None
+    parent_task_progress: Optional[List[ParentTaskProgress]] = None
+
+class ProjectFlowData(BaseModel):
+    project_id: int
+    from_date: date
+    to_date: date
+    days: List[date]
+    series: Dict[str, List[int]]  # 상태별 일별 업무 수 (누적 흐름도)
+    remaining: List[int]          # 일별 미완료 업무 수 (번다운)
+
+class WorkspaceWorkload(TeamWorkload):
+    member_id: int
+    overdue_count: int
+
+class WorkspaceProjectSummary(BaseModel):
+    project_id: int
+    project_title: str
     status_overview: StatusOverview
-    personal_overview: StatusOverview
-    recent_activities: List[RecentActivity]
-    tag_usage: List[TagUsage]
-    team_workload: List[TeamWorkload]
-    parent_task_progress: List[ParentTaskProgress]
+    overdue_count: int
+    team_workload: List[WorkspaceWorkload]
+
+class WorkspaceDashboardData(BaseModel):
+    workspace_id: int
+    workspace_name: str
+    status_overview: StatusOverview
+    overdue_count: int
+    team_workload: List[WorkspaceWorkload]
+    projects: List[WorkspaceProjectSummary]
+
+# 대시보드 목록 항목 수 (태그 / 상위 업무 진행률 상위 N개)
+DASHBOARD_TOP_N = 5
+
+# 흐름 차트 기본 / 최대 조회 기간(일)
+FLOW_DEFAULT_DAYS = 30
+FLOW_MAX_DAYS = 366
+
+
+def _status_summary(counts: Dict[str, int]) -> Dict[str, int]:
+    """상태별 업무 수를 응답 형식(전체 + 상태별)으로 변환"""
+    summary = {task_status: counts.get(task_status, 0) for task_status in TASK_STATUSES}
+    summary["total_count"] = sum(counts.values())
+    return summary
+
+
+def _status_overview(db: Session, project_id: int) -> Dict:
+    """전체 상태 개요"""
+    status_overview = _status_summary(get_status_counts(db, project_id))
+    status_overview["total_tasks"] = status_overview.pop("total_count")
+    return status_overview
+
+
+def _recent_activities(db: Session, project_id: int) -> List[Dict]:
+    """최근 활동 (알림 기반)"""
+    activities_query = db.query(Notification).filter(
+        Notification.user_id.in_(
+            db.query(ProjectMember.user_id).filter(ProjectMember.project_id == project_id)
+        )
+    ).order_by(desc(Notification.created_at)).limit(5).all()
+    return [{"message": a.message, "created_at": a.created_at.isoformat()} for a in activities_query]
+
+
+def _tag_usage(db: Session, project_id: int) -> List[Dict]:
+    """태그 유형 (상태별 집계, 상위 5개)"""
+    tag_usage = []
+    tag_counts = get_grouped_status_counts(db, project_id, by="tag")
+    for tag_name in sorted(get_project_tag_names(db, project_id)):
+        if tag_name in tag_counts:  # 태그가 사용된 경우만 포함
+            tag_usage.append({"tag_name": tag_name, **_status_summary(tag_counts[tag_name])})
+    tag_usage.sort(key=lambda x: x['total_count'], reverse=True)
+    tag_usage = tag_usage[:DASHBOARD_TOP_N]  # 상위 5개만
+    return tag_usage
+
+
+def _team_workload(db: Session, project_id: int) -> List[Dict]:
+    """팀 워크로드 (담당자별 상태 집계)"""
+    assignee_counts = get_grouped_status_counts(db, project_id, by="assignee")
+    assignee_counts.pop(UNASSIGNED, None)
+    member_names = dict(
+        db.query(User.user_id, User.name).filter(User.user_id.in_(assignee_counts.keys())).all()
+    ) if assignee_counts else {}
+
+    # 이름이 같은 담당자는 하나로 합산 (기존 응답과 동일)
+    member_dict = {}
+    for assignee_id, counts in assignee_counts.items():
+        member_name = member_names.get(assignee_id)
+        if member_name is None:
+            continue
+        merged = member_dict.setdefault(member_name, {})
+        for task_status, count in counts.items():
+            merged[task_status] = merged.get(task_status, 0) + count
+
+    team_workload = [
+        {"member_name": member_name, **_status_summary(counts)}
+        for member_name, counts in member_dict.items()
+    ]
+    team_workload.sort(key=lambda x: x['total_count'], reverse=True)
+    return team_workload
+
+
+def _parent_task_progress(db: Session, project_id: int) -> List[Dict]:
+    """상위 업무 진행률 (각 상위 업무별 하위 업무 상태 집계, 상위 5개)"""
+    # 하위 업무를 parent_task_id x 상태로 한 번 GROUP BY 한 뒤 상위 업무와 조인, 하위 업무 개수 기준 상위 5개만 조회
+    children = db.query(
+        Task.parent_task_id.label("parent_task_id"),
+        func.count().label("child_count"),
+        *[func.count(case((Task.status == task_status, 1))).label(task_status) for task_status in TASK_STATUSES]
+    ).filter(
+        Task.project_id == project_id,
+        Task.parent_task_id.isnot(None)
+    ).group_by(Task.parent_task_id).subquery()
+
+    child_count = func.coalesce(children.c.child_count, 0)
+    rows = db.query(
+        Task.title,
+        Task.status,
+        child_count.label("child_count"),
+        *[getattr(children.c, task_status) for task_status in TASK_STATUSES]
+    ).outerjoin(
+        children, children.c.parent_task_id == Task.task_id
+    ).filter(
+        Task.project_id == project_id,
+        Task.is_parent_task.is_(True)
+    ).order_by(
+        # 하위 업무가 없으면 상위 업무 자체(1개)로 계산
+        desc(case((child_count == 0, 1), else_=child_count)), Task.task_id
+    ).limit(DASHBOARD_TOP_N).all()
+
+    parent_task_progress = []
+    for row in rows:
+        if row.child_count:
+            counts = {task_status: getattr(row, task_status) for task_status in TASK_STATUSES}
+        else:
+            # 하위 업무가 없으면 상위 업무 자체의 상태만 고려
+            counts = {row.status: 1}
+        summary = _status_summary(counts)
+        summary["total_count"] = row.child_count or 1
+        parent_task_progress.append({"parent_task_name": row.title, **summary})
+    return parent_task_progress
+
+
+# 사용자와 무관한 대시보드 항목 계산 함수 (프로젝트별 캐시 대상)
+# 업무를 불러오지 않고 집계 쿼리만 사용하므로 업무 수와 관계없이 항목별 쿼리 수가 고정입니다.
+SHARED_SECTIONS: Dict[str, Callable[[Session, int], Any]] = {
+    "status_overview": _status_overview,
+    "recent_activities": _recent_activities,
+    "tag_usage": _tag_usage,
+    "team_workload": _team_workload,
+    "parent_task_progress": _parent_task_progress,
+}
+
+# 요청 세션에서 바로 계산하는 가벼운 항목 (나머지는 별도 세션에서 동시에 계산)
+INLINE_SECTIONS = ("status_overview",)
+
+DASHBOARD_SECTIONS = ("status_overview", "personal_overview", "recent_activities", "tag_usage", "team_workload", "parent_task_progress")
+
+# 항목 동시 계산용 스레드 풀. 작업마다 커넥션 풀에서 커넥션을 하나씩 쓰므로 풀 크기보다 작게 유지
+DASHBOARD_WORKERS = 4
+_section_executor = ThreadPoolExecutor(max_workers=DASHBOARD_WORKERS, thread_name_prefix="dashboard")
+
+
+def _compute_section_in_new_session(db: Session, section: str, project_id: int):
+    """요청 세션과 같은 엔진의 새 세션(별도 커넥션)에서 항목을 계산합니다."""
+    with Session(bind=db.get_bind(), autoflush=False) as section_db:
+        return SHARED_SECTIONS[section](section_db, project_id)
+
+
+def _supports_concurrent_sessions(db: Session) -> bool:
+    """커넥션 풀이 여러 커넥션을 제공하는지 (인메모리 SQLite의 단일 커넥션 풀은 동시 사용 불가)"""
+    return not isinstance(db.get_bind().pool, (StaticPool, SingletonThreadPool))
+
+
+def compute_dashboard_sections(db: Session, project_id: int, sections: Iterable[str]) -> Dict:
+    """
+    요청한 공통 항목을 프로젝트 캐시에서 가져오거나 계산합니다.
+    캐시 미스인 독립 항목은 각자 풀에서 커넥션을 받아 동시에 계산하므로 응답 시간이 가장 느린 항목에 맞춰집니다.
+    """
+    sections = [section for section in sections if section in SHARED_SECTIONS]
+    concurrent = _supports_concurrent_sessions(db)
+
+    futures = {}
+    for section in sections:
+        if concurrent and section not in INLINE_SECTIONS:
+            futures[section] = _section_executor.submit(
+                get_cached_dashboard, project_id, section,
+                partial(_compute_section_in_new_session, db, section, project_id)
+            )
+
+    result = {}
+    for section in sections:
+        if section not in futures:
+            result[section] = get_cached_dashboard(project_id, section, partial(SHARED_SECTIONS[section], db, project_id))
+    for section, future in futures.items():
+        result[section] = future.result()
+    return result
+
+
+def parse_dashboard_sections(sections: Optional[str]) -> List[str]:
+    """sections 파라미터(콤마 구분)를 항목 목록으로 변환합니다. 지정하지 않으면 전체 항목"""
+    if not sections:
+        return list(DASHBOARD_SECTIONS)
+    requested = list(dict.fromkeys(section.strip() for section in sections.split(",") if section.strip()))
+    invalid = [section for section in requested if section not in DASHBOARD_SECTIONS]
+    if invalid:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 대시보드 항목입니다: {', '.join(invalid)}")
+    return requested
+
 
 # --- API 엔드포인트 ---
-@router.get("/{project_id}", response_model=DashboardData)
+@router.get("/{project_id}", response_model=DashboardData, response_model_exclude_none=True)
 def get_dashboard_data(
     project_id: int,
+    sections: Optional[str] = Query(
+        None, description="계산할 항목 (콤마 구분, 기본값 전체): " + ",".join(DASHBOARD_SECTIONS)
+    ),
     db: Session = Depends(get_db),
     current_user: User = Depends(verify_token)
 ):
+    requested = parse_dashboard_sections(sections)
+
     # 1. 권한 확인
     member = db.query(ProjectMember).filter(
         ProjectMember.project_id == project_id,
@@ -73,117 +294,186 @@ def get_dashboard_data(
     if not member:
         raise HTTPException(status_code=403, detail="프로젝트 접근 권한이 없습니다.")
 
-    # 2. 기본 업무 데이터 조회 (태그 정보 및 담당자 정보 포함)
-    tasks = db.query(Task).options(joinedload(Task.assignee)).filter(Task.project_id == project_id).all()
-    
-    # 각 업무의 태그 정보를 미리 로드
-    task_tags = {}
-    for task in tasks:
-        tags = db.query(TaskTag).filter(TaskTag.task_id == task.task_id).all()
-        task_tags[task.task_id] = [tag.tag_name for tag in tags]
-    
-    total_tasks = len(tasks)
+    # 2. 프로젝트 공통 항목 (항목별 캐시, 업무/태그/멤버 변경 시 무효화)
+    dashboard = compute_dashboard_sections(db, project_id, requested)
 
-    # --- 데이터 계산 ---
-    
-    # 2.1 전체 상태 개요
-    status_overview = {
-        "total_tasks": total_tasks,
-        "todo": sum(1 for t in tasks if t.status == 'todo'),
-        "in_progress": sum(1 for t in tasks if t.status == 'in_progress'),
-        "pending": sum(1 for t in tasks if t.status == 'pending'),
-        "complete": sum(1 for t in tasks if t.status == 'complete')
-    }
+    # 3. 개인 상태 개요 (사용자별이므로 캐시하지 않고 매번 계산)
+    if "personal_overview" in requested:
+        personal_overview = _status_summary(get_status_counts(db, project_id, assignee_id=current_user.user_id))
+        personal_overview["total_tasks"] = personal_overview.pop("total_count")
+        dashboard["personal_overview"] = personal_overview
 
-    # 2.2 개인 상태 개요
-    my_tasks = [t for t in tasks if t.assignee_id == current_user.user_id]
-    personal_overview = {
-        "total_tasks": len(my_tasks),
-        "todo": sum(1 for t in my_tasks if t.status == 'todo'),
-        "in_progress": sum(1 for t in my_tasks if t.status == 'in_progress'),
-        "pending": sum(1 for t in my_tasks if t.status == 'pending'),
-        "complete": sum(1 for t in my_tasks if t.status == 'complete')
-    }
+    return DashboardData(**dashboard)
 
-    # 2.3 최근 활동 (알림 기반)
-    activities_query = db.query(Notification).filter(
-        Notification.user_id.in_(
-            db.query(ProjectMember.user_id).filter(ProjectMember.project_id == project_id)
-        )
-    ).order_by(desc(Notification.created_at)).limit(5).all()
-    recent_activities = [{"message": a.message, "created_at": a.created_at.isoformat()} for a in activities_query]
 
+def _workspace_workload(
+    counts: Dict[int, Dict[str, int]],
+    overdue: Dict[int, int],
+    member_names: Dict[int, str]
+) -> List[Dict]:
+    """담당자별 상태 집계를 워크로드 목록으로 변환 (업무 수 내림차순)"""
+    workload = [
+        {
+            "member_id": assignee_id,
+            "member_name": member_names[assignee_id],
+            "overdue_count": overdue.get(assignee_id, 0),
+            **_status_summary(status_counts)
+        }
+        for assignee_id, status_counts in counts.items()
+        if assignee_id in member_names
+    ]
+    workload.sort(key=lambda x: x['total_count'], reverse=True)
+    return workload
 
-    # 2.4 태그 유형 (상태별 집계)
-    tag_usage = []
-    tag_list = db.query(Tag.tag_name).filter(Tag.project_id == project_id).all()
-    for tag_row in tag_list:
-        tag_name = tag_row.tag_name
-        # 해당 태그를 가진 업무들 찾기
-        tag_tasks = [t for t in tasks if tag_name in task_tags.get(t.task_id, [])]
-        if tag_tasks:  # 태그가 사용된 경우만 포함
-            tag_usage.append({
-                "tag_name": tag_name,
-                "total_count": len(tag_tasks),
-                "todo": sum(1 for t in tag_tasks if t.status == 'todo'),
-                "in_progress": sum(1 for t in tag_tasks if t.status == 'in_progress'),
-                "pending": sum(1 for t in tag_tasks if t.status == 'pending'),
-                "complete": sum(1 for t in tag_tasks if t.status == 'complete')
-            })
-    tag_usage.sort(key=lambda x: x['total_count'], reverse=True)
-    tag_usage = tag_usage[:5]  # 상위 5개만
 
-    # 2.5 팀 워크로드 (상태별 집계)
-    team_workload = []
-    assigned_tasks = [t for t in tasks if t.assignee_id is not None and t.assignee is not None]
-    member_dict = {}
-    for task in assigned_tasks:
-        member_name = task.assignee.name
-        if member_name not in member_dict:
-            member_dict[member_name] = []
-        member_dict[member_name].append(task)
-    
-    for member_name, member_tasks in member_dict.items():
-        team_workload.append({
-            "member_name": member_name,
-            "total_count": len(member_tasks),
-            "todo": sum(1 for t in member_tasks if t.status == 'todo'),
-            "in_progress": sum(1 for t in member_tasks if t.status == 'in_progress'),
-            "pending": sum(1 for t in member_tasks if t.status == 'pending'),
-            "complete": sum(1 for t in member_tasks if t.status == 'complete')
-        })
-    team_workload.sort(key=lambda x: x['total_count'], reverse=True)
+@router.get("/workspace/{workspace_id}", response_model=WorkspaceDashboardData)
+def get_workspace_dashboard(
+    workspace_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(verify_token)
+):
+    """
+    워크스페이스의 모든 프로젝트(사용자가 멤버인 프로젝트)의 상태/워크로드/연체 집계를 프로젝트별로 반환합니다.
+    프로젝트 수와 관계없이 워크스페이스/프로젝트/상태 집계/연체 집계/사용자 이름 쿼리 5번으로 계산합니다.
+    """
+    # 1. 워크스페이스 소유권 확인
+    workspace = db.query(Workspace).filter(
+        Workspace.workspace_id == workspace_id,
+        Workspace.user_id == current_user.user_id
+    ).first()
+    if not workspace:
+        raise HTTPException(status_code=404, detail="워크스페이스를 찾을 수 없거나 접근 권한이 없습니다.")
 
-    # 2.6 상위 업무 진행률 (각 상위 업무별 하위 업무 상태 집계)
-    parent_tasks = [t for t in tasks if t.is_parent_task]
-    parent_task_progress = []
-    
-    for parent_task in parent_tasks:
-        # 해당 상위 업무의 하위 업무들 찾기
-        child_tasks = [t for t in tasks if t.parent_task_id == parent_task.task_id]
-        
-        # 하위 업무가 없으면 상위 업무 자체의 상태만 고려
-        if not child_tasks:
-            child_tasks = [parent_task]
-        
-        parent_task_progress.append({
-            "parent_task_name": parent_task.title,
-            "total_count": len(child_tasks),
-            "todo": sum(1 for t in child_tasks if t.status == 'todo'),
-            "in_progress": sum(1 for t in child_tasks if t.status == 'in_progress'),
-            "pending": sum(1 for t in child_tasks if t.status == 'pending'),
-            "complete": sum(1 for t in child_tasks if t.status == 'complete')
+    # 2. 워크스페이스에서 사용자가 멤버인 프로젝트 (워크스페이스 순서)
+    projects = db.query(Project.project_id, Project.title).join(
+        WorkspaceProjectOrder, WorkspaceProjectOrder.project_id == Project.project_id
+    ).join(
+        ProjectMember, ProjectMember.project_id == Project.project_id
+    ).filter(
+        WorkspaceProjectOrder.workspace_id == workspace_id,
+        ProjectMember.user_id == current_user.user_id
+    ).order_by(WorkspaceProjectOrder.project_order).all()
+    project_ids = [project.project_id for project in projects]
+
+    # 3. 프로젝트 x 담당자 x 상태 집계 (project_task_stats 카운터)
+    status_counts: Dict[int, Dict[int, Dict[str, int]]] = {}
+    for project_id, assignee_id, task_status, count in get_assignee_status_counts(db, project_ids):
+        by_status = status_counts.setdefault(project_id, {}).setdefault(assignee_id, {})
+        by_status[task_status] = by_status.get(task_status, 0) + count
+
+    # 4. 프로젝트 x 담당자 연체 업무 수 (마감일이 지났고 완료되지 않은 업무)
+    overdue_counts: Dict[int, Dict[int, int]] = {}
+    if project_ids:
+        overdue_rows = db.query(
+            Task.project_id, Task.assignee_id, func.count()
+        ).filter(
+            Task.project_id.in_(project_ids),
+            Task.due_date < date.today(),
+            Task.status != "complete"
+        ).group_by(Task.project_id, Task.assignee_id).all()
+        for project_id, assignee_id, count in overdue_rows:
+            overdue_counts.setdefault(project_id, {})[assignee_id or UNASSIGNED] = count
+
+    # 5. 담당자 이름 일괄 조회
+    assignee_ids = {
+        assignee_id
+        for by_assignee in status_counts.values()
+        for assignee_id in by_assignee
+        if assignee_id != UNASSIGNED
+    }
+    member_names = dict(
+        db.query(User.user_id, User.name).filter(User.user_id.in_(assignee_ids)).all()
+    ) if assignee_ids else {}
+
+    # --- 프로젝트별 / 워크스페이스 전체 집계 ---
+    total_status: Dict[str, int] = {}
+    total_workload: Dict[int, Dict[str, int]] = {}
+    total_overdue: Dict[int, int] = {}
+    project_summaries = []
+    for project in projects:
+        by_assignee = status_counts.get(project.project_id, {})
+        overdue = overdue_counts.get(project.project_id, {})
+
+        project_status: Dict[str, int] = {}
+        for assignee_id, counts in by_assignee.items():
+            merged = total_workload.setdefault(assignee_id, {})
+            for task_status, count in counts.items():
+                project_status[task_status] = project_status.get(task_status, 0) + count
+                merged[task_status] = merged.get(task_status, 0) + count
+                total_status[task_status] = total_status.get(task_status, 0) + count
+        for assignee_id, count in overdue.items():
+            total_overdue[assignee_id] = total_overdue.get(assignee_id, 0) + count
+
+        status_overview = _status_summary(project_status)
+        status_overview["total_tasks"] = status_overview.pop("total_count")
+        project_summaries.append({
+            "project_id": project.project_id,
+            "project_title": project.title,
+            "status_overview": status_overview,
+            "overdue_count": sum(overdue.values()),
+            "team_workload": _workspace_workload(by_assignee, overdue, member_names),
         })
-    
-    # 하위 업무 개수 기준으로 정렬
-    parent_task_progress.sort(key=lambda x: x['total_count'], reverse=True)
-    parent_task_progress = parent_task_progress[:5]  # 상위 5개만
-    
-    return DashboardData(
+
+    status_overview = _status_summary(total_status)
+    status_overview["total_tasks"] = status_overview.pop("total_count")
+    return WorkspaceDashboardData(
+        workspace_id=workspace.workspace_id,
+        workspace_name=workspace.name,
         status_overview=status_overview,
-        personal_overview=personal_overview,
-        recent_activities=recent_activities,
-        tag_usage=tag_usage,
-        team_workload=team_workload,
-        parent_task_progress=parent_task_progress
-    ) 
\ No newline at end of file
+        overdue_count=sum(total_overdue.values()),
+        team_workload=_workspace_workload(total_workload, total_overdue, member_names),
+        projects=project_summaries
+    )
+
+
+@router.get("/{project_id}/flow", response_model=ProjectFlowData)
+def get_project_flow(
+    project_id: int,
+    from_date: Optional[date] = Query(None, alias="from", description="시작일 (기본값: 종료일 29일 전)"),
+    to_date: Optional[date] = Query(None, alias="to", description="종료일 (기본값: 오늘)"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(verify_token)
+):
+    """
+    번다운 / 누적 흐름도용 일별 상태별 업무 수를 반환합니다.
+    일별 스냅샷 테이블을 (project_id, day) 범위로 한 번 조회하며, 스냅샷이 없는 날은 0으로 채웁니다.
+    """
+    member = db.query(ProjectMember).filter(
+        ProjectMember.project_id == project_id,
+        ProjectMember.user_id == current_user.user_id
+    ).first()
+    if not member:
+        raise HTTPException(status_code=403, detail="프로젝트 접근 권한이 없습니다.")
+
+    to_date = to_date or date.today()
+    from_date = from_date or to_date - timedelta(days=FLOW_DEFAULT_DAYS - 1)
+    if from_date > to_date:
+        raise HTTPException(status_code=400, detail="시작일은 종료일보다 늦을 수 없습니다.")
+    if (to_date - from_date).days >= FLOW_MAX_DAYS:
+        raise HTTPException(status_code=400, detail=f"조회 기간은 최대 {FLOW_MAX_DAYS}일입니다.")
+
+    rows = db.query(
+        ProjectStatusSnapshot.day, ProjectStatusSnapshot.status, ProjectStatusSnapshot.count
+    ).filter(
+        ProjectStatusSnapshot.project_id == project_id,
+        ProjectStatusSnapshot.day.between(from_date, to_date)
+    ).all()
+
+    days = [from_date + timedelta(days=offset) for offset in range((to_date - from_date).days + 1)]
+    day_index = {day: index for index, day in enumerate(days)}
+    series = {task_status: [0] * len(days) for task_status in TASK_STATUSES}
+    totals = [0] * len(days)
+    for day, task_status, count in rows:
+        index = day_index[day]
+        if task_status in series:
+            series[task_status][index] = count
+        totals[index] += count
+
+    return ProjectFlowData(
+        project_id=project_id,
+        from_date=from_date,
+        to_date=to_date,
+        days=days,
+        series=series,
+        remaining=[total - complete for total, complete in zip(totals, series["complete"])]
+    )
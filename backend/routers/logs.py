@@ -1,6 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import desc, and_, or_, func
+from sqlalchemy import desc, and_, or_, func, tuple_
 from typing import List, Optional
 from datetime import datetime, timedelta
 
@@ -9,10 +9,34 @@ from backend.models.logs_notification import ActivityLog, LogResponse
 from backend.models.user import User
 from backend.models.project import ProjectMember
 from backend.middleware.auth import verify_token
+from backend.utils.response_encoding import negotiate_list_format, rows_to_columns, encode_columns
+from backend.utils.pagination import encode_cursor, decode_cursor
 from pydantic import BaseModel
 
 router = APIRouter(prefix="/api/v1/logs", tags=["logs"])
 
+# 컬럼 형식 응답에서 조회하는 컬럼
+LOG_COLUMNS = [getattr(ActivityLog, field) for field in LogResponse.model_fields]
+
+# 최신순 정렬 (timestamp, log_id) - ix_activity_logs_project_timestamp_log_id 인덱스 순서
+LOG_ORDERING = (desc(ActivityLog.timestamp), desc(ActivityLog.log_id))
+
+
+def encode_log_rows(db: Session, rows, response_format: str, headers: Optional[dict] = None):
+    """로그 조회 행을 컬럼 형식으로 인코딩합니다. (user_name이 없는 로그는 사용자 이름을 일괄 조회)"""
+    data = rows_to_columns((row._mapping for row in rows), list(LogResponse.model_fields))
+    missing_user_ids = {
+        user_id for user_id, user_name in zip(data["user_id"], data["user_name"])
+        if not user_name and user_id
+    }
+    if missing_user_ids:
+        names = dict(db.query(User.user_id, User.name).filter(User.user_id.in_(missing_user_ids)).all())
+        data["user_name"] = [
+            user_name or names.get(user_id)
+            for user_id, user_name in zip(data["user_id"], data["user_name"])
+        ]
+    return encode_columns(data, response_format, headers)
+
 class LogStats(BaseModel):
     period_days: int
     total_activities: int
@@ -23,18 +47,28 @@ class LogStats(BaseModel):
 @router.get("/{project_id}", response_model=List[LogResponse])
 def get_project_logs(
     project_id: int,
+    response: Response,
     limit: int = Query(50, ge=1, le=100, description="한 번에 가져올 로그 수"),
-    offset: int = Query(0, ge=0, description="건너뛸 로그 수"),
+    offset: int = Query(0, ge=0, description="건너뛸 로그 수 (cursor를 지정하면 무시)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
     entity_type: Optional[str] = Query(None, description="엔티티 타입 필터"),
     action: Optional[str] = Query(None, description="액션 필터"), 
     user_id: Optional[int] = Query(None, description="사용자 ID 필터"),
     start_date: Optional[str] = Query(None, description="시작 날짜 (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="종료 날짜 (YYYY-MM-DD)"),
     search: Optional[str] = Query(None, description="검색어"),
+    accept: Optional[str] = Header(None),
     db: Session = Depends(get_db),
     current_user: User = Depends(verify_token)
 ):
-    """프로젝트의 활동 로그를 가져옵니다."""
+    """
+    프로젝트의 활동 로그를 최신순으로 가져옵니다.
+
+    응답의 X-Next-Cursor 헤더 값을 cursor로 넘기면 (timestamp, log_id) 기준으로 다음 페이지를 조회하므로
+    offset과 달리 페이지 깊이와 관계없이 인덱스에서 바로 이어서 읽습니다.
+    """
+    response_format = negotiate_list_format(accept)
+    after = decode_cursor(cursor)
     
     # 1. 권한 확인
     member = db.query(ProjectMember).filter(
@@ -81,8 +115,26 @@ def get_project_logs(
             )
         )
 
-    # 4. 정렬 및 페이지네이션
-    logs = query.order_by(desc(ActivityLog.timestamp)).offset(offset).limit(limit).all()
+    # 4. 정렬 및 페이지네이션 (cursor 지정 시 keyset, 아니면 기존 offset)
+    query = query.order_by(*LOG_ORDERING)
+    if after:
+        query = query.filter(tuple_(ActivityLog.timestamp, ActivityLog.log_id) < tuple_(*after))
+    else:
+        query = query.offset(offset)
+    query = query.limit(limit + 1)
+
+    if response_format:
+        rows = query.with_entities(*LOG_COLUMNS).all()
+        headers = {}
+        if len(rows) > limit:
+            rows = rows[:limit]
+            headers["X-Next-Cursor"] = encode_cursor(rows[-1].timestamp, rows[-1].log_id)
+        return encode_log_rows(db, rows, response_format, headers)
+
+    logs = query.all()
+    if len(logs) > limit:
+        logs = logs[:limit]
+        response.headers["X-Next-Cursor"] = encode_cursor(logs[-1].timestamp, logs[-1].log_id)
     
     # 5. user_name이 없는 로그의 경우 user_id로 사용자 정보 조회
     for log in logs:
@@ -160,10 +212,12 @@ def get_log_stats(
 def get_recent_logs(
     project_id: int,
     limit: int = Query(10, ge=1, le=50, description="최근 로그 수"),
+    accept: Optional[str] = Header(None),
     db: Session = Depends(get_db),
     current_user: User = Depends(verify_token)
 ):
     """프로젝트의 최근 활동 로그를 가져옵니다."""
+    response_format = negotiate_list_format(accept)
     
     # 1. 권한 확인
     member = db.query(ProjectMember).filter(
@@ -174,9 +228,15 @@ def get_recent_logs(
         raise HTTPException(status_code=403, detail="프로젝트 접근 권한이 없습니다.")
 
     # 2. 최근 로그 조회
+    if response_format:
+        rows = db.query(*LOG_COLUMNS).filter(
+            ActivityLog.project_id == project_id
+        ).order_by(*LOG_ORDERING).limit(limit).all()
+        return encode_log_rows(db, rows, response_format)
+
     logs = db.query(ActivityLog).filter(
         ActivityLog.project_id == project_id
-    ).order_by(desc(ActivityLog.timestamp)).limit(limit).all()
+    ).order_by(*LOG_ORDERING).limit(limit).all()
     
     # 3. user_name이 없는 로그의 경우 user_id로 사용자 정보 조회
     for log in logs:
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime, timezone
@@ -8,9 +8,78 @@ from backend.models.logs_notification import Notification
 from backend.models.user import User
 from backend.middleware.auth import verify_token
 from backend.websocket.events import event_emitter
+from backend.utils.response_encoding import negotiate_list_format, rows_to_columns, encode_columns
 
 router = APIRouter(prefix="/api/v1/notifications", tags=["notifications"])
 
+# 컬럼 형식 응답에서 조회하는 컬럼 (Notification.to_dict와 같은 필드)
+NOTIFICATION_COLUMNS = [
+    Notification.notification_id, Notification.user_id, Notification.type, Notification.message,
+    Notification.channel, Notification.is_read, Notification.created_at, Notification.related_id
+]
+
+
+async def emit_notification_realtime(
+    user_id: int,
+    type: str,
+    message: str,
+    notification_id: int,
+    related_id: int = None,
+    title: str = None,
+    project_id: int = None
+):
+    """저장된 알림에 대한 실시간 WebSocket 이벤트를 발행합니다. (커밋 이후 호출 가능)"""
+    try:
+        # 알림 타입에 따라 적절한 WebSocket 이벤트 발행
+        if type in ["task_assigned", "task_updated", "task_completed", "task_deadline", "task_priority_changed", "task_status_changed", "task_due_date_changed", "deadline_approaching", "task_overdue", "deadline_1day", "deadline_3days", "deadline_7days"]:
+            # Task 관련 알림은 TASK_ASSIGNED 타입으로 발행
+            from backend.websocket.message_types import MessageType, create_task_message, TaskEventData
+            from backend.websocket.connection_manager import connection_manager
+
+            task_data = TaskEventData(
+                task_id=related_id,
+                project_id=project_id or 0,  # 전달받은 project_id 사용
+                title=message,
+                assignee_id=user_id,
+                due_date=None  # 필요시 추가
+            )
+
+            message_obj = create_task_message(MessageType.TASK_ASSIGNED, task_data, f"user:{user_id}", user_id)
+            await connection_manager.send_personal_message(message_obj.to_dict(), user_id)
+
+        elif type in ["comment_created", "comment_mention"]:
+            # 댓글 관련 알림은 COMMENT_MENTION 또는 COMMENT_CREATED 타입으로 발행
+            from backend.websocket.message_types import MessageType, create_comment_message, CommentEventData
+            from backend.websocket.connection_manager import connection_manager
+
+            message_type = MessageType.COMMENT_MENTION if type == "comment_mention" else MessageType.COMMENT_CREATED
+
+            comment_data = CommentEventData(
+                comment_id=0,  # 임시값, 필요시 파라미터로 받아올 수 있음
+                task_id=related_id,
+                project_id=project_id or 0,  # 전달받은 project_id 사용
+                content=message,
+                author_id=0,  # 임시값
+                author_name="",  # 임시값
+                mentions=[]
+            )
+
+            message_obj = create_comment_message(message_type, comment_data, f"user:{user_id}", user_id)
+            await connection_manager.send_personal_message(message_obj.to_dict(), user_id)
+
+        else:
+            # 기타 알림은 일반 NOTIFICATION_NEW 타입으로 발행
+            await event_emitter.emit_notification(
+                notification_id=notification_id,
+                recipient_id=user_id,
+                title=title or get_notification_title(type),
+                message=message,
+                notification_type=type,
+                related_id=related_id
+            )
+    except Exception as e:
+        print(f"WebSocket 알림 발행 실패: {e}")
+
 
 async def create_notification(
     db: Session,
@@ -41,56 +110,15 @@ async def create_notification(
     
     # 실시간 WebSocket 이벤트 발행
     if emit_realtime:
-        try:
-            # 알림 타입에 따라 적절한 WebSocket 이벤트 발행
-            if type in ["task_assigned", "task_updated", "task_completed", "task_deadline", "task_priority_changed", "task_status_changed", "task_due_date_changed", "deadline_approaching", "task_overdue", "deadline_1day", "deadline_3days", "deadline_7days"]:
-                # Task 관련 알림은 TASK_ASSIGNED 타입으로 발행
-                from backend.websocket.message_types import MessageType, create_task_message, TaskEventData
-                from backend.websocket.connection_manager import connection_manager
-                
-                task_data = TaskEventData(
-                    task_id=related_id,
-                    project_id=project_id or 0,  # 전달받은 project_id 사용
-                    title=message,
-                    assignee_id=user_id,
-                    due_date=None  # 필요시 추가
-                )
-                
-                message_obj = create_task_message(MessageType.TASK_ASSIGNED, task_data, f"user:{user_id}", user_id)
-                await connection_manager.send_personal_message(message_obj.to_dict(), user_id)
-                
-            elif type in ["comment_created", "comment_mention"]:
-                # 댓글 관련 알림은 COMMENT_MENTION 또는 COMMENT_CREATED 타입으로 발행
-                from backend.websocket.message_types import MessageType, create_comment_message, CommentEventData
-                from backend.websocket.connection_manager import connection_manager
-                
-                message_type = MessageType.COMMENT_MENTION if type == "comment_mention" else MessageType.COMMENT_CREATED
-                
-                comment_data = CommentEventData(
-                    comment_id=0,  # 임시값, 필요시 파라미터로 받아올 수 있음
-                    task_id=related_id,
-                    project_id=project_id or 0,  # 전달받은 project_id 사용
-                    content=message,
-                    author_id=0,  # 임시값
-                    author_name="",  # 임시값
-                    mentions=[]
-                )
-                
-                message_obj = create_comment_message(message_type, comment_data, f"user:{user_id}", user_id)
-                await connection_manager.send_personal_message(message_obj.to_dict(), user_id)
-                
-            else:
-                # 기타 알림은 일반 NOTIFICATION_NEW 타입으로 발행
-                await event_emitter.emit_notification(
-                    notification_id=notification.notification_id,
-                    recipient_id=user_id,
-                    title=title or get_notification_title(type),
-                    message=message,
-                    notification_type=type,
-                    related_id=related_id
-                )
-        except Exception as e:
-            print(f"WebSocket 알림 발행 실패: {e}")
+        await emit_notification_realtime(
+            user_id=user_id,
+            type=type,
+            message=message,
+            notification_id=notification.notification_id,
+            related_id=related_id,
+            title=title,
+            project_id=project_id
+        )
     
     return notification
 
@@ -130,16 +158,12 @@ def get_notification_title(notification_type: str) -> str:
     return title_map.get(notification_type, "새로운 알림")
 
 
-async def create_task_notification(
-    db: Session,
-    user_id: int,
-    task_id: int,
+def build_task_notification_message(
     task_title: str,
     notification_type: str,
-    actor_name: str = None,
-    project_id: int = None
-):
-    """Task 관련 알림 생성"""
+    actor_name: str = None
+) -> str:
+    """Task 알림 타입별 메시지 생성"""
     type_messages = {
         "task_assigned": f"새로운 작업 '{task_title}'이 할당되었습니다.",
         "task_updated": f"작업 '{task_title}'이 업데이트되었습니다.",
@@ -165,7 +189,20 @@ async def create_task_notification(
             "task_due_date_changed": f"{actor_name}님이 작업 '{task_title}'의 마감일을 변경했습니다."
         })
     
-    message = type_messages.get(notification_type, f"작업 '{task_title}'에 대한 업데이트가 있습니다.")
+    return type_messages.get(notification_type, f"작업 '{task_title}'에 대한 업데이트가 있습니다.")
+
+
+async def create_task_notification(
+    db: Session,
+    user_id: int,
+    task_id: int,
+    task_title: str,
+    notification_type: str,
+    actor_name: str = None,
+    project_id: int = None
+):
+    """Task 관련 알림 생성"""
+    message = build_task_notification_message(task_title, notification_type, actor_name)
     
     return await create_notification(
         db=db,
@@ -253,9 +290,12 @@ async def create_project_notification(
 async def get_notifications(
     page: int = 1,
     per_page: int = 10,
+    accept: Optional[str] = Header(None),
     current_user: User = Depends(verify_token),
     db: Session = Depends(get_db)
 ):
+    response_format = negotiate_list_format(accept)
+
     # 페이지네이션 파라미터 검증
     if page < 1:
         page = 1
@@ -265,16 +305,30 @@ async def get_notifications(
     # 페이지네이션 계산
     offset = (page - 1) * per_page
     
+    total = db.query(Notification)\
+        .filter(Notification.user_id == current_user.user_id)\
+        .count()
+
+    # MessagePack/컬럼 JSON 요청이면 조회 행에서 바로 인코딩 (전체 개수는 X-Total-Count 헤더)
+    if response_format:
+        rows = db.query(*NOTIFICATION_COLUMNS)\
+            .filter(Notification.user_id == current_user.user_id)\
+            .order_by(Notification.created_at.desc())\
+            .offset(offset)\
+            .limit(per_page)\
+            .all()
+        return encode_columns(
+            rows_to_columns((row._mapping for row in rows), [column.key for column in NOTIFICATION_COLUMNS]),
+            response_format,
+            headers={"X-Total-Count": str(total)}
+        )
+
     notifications = db.query(Notification)\
         .filter(Notification.user_id == current_user.user_id)\
         .order_by(Notification.created_at.desc())\
         .offset(offset)\
         .limit(per_page)\
         .all()
-    
-    total = db.query(Notification)\
-        .filter(Notification.user_id == current_user.user_id)\
-        .count()
 
     return {
         "items": [n.to_dict() for n in notifications],
@@ -12,6 +12,7 @@ from backend.models.user import User
 from backend.models.workspace import Workspace
 from backend.models.workspace_project_order import WorkspaceProjectOrder
 from backend.routers.notifications import create_notification, create_project_notification
+from backend.utils.dashboard_cache import invalidate_dashboard
 
 router = APIRouter(prefix="/api/v1/projects", tags=["project_members"])
 
@@ -315,6 +316,7 @@ async def accept_invitation(
     invitation.accepted_at = datetime.now(timezone.utc)
     
     db.commit()
+    invalidate_dashboard(invitation.project_id)
     return {"message": "프로젝트에 성공적으로 참여했습니다"}
 
 @router.get("/{project_id}/invitations")
@@ -538,6 +540,7 @@ async def remove_project_member(
             # 알림 실패는 전체 제거를 막지 않음
     
     db.commit()
+    invalidate_dashboard(project_id)
     
     return {"message": "멤버가 성공적으로 제거되었습니다"}
 
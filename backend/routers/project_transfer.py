@@ -0,0 +1,290 @@
+import json
+import traceback
+import zlib
+from datetime import date, datetime, timezone
+from typing import Dict, Iterable, Iterator, Set
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.database.base import get_db, SessionLocal
+from backend.middleware.auth import verify_token
+from backend.models.comment_file import Comment
+from backend.models.logs_notification import ActivityLog
+from backend.models.project import Project, ProjectMember
+from backend.models.tag import Tag
+from backend.models.task import Task
+from backend.models.user import User
+from backend.schemas.Task import ProjectImportResponse
+from backend.utils.activity_logger import log_activity
+from backend.utils.project_import import IMPORT_BATCH_SIZE, ProjectImporter
+from backend.utils.task_loader import load_task_relations
+
+router = APIRouter(prefix="/api/v1/projects", tags=["ProjectTransfer"])
+
+# 내보내기 시 한 번에 DB에서 읽어 오는 행 수 (서버 측 커서 배치 크기)
+EXPORT_BATCH_SIZE = 1000
+
+# 내보내기 대상 (include 파라미터)
+EXPORT_SECTIONS = ("tasks", "comments", "logs")
+
+TASK_EXPORT_COLUMNS = [
+    Task.task_id, Task.parent_task_id, Task.title, Task.description, Task.assignee_id, Task.priority,
+    Task.start_date, Task.due_date, Task.status, Task.is_parent_task, Task.updated_at
+]
+COMMENT_EXPORT_COLUMNS = [
+    Comment.comment_id, Comment.task_id, Comment.user_id, Comment.content, Comment.updated_at, Comment.is_updated
+]
+LOG_EXPORT_COLUMNS = [
+    ActivityLog.log_id, ActivityLog.user_id, ActivityLog.user_name, ActivityLog.entity_type,
+    ActivityLog.entity_id, ActivityLog.action, ActivityLog.details, ActivityLog.timestamp
+]
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"직렬화할 수 없는 타입입니다: {type(value).__name__}")
+
+
+def to_ndjson_line(record: Dict) -> bytes:
+    """레코드 하나를 NDJSON 한 줄로 직렬화합니다."""
+    return json.dumps(record, default=_json_default, ensure_ascii=False, separators=(",", ":")).encode() + b"\n"
+
+
+def gzip_stream(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """바이트 스트림을 gzip으로 압축하며 그대로 흘려보냅니다."""
+    compressor = zlib.compressobj(wbits=31)  # 31 = gzip 헤더 포함
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+class UserEmailCache:
+    """user_id -> 이메일 조회 캐시 (프로젝트 외부 사용자는 필요할 때 배치 단위로 조회)"""
+
+    def __init__(self, db: Session, project_id: int):
+        self.db = db
+        self.emails: Dict[int, str] = dict(
+            db.query(User.user_id, User.email)
+            .join(ProjectMember, ProjectMember.user_id == User.user_id)
+            .filter(ProjectMember.project_id == project_id)
+            .all()
+        )
+
+    def load(self, user_ids: Set[int]):
+        missing = {user_id for user_id in user_ids if user_id and user_id not in self.emails}
+        if missing:
+            self.emails.update(
+                self.db.query(User.user_id, User.email).filter(User.user_id.in_(missing)).all()
+            )
+
+    def get(self, user_id):
+        return self.emails.get(user_id) if user_id else None
+
+
+def _stream_rows(db: Session, statement):
+    """서버 측 커서로 EXPORT_BATCH_SIZE 행씩 읽어 배치 단위로 반환합니다."""
+    result = db.execute(statement.execution_options(yield_per=EXPORT_BATCH_SIZE))
+    try:
+        for batch in result.partitions():
+            yield batch
+    finally:
+        result.close()
+
+
+def iter_project_export(db: Session, project_id: int, sections: Set[str]) -> Iterator[bytes]:
+    """
+    프로젝트 데이터를 NDJSON 레코드로 생성합니다.
+
+    레코드는 type 필드로 구분합니다. (project, tag, task, comment, log)
+    사용자는 환경마다 ID가 다르므로 이메일로 내보냅니다.
+    """
+    project = db.query(Project.title, Project.description).filter(Project.project_id == project_id).first()
+    yield to_ndjson_line({
+        "type": "project",
+        "project_id": project_id,
+        "title": project.title,
+        "description": project.description,
+        "exported_at": datetime.now(timezone.utc),
+    })
+
+    for (tag_name,) in db.query(Tag.tag_name).filter(Tag.project_id == project_id).order_by(Tag.tag_name):
+        yield to_ndjson_line({"type": "tag", "tag_name": tag_name})
+
+    users = UserEmailCache(db, project_id)
+
+    if "tasks" in sections:
+        statement = select(*TASK_EXPORT_COLUMNS).where(Task.project_id == project_id).order_by(Task.task_id)
+        for rows in _stream_rows(db, statement):
+            member_map, tag_map, _, _ = load_task_relations(db, rows, {"member_ids", "tag_names"})
+            user_ids = {row.assignee_id for row in rows}
+            for member_ids in member_map.values():
+                user_ids.update(member_ids)
+            users.load(user_ids)
+
+            yield b"".join(
+                to_ndjson_line({
+                    "type": "task",
+                    **row._asdict(),
+                    "assignee_email": users.get(row.assignee_id),
+                    "member_emails": [users.get(user_id) for user_id in member_map[row.task_id]],
+                    "tag_names": tag_map[row.task_id],
+                })
+                for row in rows
+            )
+
+    if "comments" in sections:
+        statement = (
+            select(*COMMENT_EXPORT_COLUMNS)
+            .join(Task, Task.task_id == Comment.task_id)
+            .where(Task.project_id == project_id)
+            .order_by(Comment.comment_id)
+        )
+        for rows in _stream_rows(db, statement):
+            users.load({row.user_id for row in rows})
+            yield b"".join(
+                to_ndjson_line({"type": "comment", **row._asdict(), "user_email": users.get(row.user_id)})
+                for row in rows
+            )
+
+    if "logs" in sections:
+        statement = (
+            select(*LOG_EXPORT_COLUMNS)
+            .where(ActivityLog.project_id == project_id)
+            .order_by(ActivityLog.log_id)
+        )
+        for rows in _stream_rows(db, statement):
+            yield b"".join(to_ndjson_line({"type": "log", **row._asdict()}) for row in rows)
+
+
+def _export_stream(project_id: int, sections: Set[str], compress: bool) -> Iterator[bytes]:
+    # 요청 세션은 응답 전송 전에 닫힐 수 있으므로 스트리밍 전용 세션 사용
+    db = SessionLocal()
+    try:
+        chunks = iter_project_export(db, project_id, sections)
+        yield from gzip_stream(chunks) if compress else chunks
+    finally:
+        db.close()
+
+
+@router.get("/{project_id}/export")
+def export_project(
+    project_id: int,
+    include: str = Query(",".join(EXPORT_SECTIONS), description="내보낼 항목 (콤마 구분: tasks,comments,logs)"),
+    compress: bool = Query(False, description="gzip 압축 여부"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(verify_token)
+):
+    """
+    프로젝트의 업무, 댓글, 활동 로그를 NDJSON으로 스트리밍 내보내기합니다.
+    서버 측 커서로 배치 단위로 읽으므로 프로젝트 크기와 관계없이 메모리 사용량이 일정합니다.
+    """
+    member = db.query(ProjectMember).filter(
+        ProjectMember.project_id == project_id,
+        ProjectMember.user_id == current_user.user_id
+    ).first()
+    if not member:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="프로젝트 접근 권한이 없습니다.")
+
+    sections = {section.strip() for section in include.split(",") if section.strip()}
+    invalid = sections - set(EXPORT_SECTIONS)
+    if invalid:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"지원하지 않는 내보내기 항목입니다: {', '.join(sorted(invalid))}"
+        )
+
+    filename = f"project-{project_id}.ndjson" + (".gz" if compress else "")
+    return StreamingResponse(
+        _export_stream(project_id, sections, compress),
+        media_type="application/gzip" if compress else "application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+async def iter_request_lines(request: Request):
+    """요청 본문을 읽는 대로 (줄 번호, 줄) 단위로 반환합니다. (Content-Encoding: gzip 지원)"""
+    decompressor = None
+    if request.headers.get("content-encoding", "").lower() == "gzip":
+        decompressor = zlib.decompressobj(wbits=31)
+
+    buffer = b""
+    line_no = 0
+    async for chunk in request.stream():
+        if decompressor:
+            try:
+                chunk = decompressor.decompress(chunk)
+            except zlib.error:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="gzip 압축을 해제할 수 없습니다.")
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_no += 1
+            yield line_no, line
+    if buffer:
+        yield line_no + 1, buffer
+
+
+@router.post("/{project_id}/import", response_model=ProjectImportResponse)
+async def import_project(
+    project_id: int,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(verify_token)
+):
+    """
+    NDJSON(내보내기 형식)으로 업무, 태그, 업무 멤버, 댓글을 가져옵니다.
+
+    본문을 읽는 대로 파싱하여 1,000건씩 저장/커밋하고, 잘못된 줄은 건너뛰고 줄 번호와 함께 오류로 보고합니다.
+    본문 읽기는 이벤트 루프에서, 파싱과 DB 저장은 스레드풀에서 줄 묶음 단위로 수행합니다.
+    """
+    member = db.query(ProjectMember).filter(
+        ProjectMember.project_id == project_id,
+        ProjectMember.user_id == current_user.user_id
+    ).first()
+    if not member or member.role not in ("owner", "admin"):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="프로젝트 소유자 또는 관리자만 가져오기를 할 수 있습니다."
+        )
+
+    importer = await run_in_threadpool(ProjectImporter, db, current_user, project_id)
+    try:
+        lines = []
+        async for line_no, line in iter_request_lines(request):
+            lines.append((line_no, line))
+            if len(lines) >= IMPORT_BATCH_SIZE:
+                await run_in_threadpool(importer.feed_lines, lines)
+                lines = []
+        if lines:
+            await run_in_threadpool(importer.feed_lines, lines)
+        report = await run_in_threadpool(importer.finish)
+    except HTTPException:
+        await run_in_threadpool(db.rollback)
+        raise
+    except Exception as e:
+        print(f"❌ 프로젝트 {project_id} 가져오기 실패: {e}")
+        traceback.print_exc()
+        await run_in_threadpool(db.rollback)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"가져오기 중 오류가 발생했습니다. (저장된 업무 {importer.imported_tasks}개)"
+        )
+
+    await run_in_threadpool(
+        log_activity,
+        db=db,
+        user=current_user,
+        entity_type="project",
+        entity_id=project_id,
+        action="import",
+        project_id=project_id,
+        details=f"업무 {report['imported_tasks']}개, 댓글 {report['imported_comments']}개 가져오기"
+    )
+    return report
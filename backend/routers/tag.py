@@ -10,6 +10,10 @@ from backend.models.project import Project, ProjectMember
 from backend.models.task import Task as TaskModel
 from backend.schemas.Tag import TagCreateRequest, TagUpdateRequest, TagResponse
 from backend.utils.activity_logger import log_tag_activity
+from backend.utils.task_version import bump_project_task_version
+from backend.utils.tag_registry import invalidate_project_tags
+from backend.utils.task_stats import rebuild_project_task_stats
+from backend.utils.dashboard_cache import invalidate_dashboard
 
 router = APIRouter(prefix="/api/v1/projects/{project_id}/tags", tags=["tags"])
 
@@ -53,6 +57,7 @@ def create_project_tag(
     tag = Tag(project_id=project_id, tag_name=tag_request.tag_name)
     db.add(tag)
     db.commit()
+    invalidate_project_tags(project_id)
     db.refresh(tag)
     
     # Activity Log 작성
@@ -104,7 +109,22 @@ def update_project_tag(
     ).update({"tag_name": tag_update.tag_name}, synchronize_session=False)
 
     tag.tag_name = tag_update.tag_name
+
+    # 태그가 바뀐 업무들을 변경 동기화 대상으로 표시하고 업무 버전 증가 (이전 ETag의 If-Match 거부)
+    version = bump_project_task_version(db, project_id)
+    db.query(TaskModel).filter(
+        TaskModel.project_id == project_id,
+        TaskModel.task_id.in_(db.query(TaskTag.task_id).filter(TaskTag.tag_name == tag_update.tag_name))
+    ).update(
+        {TaskModel.sync_version: version, TaskModel.version: TaskModel.version + 1},
+        synchronize_session=False
+    )
+    # 태그별 업무 집계 카운터 재계산
+    db.flush()
+    rebuild_project_task_stats(db, [project_id])
     db.commit()
+    invalidate_project_tags(project_id)
+    invalidate_dashboard(project_id)
     db.refresh(tag)
     return tag
 
@@ -139,6 +159,16 @@ def delete_project_tag(
     except Exception as e:
         print(f"태그 삭제 로그 작성 실패: {e}")
     
+    # 태그가 제거될 업무들을 변경 동기화 대상으로 표시하고 업무 버전 증가
+    version = bump_project_task_version(db, project_id)
+    db.query(TaskModel).filter(
+        TaskModel.project_id == project_id,
+        TaskModel.task_id.in_(db.query(TaskTag.task_id).filter(TaskTag.tag_name == tag_name))
+    ).update(
+        {TaskModel.sync_version: version, TaskModel.version: TaskModel.version + 1},
+        synchronize_session=False
+    )
+
     # TaskTag 테이블에서 연관된 항목 먼저 삭제
     db.query(TaskTag).filter(
         TaskTag.tag_name == tag_name,
@@ -146,5 +176,9 @@ def delete_project_tag(
     ).delete(synchronize_session=False)
 
     db.delete(tag)
+    # 태그별 업무 집계 카운터 재계산
+    rebuild_project_task_stats(db, [project_id])
     db.commit()
+    invalidate_project_tags(project_id)
+    invalidate_dashboard(project_id)
     return None
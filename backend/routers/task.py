@@ -1,25 +1,192 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import and_, case, exists, insert, or_, select, tuple_, update
 from sqlalchemy.orm import Session
-from typing import List
-from datetime import datetime, timezone
+from sqlalchemy.orm.exc import StaleDataError
+from typing import Dict, List, Optional, Tuple, Union
+from datetime import datetime, timezone, date
 import asyncio
 from pydantic import BaseModel
 
 from backend.database.base import get_db
 from backend.middleware.auth import verify_token
 from backend.models.task import Task as TaskModel
-from backend.models.task import TaskMember
+from backend.models.task import TaskMember, TaskTombstone
 from backend.models.project import Project, ProjectMember
-from backend.models.tag import Tag, TaskTag
-from backend.schemas.Task import TaskCreateRequest, TaskUpdateRequest, TaskResponse
-from backend.models.logs_notification import ActivityLog
+from backend.models.tag import TaskTag
+from backend.schemas.Task import TaskCreateRequest, TaskBulkCreateRequest, TaskUpdateRequest, TaskBulkUpdateRequest, TaskResponse, TaskSearchResult, TaskChangesResponse, TaskTreeResponse, TimelineResponse, TaskStatusResponse
+from backend.models.logs_notification import ActivityLog, Notification
 from backend.models.user import User
-from backend.routers.notifications import create_task_notification
+from backend.routers.notifications import build_task_notification_message, emit_notification_realtime
 from backend.websocket.events import event_emitter
-from backend.utils.activity_logger import log_task_activity
+from backend.websocket.message_types import TaskEventData
+from backend.utils.activity_logger import bulk_log_task_activity, log_task_status_change
+from backend.utils.task_loader import (
+    TASK_COLUMNS, build_task_columns, build_task_responses, build_task_response, build_task_response_from_state, parse_task_fields
+)
+from backend.utils.response_encoding import negotiate_list_format, encode_columns
+from backend.utils.task_unit_of_work import TaskUnitOfWork
+from backend.utils.task_stats import apply_task_stats, load_task_tag_names
+from backend.utils.dashboard_cache import invalidate_dashboard
+from backend.utils.tag_registry import find_missing_tags, validate_task_tags
+from backend.utils.task_search import refresh_task_search, remove_task_from_search, search_tasks
+from backend.utils.pagination import encode_cursor, decode_cursor
+from backend.utils.task_hierarchy import (
+    get_ancestors, get_subtree, creates_cycle,
+    add_task_to_closure, add_tasks_to_closure, move_task_in_closure, remove_task_from_closure, count_descendants
+)
+from backend.utils.task_version import (
+    bump_project_task_version, get_project_task_version, make_task_list_etag, etag_matches,
+    make_task_etag, if_match_satisfied, parse_if_match_versions, bump_task_project_version
+)
 
 router = APIRouter(prefix="/api/v1")
 
+
+def to_aware(dt):
+    """start_date, due_date가 문자열이면 datetime으로 변환 (항상 UTC로)"""
+    if isinstance(dt, str):
+        d = datetime.fromisoformat(dt)
+    else:
+        d = dt
+    if d.tzinfo is None:
+        # 타임존 정보 없으면 UTC로 지정
+        d = d.replace(tzinfo=timezone.utc)
+    return d
+
+
+def resolve_initial_status(task_in: TaskCreateRequest) -> str:
+    """요청에 상태가 있으면 그대로 사용하고, 없으면 시작일/마감일 기준으로 초기 상태를 계산"""
+    if task_in.status:
+        return task_in.status
+
+    now = datetime.now(timezone.utc)
+    start_date = to_aware(task_in.start_date)
+    due_date = to_aware(task_in.due_date)
+    if now < start_date:
+        return "todo"
+    elif start_date <= now <= due_date:
+        return "in_progress"
+    return "complete"
+
+
+def to_task_event_data(task: TaskResponse, **extra) -> TaskEventData:
+    """TaskResponse를 WebSocket Task 이벤트 데이터로 변환"""
+    return TaskEventData(
+        task_id=task.task_id,
+        project_id=task.project_id,
+        title=task.title,
+        status=task.status,
+        assignee_id=task.assignee_id,
+        assignee_name=task.assignee_name,
+        description=task.description,
+        due_date=task.due_date.strftime('%Y-%m-%dT00:00:00') if task.due_date else None,
+        priority=task.priority,
+        tags=task.tag_names or [],
+        **extra
+    )
+
+
+def raise_task_conflict(db: Session, task_id: int):
+    """다른 요청이 먼저 업무를 수정했을 때 현재 업무와 함께 412 에러 발생"""
+    task = db.query(TaskModel).filter(TaskModel.task_id == task_id).first()
+    if not task:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="업무를 찾을 수 없습니다.")
+    raise HTTPException(
+        status_code=status.HTTP_412_PRECONDITION_FAILED,
+        detail={
+            "message": "다른 사용자가 먼저 업무를 수정했습니다. 최신 내용을 확인한 뒤 다시 시도하세요.",
+            "task": jsonable_encoder(build_task_response(db, task)),
+        },
+        headers={"ETag": make_task_etag(task.version)}
+    )
+
+
+def flush_task_update(db: Session, task: TaskModel):
+    """
+    업무 변경을 flush합니다. (UPDATE ... WHERE version = 읽은 버전)
+    읽은 뒤 다른 요청이 먼저 수정했으면 롤백하고 412 에러를 발생시킵니다.
+    """
+    try:
+        db.flush()
+    except StaleDataError:
+        db.rollback()
+        raise_task_conflict(db, task.task_id)
+
+
+def insert_task_notifications(db: Session, notifications: List[Dict]) -> List[int]:
+    """
+    업무 알림을 일괄 INSERT하고 알림 ID를 요청 순서대로 반환합니다.
+    항목의 project_id는 실시간 발행에만 사용하며 저장하지 않습니다.
+    """
+    if not notifications:
+        return []
+    return db.scalars(
+        insert(Notification).returning(Notification.notification_id, sort_by_parameter_order=True),
+        [
+            {
+                "user_id": item["user_id"],
+                "type": item["type"],
+                "message": item["message"],
+                "channel": "task",
+                "is_read": False,
+                "related_id": item["related_id"],
+            }
+            for item in notifications
+        ]
+    ).all()
+
+
+async def emit_task_notifications(notifications: List[Dict], notification_ids: List[int]):
+    """커밋된 업무 알림을 실시간으로 발행합니다. (작업 단위의 커밋 후 알림 발행과 동일)"""
+    for item, notification_id in zip(notifications, notification_ids):
+        await emit_notification_realtime(
+            user_id=item["user_id"],
+            type=item["type"],
+            message=item["message"],
+            notification_id=notification_id,
+            related_id=item["related_id"],
+            project_id=item["project_id"]
+        )
+
+
+def update_tasks_returning_previous(db: Session, versions: List[Tuple[int, int]], values: Dict) -> Dict:
+    """
+    (task_id, 읽은 버전)이 일치하는 업무만 values로 변경하고 version을 1 증가시킵니다.
+
+    Returns:
+        {task_id: 변경 전 (status, assignee_id) 행} - 버전이 바뀐 업무는 포함되지 않음
+    """
+    task_ids = [task_id for task_id, _ in versions]
+    statement = update(TaskModel).values(
+        **values, version=TaskModel.version + 1
+    ).execution_options(synchronize_session=False)
+    matches_version = tuple_(TaskModel.task_id, TaskModel.version).in_(versions)
+
+    if db.get_bind().dialect.name == "sqlite":
+        # SQLite는 RETURNING에서 변경 전 값을 읽을 수 없음. 프로젝트 버전 UPDATE로 이미 쓰기 잠금을 잡았으므로
+        # 같은 트랜잭션에서 읽은 이전 값은 UPDATE 시점까지 바뀌지 않음
+        old_rows = {
+            row.task_id: row for row in db.query(
+                TaskModel.task_id, TaskModel.status, TaskModel.assignee_id
+            ).filter(TaskModel.task_id.in_(task_ids)).all()
+        }
+        updated_ids = db.scalars(statement.where(matches_version).returning(TaskModel.task_id)).all()
+        return {task_id: old_rows[task_id] for task_id in updated_ids}
+
+    # 잠근 이전 행과 조인하여 변경 전 값을 함께 반환
+    previous = select(TaskModel.task_id, TaskModel.status, TaskModel.assignee_id).where(
+        TaskModel.task_id.in_(task_ids)
+    ).with_for_update().subquery("previous")
+    rows = db.execute(
+        statement.where(TaskModel.task_id == previous.c.task_id, matches_version).returning(
+            TaskModel.task_id, previous.c.status, previous.c.assignee_id
+        )
+    ).all()
+    return {row.task_id: row for row in rows}
+
+
 @router.post(
     "/tasks",
     response_model=TaskResponse,
@@ -65,8 +232,10 @@ async def create_task(
             detail="뷰어는 업무를 생성할 수 없습니다."
         )
 
-    # 4) 담당자가 프로젝트 멤버인지 검증
-    assignee_member = db.query(ProjectMember).filter(
+    # 4) 담당자가 프로젝트 멤버인지 검증 (응답/이벤트에 쓸 담당자 이름도 함께 조회)
+    assignee_member = db.query(User.name).join(
+        ProjectMember, ProjectMember.user_id == User.user_id
+    ).filter(
         ProjectMember.project_id == task_in.project_id,
         ProjectMember.user_id == task_in.assignee_id
     ).first()
@@ -84,6 +253,7 @@ async def create_task(
         )
 
     # 6) 상위 업무 유효성 검증
+    parent = None
     if task_in.parent_task_id is not None:
         parent = db.query(TaskModel).filter_by(
             task_id=task_in.parent_task_id
@@ -101,216 +271,507 @@ async def create_task(
                 detail="상위 업무는 같은 프로젝트 내에서만 선택할 수 있습니다."
             )
 
-    now = datetime.now(timezone.utc)
-    start_date = task_in.start_date
-    due_date = task_in.due_date
-
-    # start_date, due_date가 문자열이면 datetime으로 변환 (항상 UTC로)
-    def to_aware(dt):
-        if isinstance(dt, str):
-            d = datetime.fromisoformat(dt)
-        else:
-            d = dt
-        if d.tzinfo is None:
-            # 타임존 정보 없으면 UTC로 지정
-            d = d.replace(tzinfo=timezone.utc)
-        return d
-
-    start_date = to_aware(task_in.start_date)
-    due_date = to_aware(task_in.due_date)
-
     # 프론트엔드에서 status가 전송된 경우 해당 값 사용, 없으면 자동 계산
-    if hasattr(task_in, 'status') and task_in.status:
-        # 프론트엔드 상태값을 백엔드 형식으로 변환
-        frontend_to_backend_status = {
-            "todo": "todo",
-            "in_progress": "in_progress", 
-            "pending": "pending",
-            "complete": "complete"
-        }
-        status_value = frontend_to_backend_status.get(task_in.status, task_in.status)
-        
-        # "할 일" 상태 디버깅
-        if task_in.status == 'todo' or status_value == 'todo':
-            print(f"🔍 백엔드 - '할 일' 상태 처리: {task_in.status} -> {status_value}")
-    else:
-        # 자동 계산 로직
-        if now < start_date:
-            status_value = "todo"
-        elif start_date <= now <= due_date:
-            status_value = "in_progress"
-        else:
-            status_value = "complete"
-
-    # 7) 태그 유효성 검증
-    if task_in.tag_names:
-        for tag_name in task_in.tag_names:
-            existing_tag = db.query(Tag).filter(
-                Tag.project_id == task_in.project_id,
-                Tag.tag_name == tag_name
-            ).first()
-            if not existing_tag:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"태그 '{tag_name}'이 해당 프로젝트에 존재하지 않습니다."
-                )
+    status_value = resolve_initial_status(task_in)
+
+    # 7) 태그 유효성 검증 (프로젝트 태그 캐시와의 차집합)
+    validate_task_tags(db, task_in.project_id, task_in.tag_names)
 
-    # 8) tasks 테이블에 새 업무 저장
+    # 8) tasks 테이블에 새 업무 저장 (커밋은 작업 단위에서 한 번만 수행)
+    uow = TaskUnitOfWork(db, current_user)
     task = TaskModel(
         title           = task_in.title,
         project_id      = task_in.project_id,
         parent_task_id  = task_in.parent_task_id,
-        start_date      = task_in.start_date,
-        due_date        = task_in.due_date,
+        start_date      = task_in.start_date.date(),
+        due_date        = task_in.due_date.date(),
         priority        = task_in.priority,
         assignee_id     = task_in.assignee_id,
         status          = status_value,
         is_parent_task  = task_in.is_parent_task,
+        sync_version    = bump_project_task_version(db, task_in.project_id),
     )
-    db.add(task)
-    db.commit()
-    db.refresh(task)
+    uow.add(task)
+    db.flush()
+    add_task_to_closure(db, task.task_id, task.parent_task_id)
+    refresh_task_search(db, [task.task_id])
 
     # 9) task_members 테이블에 매핑 추가 (담당자가 필수이므로 항상 추가)
-    mapping = TaskMember(
+    uow.add(TaskMember(
         task_id     = task.task_id,
         user_id     = task_in.assignee_id,
-    )
-    db.add(mapping)
+    ))
     
     # 10) 태그 할당
-    if task_in.tag_names:
-        for tag_name in task_in.tag_names:
-            task_tag = TaskTag(
-                task_id=task.task_id,
-                tag_name=tag_name
-            )
-            db.add(task_tag)
+    tag_names = list(task_in.tag_names or [])
+    for tag_name in tag_names:
+        uow.add(TaskTag(
+            task_id=task.task_id,
+            tag_name=tag_name
+        ))
+
+    # 업무 집계 카운터 반영
+    apply_task_stats(db, added=[(task.project_id, status_value, task_in.assignee_id, tag_names)])
+    
+    # 11) ActivityLog 기록 및 담당자 할당 알림 (본인이 아닌 경우)
+    uow.log_task(task.task_id, "create", task.project_id, task_title=task.title)
+    if task_in.assignee_id != current_user.user_id:
+        uow.notify_task(task_in.assignee_id, task.task_id, task.title, "task_assigned", task.project_id)
+    
+    # 12) 응답은 메모리에 있는 값으로 생성 (재조회 없음)
+    response = build_task_response_from_state(
+        db, task,
+        assignee_name=assignee_member.name,
+        parent_task_title=parent.title if parent else None,
+        member_ids=[task_in.assignee_id],
+        tag_names=tag_names
+    )
     
-    # 11) ActivityLog에 기록 추가
-    log_task_activity(
-        db=db,
-        user=current_user,
+    # 13) Task 생성 이벤트는 커밋 성공 후 발행 (프로젝트 멤버들에게)
+    uow.after_commit(
+        event_emitter.emit_task_created,
         task_id=task.task_id,
-        action="create",
         project_id=task.project_id,
-        task_title=task.title
+        title=task.title,
+        created_by=current_user.user_id,
+        created_by_name=current_user.name,
+        assignee_id=task_in.assignee_id,
+        assignee_name=assignee_member.name,
+        description=response.description,
+        due_date=response.due_date.strftime('%Y-%m-%dT00:00:00'),
+        priority=task.priority,
+        tags=tag_names,
+        status=status_value
     )
     
-    # 12) 모든 DB 변경사항을 한 번에 커밋
-    db.commit()
+    # 14) 모든 DB 변경사항을 한 번에 커밋
+    await uow.commit()
+    invalidate_dashboard(task_in.project_id)
     
-    # 13) 실시간 WebSocket 이벤트 발행 (Task 생성 + 할당 알림 통합)
-    try:
-        print(f"🚀 Task 생성 이벤트 발행 시작 - Task ID: {task.task_id}, 담당자: {task_in.assignee_id}")
-        
-        # 담당자 정보 조회
-        assignee = db.query(User).filter(User.user_id == task_in.assignee_id).first()
-        assignee_name = assignee.name if assignee else None
-        
-        print(f"👤 담당자 정보: {assignee_name} (ID: {task_in.assignee_id})")
-        
-        # Task 생성 이벤트 발행 (프로젝트 멤버들에게)
-        print(f"📤 Task 생성 이벤트 발행 중...")
-        await event_emitter.emit_task_created(
-            task_id=task.task_id,
-            project_id=task.project_id,
-            title=task.title,
-            created_by=current_user.user_id,
-            created_by_name=current_user.name,
-            assignee_id=task_in.assignee_id,
-            assignee_name=assignee_name,
-            description=task.description,
-            due_date=task.due_date.strftime('%Y-%m-%dT00:00:00') if task.due_date else None,
-            priority=task.priority,
-            tags=task_in.tag_names or [],
-            status=status_value  # 상태 값 추가
+    return response
+
+@router.post(
+    "/tasks/bulk",
+    response_model=List[TaskResponse],
+    status_code=status.HTTP_201_CREATED
+)
+async def create_tasks_bulk(
+    bulk_in: TaskBulkCreateRequest,
+    db: Session = Depends(get_db),
+    current_user = Depends(verify_token),
+):
+    """
+    여러 업무를 한 번의 트랜잭션으로 생성합니다.
+
+    검증(프로젝트, 권한, 담당자, 상위 업무, 태그)은 항목 수와 관계없이 집합 단위 쿼리로 수행하고,
+    업무/멤버/태그/활동 로그/알림은 일괄 INSERT로 저장합니다.
+    하나라도 검증에 실패하면 아무것도 저장하지 않습니다.
+    """
+    items = bulk_in.tasks
+    project_ids = {item.project_id for item in items}
+
+    # 1) 프로젝트 유효성 검증
+    existing_project_ids = {
+        project_id for (project_id,) in db.query(Project.project_id).filter(
+            Project.project_id.in_(project_ids)
+        ).all()
+    }
+    if project_ids - existing_project_ids:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="프로젝트를 찾을 수 없습니다."
         )
-        print(f"✅ Task 생성 이벤트 발행 완료")
-        
-        # 담당자에게 할당 알림 발행 (본인이 아닌 경우)
-        if task_in.assignee_id and task_in.assignee_id != current_user.user_id:
-            print(f"🔔 Task 할당 알림 발행 중 - 수신자: {task_in.assignee_id}")
-            await create_task_notification(
-                db=db,
-                user_id=task_in.assignee_id,
-                task_id=task.task_id,
-                task_title=task.title,
-                notification_type="task_assigned",
-                actor_name=current_user.name,
-                project_id=task.project_id
-            )
-            db.commit()  # 알림 저장을 위한 추가 커밋
-            print(f"✅ Task 할당 알림 발행 완료")
+
+    # 2) 현재 사용자의 프로젝트 권한 검증 (프로젝트당 한 번)
+    my_roles = dict(
+        db.query(ProjectMember.project_id, ProjectMember.role).filter(
+            ProjectMember.project_id.in_(project_ids),
+            ProjectMember.user_id == current_user.user_id
+        ).all()
+    )
+    if project_ids - set(my_roles):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="해당 프로젝트의 멤버만 업무를 생성할 수 있습니다."
+        )
+    if any(role == "viewer" for role in my_roles.values()):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="뷰어는 업무를 생성할 수 없습니다."
+        )
+
+    # 3) 담당자/상위 업무/태그 일괄 조회
+    assignee_pairs = set(
+        db.query(ProjectMember.project_id, ProjectMember.user_id).filter(
+            ProjectMember.project_id.in_(project_ids),
+            ProjectMember.user_id.in_({item.assignee_id for item in items})
+        ).all()
+    )
+
+    parent_ids = {item.parent_task_id for item in items if item.parent_task_id is not None}
+    parent_projects = {}
+    if parent_ids:
+        parent_projects = dict(
+            db.query(TaskModel.task_id, TaskModel.project_id).filter(
+                TaskModel.task_id.in_(parent_ids)
+            ).all()
+        )
+
+    # 프로젝트별 요청 태그 중 존재하지 않는 태그 (프로젝트 태그 캐시와의 차집합)
+    requested_tags = {}
+    for item in items:
+        requested_tags.setdefault(item.project_id, set()).update(item.tag_names or [])
+    missing_tags_by_project = {
+        project_id: set(find_missing_tags(db, project_id, tag_names))
+        for project_id, tag_names in requested_tags.items()
+    }
+
+    # 4) 항목별 검증 (추가 쿼리 없음)
+    for index, item in enumerate(items, start=1):
+        error = None
+        if (item.project_id, item.assignee_id) not in assignee_pairs:
+            error = "담당자가 해당 프로젝트의 멤버가 아닙니다."
+        elif item.start_date > item.due_date:
+            error = "시작일은 마감일보다 늦을 수 없습니다."
+        elif item.parent_task_id is not None and item.parent_task_id not in parent_projects:
+            error = "상위 업무를 찾을 수 없습니다."
+        elif item.parent_task_id is not None and parent_projects[item.parent_task_id] != item.project_id:
+            error = "상위 업무는 같은 프로젝트 내에서만 선택할 수 있습니다."
         else:
-            print(f"⏭️ 본인에게 할당되어 알림 생략")
-            
+            missing_tags = [
+                tag_name for tag_name in (item.tag_names or [])
+                if tag_name in missing_tags_by_project[item.project_id]
+            ]
+            if missing_tags:
+                error = f"태그 '{missing_tags[0]}'이 해당 프로젝트에 존재하지 않습니다."
+        if error:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"{index}번째 업무: {error}"
+            )
+
+    # 5) 프로젝트별 업무 버전 증가 (프로젝트당 한 번)
+    project_versions = {
+        project_id: bump_project_task_version(db, project_id)
+        for project_id in sorted(project_ids)
+    }
+
+    # 6) tasks 일괄 저장
+    # Task는 자기 참조 관계라 ORM flush가 행 단위 INSERT로 처리하므로 테이블에 직접 executemany INSERT ... RETURNING 실행
+    # (PostgreSQL에서는 여러 행을 한 문장으로 묶어 실행하며, 생성된 ID는 요청 순서대로 반환됨)
+    task_rows = [
+        {
+            "title": item.title,
+            "project_id": item.project_id,
+            "parent_task_id": item.parent_task_id,
+            "start_date": item.start_date.date(),
+            "due_date": item.due_date.date(),
+            "priority": item.priority,
+            "assignee_id": item.assignee_id,
+            "status": resolve_initial_status(item),
+            "is_parent_task": item.is_parent_task,
+            "sync_version": project_versions[item.project_id],
+        }
+        for item in items
+    ]
+    task_ids = db.scalars(
+        insert(TaskModel.__table__).returning(TaskModel.task_id, sort_by_parameter_order=True),
+        task_rows
+    ).all()
+
+    add_tasks_to_closure(db, [
+        (task_id, row["parent_task_id"]) for task_id, row in zip(task_ids, task_rows)
+    ])
+    refresh_task_search(db, task_ids)
+
+    # 7) task_members / task_tags 일괄 저장
+    db.execute(insert(TaskMember), [
+        {"task_id": task_id, "user_id": item.assignee_id}
+        for task_id, item in zip(task_ids, items)
+    ])
+    task_tag_rows = [
+        {"task_id": task_id, "tag_name": tag_name}
+        for task_id, item in zip(task_ids, items)
+        for tag_name in dict.fromkeys(item.tag_names or [])
+    ]
+    if task_tag_rows:
+        db.execute(insert(TaskTag), task_tag_rows)
+    apply_task_stats(db, added=[
+        (item.project_id, row["status"], item.assignee_id, item.tag_names)
+        for item, row in zip(items, task_rows)
+    ])
+
+    # 8) 활동 로그 일괄 저장
+    bulk_log_task_activity(db, current_user, [
+        {
+            "task_id": task_id,
+            "action": "create",
+            "project_id": item.project_id,
+            "task_title": item.title,
+        }
+        for task_id, item in zip(task_ids, items)
+    ])
+
+    # 9) 담당자 할당 알림 일괄 저장 (본인에게 할당된 업무 제외)
+    notification_rows = [
+        {
+            "user_id": item.assignee_id,
+            "type": "task_assigned",
+            "message": build_task_notification_message(item.title, "task_assigned", current_user.name),
+            "related_id": task_id,
+            "project_id": item.project_id,
+        }
+        for task_id, item in zip(task_ids, items)
+        if item.assignee_id != current_user.user_id
+    ]
+    notification_ids = insert_task_notifications(db, notification_rows)
+
+    # 10) 모든 DB 변경사항을 한 번에 커밋
+    db.commit()
+    invalidate_dashboard(*project_ids)
+    await emit_task_notifications(notification_rows, notification_ids)
+
+    # 생성된 업무를 한 번의 쿼리로 로드 (요청 순서 유지)
+    loaded = {
+        task.task_id: task
+        for task in db.query(TaskModel).filter(TaskModel.task_id.in_(task_ids)).all()
+    }
+    tasks = [loaded[task_id] for task_id in task_ids]
+    responses = build_task_responses(db, tasks)
+
+    # 11) 프로젝트 룸마다 한 번씩 일괄 생성 이벤트 발행
+    try:
+        events_by_project = {}
+        for response in responses:
+            events_by_project.setdefault(response.project_id, []).append(to_task_event_data(
+                response,
+                created_by=current_user.user_id,
+                created_by_name=current_user.name
+            ))
+        for project_id, task_events in events_by_project.items():
+            await event_emitter.emit_tasks_created_batch(
+                project_id=project_id,
+                tasks=task_events,
+                created_by=current_user.user_id
+            )
     except Exception as e:
-        print(f"❌ Task 생성 WebSocket 이벤트 발행 실패: {e}")
-        import traceback
-        traceback.print_exc()
-    
-    # 14) 생성된 Task 객체를 TaskResponse 형태로 반환
-    # task_members 조회
-    task_members = db.query(TaskMember).filter(TaskMember.task_id == task.task_id).all()
-    member_ids = [tm.user_id for tm in task_members]
-    
-    # 태그 조회
-    task_tags = db.query(TaskTag).filter(TaskTag.task_id == task.task_id).all()
-    tag_names = [tt.tag_name for tt in task_tags]
-    
-    # 상위 업무 제목 조회
-    parent_task_title = None
-    if task.parent_task_id:
-        parent_task = db.query(TaskModel).filter(TaskModel.task_id == task.parent_task_id).first()
-        parent_task_title = parent_task.title if parent_task else None
-    
-    return TaskResponse(
-        **task.__dict__,
-        assignee_name=task.assignee.name if task.assignee else None,
-        parent_task_title=parent_task_title,
-        member_ids=member_ids,
-        tag_names=tag_names
-    )
+        print(f"❌ Task 일괄 생성 WebSocket 이벤트 발행 실패: {e}")
+
+    return responses
+
+# 하위 업무가 있는 업무 삭제 시 오류 메시지에 표시할 최대 하위 업무 수
+MAX_CHILD_TITLES_IN_ERROR = 10
+
+# 업무 목록 필터에서 허용하는 상태값
+VALID_TASK_STATUSES = ["todo", "in_progress", "pending", "complete"]
+
+# 우선순위 정렬 순서 (문자열 정렬 대신 사용)
+PRIORITY_RANK = {"low": 0, "medium": 1, "high": 2}
+priority_rank = case(PRIORITY_RANK, value=TaskModel.priority, else_=1)
+
+# 정렬 키: (정렬 컬럼, 커서 값 변환 함수, 업무 객체에서 커서 값 추출 함수)
+TASK_SORT_KEYS = {
+    "updated_at": (TaskModel.updated_at, datetime.fromisoformat, lambda t: t.updated_at),
+    "due_date": (TaskModel.due_date, date.fromisoformat, lambda t: t.due_date),
+    "start_date": (TaskModel.start_date, date.fromisoformat, lambda t: t.start_date),
+    "priority": (priority_rank, int, lambda t: PRIORITY_RANK.get(t.priority, 1)),
+    "title": (TaskModel.title, str, lambda t: t.title),
+}
+
+
+def split_query_list(value: Optional[str]) -> List[str]:
+    """콤마로 구분된 쿼리 파라미터를 리스트로 변환"""
+    if not value:
+        return []
+    return [v.strip() for v in value.split(",") if v.strip()]
+
 
 @router.get("/tasks", response_model=List[TaskResponse])
 def read_tasks(
     project_id: int,
+    request: Request,
+    response: Response,
+    status_filter: Optional[str] = Query(None, alias="status", description="상태 필터 (콤마 구분, 예: todo,in_progress)"),
+    assignee_id: Optional[int] = Query(None, description="담당자 ID 필터"),
+    priority: Optional[str] = Query(None, description="우선순위 필터 (콤마 구분, 예: high,medium)"),
+    tag: Optional[str] = Query(None, description="태그 이름 필터"),
+    due_from: Optional[date] = Query(None, description="마감일 시작 (YYYY-MM-DD, 포함)"),
+    due_to: Optional[date] = Query(None, description="마감일 종료 (YYYY-MM-DD, 포함)"),
+    sort: Optional[str] = Query(None, description="정렬 키 (updated_at, due_date, start_date, priority, title). '-' 접두사는 내림차순"),
+    limit: Optional[int] = Query(None, ge=1, le=500, description="페이지 크기 (지정 시 커서 기반 페이지네이션)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    fields: Optional[str] = Query(None, description="응답 필드 목록 (예: task_id,title,status)"),
+    if_none_match: Optional[str] = Header(None),
+    accept: Optional[str] = Header(None),
     db: Session = Depends(get_db),
     current_user = Depends(verify_token),
 ):
-    tasks = (
-        db.query(TaskModel)
-          .filter(TaskModel.project_id == project_id)
-          .all()
-    )
-    
-    result = []
-    for task in tasks:
-        # task_members 조회
-        task_members = db.query(TaskMember).filter(TaskMember.task_id == task.task_id).all()
-        member_ids = [tm.user_id for tm in task_members]
-        
-        # 태그 조회
-        task_tags = db.query(TaskTag).filter(TaskTag.task_id == task.task_id).all()
-        tag_names = [tt.tag_name for tt in task_tags]
-        
-        # 상위 업무 제목 조회
-        parent_task_title = None
-        if task.parent_task_id:
-            parent_task = db.query(TaskModel).filter(TaskModel.task_id == task.parent_task_id).first()
-            parent_task_title = parent_task.title if parent_task else None
-        
-        result.append(TaskResponse(
-            **task.__dict__,
-            assignee_name=task.assignee.name if task.assignee else None,
-            parent_task_title=parent_task_title,
-            member_ids=member_ids,
-            tag_names=tag_names
-        ))
-    
+    # 응답 형식: Accept 헤더가 MessagePack/컬럼 JSON이면 TaskResponse 없이 조회 행에서 바로 인코딩
+    response_format = negotiate_list_format(accept)
+
+    # 프로젝트 업무 버전이 바뀌지 않았으면 목록 쿼리 없이 304 반환
+    etag = make_task_list_etag(request, project_id, get_project_task_version(db, project_id), response_format)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    requested_fields = parse_task_fields(fields)
+
+    query = db.query(TaskModel).filter(TaskModel.project_id == project_id)
+    if response_format:
+        query = query.with_entities(*TASK_COLUMNS)
+
+    # 필터 적용 (tasks 복합 인덱스 / task_tags(tag_name, task_id) 인덱스 사용)
+    statuses = split_query_list(status_filter)
+    if statuses:
+        invalid = [s for s in statuses if s not in VALID_TASK_STATUSES]
+        if invalid:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"올바르지 않은 상태입니다. 다음 중 하나여야 합니다: {', '.join(VALID_TASK_STATUSES)}"
+            )
+        query = query.filter(TaskModel.status.in_(statuses))
+
+    if assignee_id is not None:
+        query = query.filter(TaskModel.assignee_id == assignee_id)
+
+    priorities = split_query_list(priority)
+    if priorities:
+        query = query.filter(TaskModel.priority.in_(priorities))
+
+    if tag:
+        query = query.filter(
+            TaskModel.task_id.in_(
+                db.query(TaskTag.task_id).filter(TaskTag.tag_name == tag)
+            )
+        )
+
+    if due_from:
+        query = query.filter(TaskModel.due_date >= due_from)
+    if due_to:
+        query = query.filter(TaskModel.due_date <= due_to)
+
+    # 정렬 키 결정 (기본값: 최근 수정순)
+    sort_key = (sort or "-updated_at").lstrip("-")
+    descending = (sort or "-updated_at").startswith("-")
+    if sort_key not in TASK_SORT_KEYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"지원하지 않는 정렬 키입니다. 다음 중 하나여야 합니다: {', '.join(TASK_SORT_KEYS)}"
+        )
+    sort_column, parse_value, cursor_value = TASK_SORT_KEYS[sort_key]
+    if descending:
+        ordering = (sort_column.desc(), TaskModel.task_id.desc())
+    else:
+        ordering = (sort_column.asc(), TaskModel.task_id.asc())
+
+    # 커서 기반 페이지네이션 (정렬 키, task_id)
+    next_cursor = None
+    if limit is not None or cursor:
+        page_size = limit or 100
+        after = decode_cursor(cursor, parse_value)
+        if after:
+            position = tuple_(sort_column, TaskModel.task_id)
+            query = query.filter(position < tuple_(*after) if descending else position > tuple_(*after))
+        tasks = query.order_by(*ordering).limit(page_size + 1).all()
+        if len(tasks) > page_size:
+            tasks = tasks[:page_size]
+            next_cursor = encode_cursor(cursor_value(tasks[-1]), tasks[-1].task_id)
+    elif sort:
+        tasks = query.order_by(*ordering).all()
+    else:
+        tasks = query.all()
+
+    headers = {"ETag": etag}
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    if response_format:
+        return encode_columns(build_task_columns(db, tasks, requested_fields), response_format, headers)
+
+    # 멤버/태그/상위 업무/담당자 정보를 일괄 조회하여 응답 생성
+    result = build_task_responses(db, tasks, requested_fields)
+
+    if requested_fields:
+        return JSONResponse(
+            content=[r.model_dump(mode="json", include=requested_fields) for r in result],
+            headers=headers
+        )
+    response.headers.update(headers)
     return result
 
+# 업무 변경분 동기화 엔드포인트 (/tasks/{task_id}보다 먼저 등록해야 함)
+@router.get("/tasks/changes", response_model=TaskChangesResponse)
+def read_task_changes(
+    project_id: int,
+    since: Optional[int] = Query(None, ge=0, description="이전 응답의 cursor 값 (없으면 전체 업무 반환)"),
+    db: Session = Depends(get_db),
+    current_user = Depends(verify_token),
+):
+    """cursor 이후 생성/수정된 업무와 삭제된 업무(tombstone)를 반환합니다."""
+    member = db.query(ProjectMember).filter(
+        ProjectMember.project_id == project_id,
+        ProjectMember.user_id == current_user.user_id
+    ).first()
+    if not member:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="프로젝트 접근 권한이 없습니다.")
+
+    # 변경분 조회 전에 현재 버전을 읽어 두어야 조회 중 커밋된 변경을 놓치지 않음
+    cursor = get_project_task_version(db, project_id)
+
+    query = db.query(TaskModel).filter(TaskModel.project_id == project_id)
+    if since is not None:
+        query = query.filter(TaskModel.sync_version > since)
+    tasks = query.order_by(TaskModel.sync_version, TaskModel.task_id).all()
+
+    # since가 없으면 전체 목록이므로 tombstone은 필요 없음
+    tombstones = []
+    if since is not None:
+        tombstones = (
+            db.query(TaskTombstone)
+              .filter(TaskTombstone.project_id == project_id, TaskTombstone.sync_version > since)
+              .order_by(TaskTombstone.sync_version)
+              .all()
+        )
+
+    return TaskChangesResponse(
+        changed=build_task_responses(db, tasks),
+        deleted=tombstones,
+        cursor=cursor
+    )
+
+
+# 업무 전문 검색 엔드포인트 (/tasks/{task_id}보다 먼저 등록해야 함)
+@router.get("/tasks/search", response_model=List[TaskSearchResult])
+def search_project_tasks(
+    project_id: int,
+    q: str = Query(..., min_length=1, max_length=200, description="검색어 (제목/설명/댓글)"),
+    limit: int = Query(20, ge=1, le=100, description="최대 결과 수"),
+    db: Session = Depends(get_db),
+    current_user = Depends(verify_token),
+):
+    """제목/설명/댓글에서 검색어의 모든 단어를 포함하는 업무를 관련도 순으로 반환합니다."""
+    member = db.query(ProjectMember).filter(
+        ProjectMember.project_id == project_id,
+        ProjectMember.user_id == current_user.user_id
+    ).first()
+    if not member:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="프로젝트 접근 권한이 없습니다.")
+
+    ranked = search_tasks(db, project_id, q, limit)
+    if not ranked:
+        return []
+
+    task_map = {
+        task.task_id: task
+        for task in db.query(TaskModel).filter(TaskModel.task_id.in_([task_id for task_id, _ in ranked])).all()
+    }
+    tasks = [task_map[task_id] for task_id, _ in ranked if task_id in task_map]
+    ranks = dict(ranked)
+    return [
+        TaskSearchResult(**response.model_dump(), rank=ranks[response.task_id])
+        for response in build_task_responses(db, tasks)
+    ]
+
+
 # 1) 단일 Task 조회 엔드포인트
 @router.get(
     "/tasks/{task_id}",
@@ -319,6 +780,7 @@ def read_tasks(
 )
 def read_task(
     task_id: int,
+    response: Response,
     db: Session = Depends(get_db),
     current_user = Depends(verify_token),
 ):
@@ -326,27 +788,269 @@ def read_task(
     if not task:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="업무를 찾을 수 없습니다.")
 
-    # task_members 조회
-    task_members = db.query(TaskMember).filter(TaskMember.task_id == task_id).all()
-    member_ids = [tm.user_id for tm in task_members]
-
-    # 태그 조회
-    task_tags = db.query(TaskTag).filter(TaskTag.task_id == task_id).all()
-    tag_names = [tt.tag_name for tt in task_tags]
-
-    # 상위 업무 제목 조회
-    parent_task_title = None
-    if task.parent_task_id:
-        parent_task = db.query(TaskModel).filter(TaskModel.task_id == task.parent_task_id).first()
-        parent_task_title = parent_task.title if parent_task else None
-
-    return TaskResponse(
-        **task.__dict__,
-        assignee_name=task.assignee.name if task.assignee else None,
-        parent_task_title=parent_task_title,
-        member_ids=member_ids,
-        tag_names=tag_names
+    response.headers["ETag"] = make_task_etag(task.version)
+    return build_task_response(db, task)
+
+
+# 업무 계층 조회 엔드포인트 (상위 업무 경로 + 전체 하위 트리)
+@router.get(
+    "/tasks/{task_id}/tree",
+    response_model=TaskTreeResponse,
+    status_code=status.HTTP_200_OK
+)
+def read_task_tree(
+    task_id: int,
+    db: Session = Depends(get_db),
+    current_user = Depends(verify_token),
+):
+    task = db.query(TaskModel).filter(TaskModel.task_id == task_id).first()
+    if not task:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="업무를 찾을 수 없습니다.")
+
+    member = db.query(ProjectMember).filter(
+        ProjectMember.project_id == task.project_id,
+        ProjectMember.user_id == current_user.user_id
+    ).first()
+    if not member:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="프로젝트 접근 권한이 없습니다.")
+
+    return TaskTreeResponse(
+        task_id=task_id,
+        ancestors=get_ancestors(db, task_id),
+        subtree=get_subtree(db, task_id)
+    )
+
+
+# 업무 일괄 수정 엔드포인트 (칸반 다중 선택 상태 변경/담당자 변경 등, /tasks/{task_id}보다 먼저 등록해야 함)
+@router.patch(
+    "/tasks/bulk",
+    response_model=List[TaskResponse],
+    status_code=status.HTTP_200_OK
+)
+async def update_tasks_bulk(
+    bulk_update: TaskBulkUpdateRequest,
+    db: Session = Depends(get_db),
+    current_user = Depends(verify_token),
+):
+    """
+    여러 업무의 상태/담당자/우선순위/마감일을 한 번에 변경합니다.
+
+    권한은 프로젝트당 한 번 확인하고, 변경은 프로젝트별 UPDATE 한 문장으로 적용합니다.
+    활동 로그와 알림은 일괄 INSERT, WebSocket 이벤트는 프로젝트 룸당 한 번 발행합니다.
+    """
+    changes = bulk_update.dict(exclude_unset=True, exclude={'task_ids'})
+    changes = {field: value for field, value in changes.items() if value is not None}
+    if not changes:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="변경할 항목이 없습니다."
+        )
+
+    if "status" in changes and changes["status"] not in VALID_TASK_STATUSES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"올바르지 않은 상태입니다. 다음 중 하나여야 합니다: {', '.join(VALID_TASK_STATUSES)}"
+        )
+    if "priority" in changes and changes["priority"] not in PRIORITY_RANK:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"올바르지 않은 우선순위입니다. 다음 중 하나여야 합니다: {', '.join(PRIORITY_RANK)}"
+        )
+    if "due_date" in changes:
+        changes["due_date"] = changes["due_date"].date()
+
+    # 1) 대상 업무 일괄 조회 (커밋까지 행 잠금, 교착 방지를 위해 task_id 순서로 잠금)
+    task_ids = list(dict.fromkeys(bulk_update.task_ids))
+    tasks = (
+        db.query(TaskModel)
+          .filter(TaskModel.task_id.in_(task_ids))
+          .order_by(TaskModel.task_id)
+          .with_for_update()
+          .all()
     )
+    if len(tasks) != len(task_ids):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="업무를 찾을 수 없습니다.")
+    project_ids = {task.project_id for task in tasks}
+
+    # 2) 권한 검증 (프로젝트당 한 번)
+    my_roles = dict(
+        db.query(ProjectMember.project_id, ProjectMember.role).filter(
+            ProjectMember.project_id.in_(project_ids),
+            ProjectMember.user_id == current_user.user_id
+        ).all()
+    )
+    if project_ids - set(my_roles):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="해당 프로젝트의 멤버만 업무를 수정할 수 있습니다."
+        )
+    if any(role == "viewer" for role in my_roles.values()):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="뷰어는 업무를 수정할 수 없습니다."
+        )
+    if any(my_roles[task.project_id] == "member" and task.assignee_id != current_user.user_id for task in tasks):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="멤버는 본인이 담당한 업무만 수정할 수 있습니다."
+        )
+
+    # 3) 새 담당자가 모든 대상 프로젝트의 멤버인지 검증
+    if "assignee_id" in changes:
+        assignee_projects = {
+            project_id for (project_id,) in db.query(ProjectMember.project_id).filter(
+                ProjectMember.project_id.in_(project_ids),
+                ProjectMember.user_id == changes["assignee_id"]
+            ).all()
+        }
+        if project_ids - assignee_projects:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="새 담당자가 해당 프로젝트의 멤버가 아닙니다."
+            )
+
+    # 4) 날짜 유효성 검증
+    if "due_date" in changes and any(task.start_date > changes["due_date"] for task in tasks):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="시작일은 마감일보다 늦을 수 없습니다."
+        )
+
+    # 5) 실제로 값이 바뀌는 업무만 프로젝트별로 모아 UPDATE 한 번씩 실행
+    changed_by_project = {}
+    for task in tasks:
+        if any(getattr(task, field) != value for field, value in changes.items()):
+            changed_by_project.setdefault(task.project_id, []).append(task)
+
+    if changed_by_project:
+        # 읽은 버전 조건부 UPDATE (조회 후 다른 요청이 먼저 수정한 업무가 있으면 전체 롤백 후 409)
+        # 집계 카운터와 활동 로그는 UPDATE가 반환한 변경 전 값 기준으로 계산
+        now = datetime.now(timezone.utc)
+        previous = {}
+        for project_id, project_tasks in changed_by_project.items():
+            sync_version = bump_project_task_version(db, project_id)
+            project_previous = update_tasks_returning_previous(
+                db,
+                [(task.task_id, task.version) for task in project_tasks],
+                {**changes, "updated_at": now, "sync_version": sync_version}
+            )
+            if len(project_previous) != len(project_tasks):
+                db.rollback()
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="다른 사용자가 먼저 일부 업무를 수정했습니다. 최신 내용을 확인한 뒤 다시 시도하세요."
+                )
+            previous.update(project_previous)
+
+        # 상태/담당자 변경을 업무 집계 카운터에 반영
+        if "status" in changes or "assignee_id" in changes:
+            changed_tasks = [task for project_tasks in changed_by_project.values() for task in project_tasks]
+            tag_map = load_task_tag_names(db, [task.task_id for task in changed_tasks])
+            apply_task_stats(
+                db,
+                added=[
+                    (
+                        task.project_id,
+                        changes.get("status", previous[task.task_id].status),
+                        changes.get("assignee_id", previous[task.task_id].assignee_id),
+                        tag_map[task.task_id]
+                    )
+                    for task in changed_tasks
+                ],
+                removed=[
+                    (
+                        task.project_id,
+                        previous[task.task_id].status,
+                        previous[task.task_id].assignee_id,
+                        tag_map[task.task_id]
+                    )
+                    for task in changed_tasks
+                ]
+            )
+
+        # 6) 활동 로그 / 알림 일괄 저장
+        assignee_name = None
+        if "assignee_id" in changes:
+            assignee = db.query(User).filter(User.user_id == changes["assignee_id"]).first()
+            assignee_name = assignee.name if assignee else None
+
+        log_entries = []
+        notification_rows = []
+        notification_types = [
+            notification_type for field, notification_type in (
+                ("priority", "task_priority_changed"),
+                ("status", "task_status_changed"),
+                ("due_date", "task_due_date_changed"),
+            ) if field in changes
+        ]
+        for project_tasks in changed_by_project.values():
+            for task in project_tasks:
+                old = previous[task.task_id]
+                log_entries.append({
+                    "task_id": task.task_id,
+                    "action": "update",
+                    "project_id": task.project_id,
+                    "task_title": task.title,
+                })
+                if "status" in changes and old.status != changes["status"]:
+                    log_entries.append({
+                        "task_id": task.task_id,
+                        "action": "status_change",
+                        "project_id": task.project_id,
+                        "old_status": old.status,
+                        "new_status": changes["status"],
+                    })
+                if "assignee_id" in changes and old.assignee_id != changes["assignee_id"]:
+                    log_entries.append({
+                        "task_id": task.task_id,
+                        "action": "assign",
+                        "project_id": task.project_id,
+                        "assignee_name": assignee_name,
+                    })
+
+                assignee_id = changes.get("assignee_id", old.assignee_id)
+                if assignee_id and assignee_id != current_user.user_id:
+                    for notification_type in notification_types:
+                        notification_rows.append({
+                            "user_id": assignee_id,
+                            "type": notification_type,
+                            "message": build_task_notification_message(task.title, notification_type, current_user.name),
+                            "related_id": task.task_id,
+                            "project_id": task.project_id,
+                        })
+
+        bulk_log_task_activity(db, current_user, log_entries)
+        notification_ids = insert_task_notifications(db, notification_rows)
+
+        db.commit()
+        invalidate_dashboard(*changed_by_project)
+        await emit_task_notifications(notification_rows, notification_ids)
+
+    # 7) 변경 결과를 한 번의 쿼리로 다시 로드 (요청 순서 유지)
+    db.expire_all()
+    loaded = {
+        task.task_id: task
+        for task in db.query(TaskModel).filter(TaskModel.task_id.in_(task_ids)).all()
+    }
+    responses = build_task_responses(db, [loaded[task_id] for task_id in task_ids])
+
+    # 8) 프로젝트 룸마다 한 번씩 일괄 업데이트 이벤트 발행
+    try:
+        changed_ids = {task.task_id for project_tasks in changed_by_project.values() for task in project_tasks}
+        events_by_project = {}
+        for response in responses:
+            if response.task_id in changed_ids:
+                events_by_project.setdefault(response.project_id, []).append(to_task_event_data(response))
+        for project_id, task_events in events_by_project.items():
+            await event_emitter.emit_tasks_updated_batch(
+                project_id=project_id,
+                tasks=task_events,
+                updated_by=current_user.user_id
+            )
+    except Exception as e:
+        print(f"❌ Task 일괄 업데이트 WebSocket 이벤트 발행 실패: {e}")
+
+    return responses
 
 
 # 2) Task 업데이트 엔드포인트 (title, assignee, members, status 등 수정 가능)
@@ -358,6 +1062,8 @@ def read_task(
 async def update_task(
     task_id: int,
     task_update: TaskUpdateRequest,
+    response: Response,
+    if_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
     current_user = Depends(verify_token),
 ):
@@ -390,6 +1096,10 @@ async def update_task(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="멤버는 본인이 담당한 업무만 수정할 수 있습니다."
         )
+
+    # 클라이언트가 읽은 버전(If-Match)이 현재 버전과 다르면 덮어쓰지 않고 412 반환
+    if not if_match_satisfied(if_match, task.version):
+        raise_task_conflict(db, task_id)
     
     # 담당자 변경 시 새 담당자가 프로젝트 멤버인지 검증
     if task_update.assignee_id is not None and task_update.assignee_id != task.assignee_id:
@@ -448,16 +1158,8 @@ async def update_task(
                 detail="상위 업무는 같은 프로젝트 내에서만 선택할 수 있습니다."
             )
         
-        # 순환 참조 방지 (현재 업무가 새로운 상위 업무의 조상인지 확인)
-        def check_circular_reference(current_task_id, target_parent_id):
-            current = db.query(TaskModel).filter(TaskModel.task_id == target_parent_id).first()
-            while current and current.parent_task_id:
-                if current.parent_task_id == current_task_id:
-                    return True
-                current = db.query(TaskModel).filter(TaskModel.task_id == current.parent_task_id).first()
-            return False
-        
-        if check_circular_reference(task.task_id, task_update.parent_task_id):
+        # 순환 참조 방지 (현재 업무가 새로운 상위 업무의 조상인지 재귀 CTE 한 번으로 확인)
+        if creates_cycle(db, task.task_id, task_update.parent_task_id):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="상위 업무 설정으로 인해 순환 참조가 발생합니다."
@@ -470,6 +1172,7 @@ async def update_task(
     status_changed = False
     due_date_changed = False
     assignee_changed = False
+    parent_changed = False
     old_priority = task.priority
     old_status = task.status
     old_due_date = task.due_date
@@ -515,10 +1218,16 @@ async def update_task(
                 due_date_changed = True
             elif field == 'assignee_id':
                 assignee_changed = True
+            elif field == 'parent_task_id':
+                parent_changed = True
             
             setattr(task, field, new_value)
             updated = True
     
+    # 업무 집계 카운터 반영용 변경 전 태그 (상태/담당자/태그가 바뀌는 경우에만 조회)
+    stats_changed = status_changed or assignee_changed or task_update.tag_names is not None
+    old_tag_names = load_task_tag_names(db, [task_id])[task_id] if stats_changed else []
+
     # 업무 멤버 업데이트 처리
     if task_update.member_ids is not None:
         # 기존 task_members 삭제
@@ -533,17 +1242,8 @@ async def update_task(
     
     # 태그 업데이트 처리
     if task_update.tag_names is not None:
-        # 태그 유효성 검증
-        for tag_name in task_update.tag_names:
-            existing_tag = db.query(Tag).filter(
-                Tag.project_id == task.project_id,
-                Tag.tag_name == tag_name
-            ).first()
-            if not existing_tag:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"태그 '{tag_name}'이 해당 프로젝트에 존재하지 않습니다."
-                )
+        # 태그 유효성 검증 (프로젝트 태그 캐시와의 차집합)
+        validate_task_tags(db, task.project_id, task_update.tag_names)
         
         # 기존 task_tags 삭제
         db.query(TaskTag).filter(TaskTag.task_id == task_id).delete()
@@ -555,141 +1255,93 @@ async def update_task(
         
         updated = True
     
-    if updated:
-        # updated_at은 onupdate로 자동 설정되지만 명시적으로 설정
-        task.updated_at = datetime.now(timezone.utc)
-        db.commit()
-        db.refresh(task)
-        
-        # WebSocket 이벤트 발행 (Task 업데이트)
-        try:
-            # 담당자 정보 조회
-            assignee = db.query(User).filter(User.user_id == task.assignee_id).first() if task.assignee_id else None
-            assignee_name = assignee.name if assignee else None
-            
-            await event_emitter.emit_task_updated(
-                task_id=task.task_id,
-                project_id=task.project_id,
-                title=task.title,
-                updated_by=current_user.user_id,
-                status=task.status,
-                assignee_id=task.assignee_id,
-                assignee_name=assignee_name,
-                description=task.description,
-                due_date=task.due_date.strftime('%Y-%m-%dT00:00:00') if task.due_date else None,
-                priority=task.priority,
-                tags=tag_names
-            )
-        except Exception as e:
-            print(f"Task 업데이트 WebSocket 이벤트 발행 실패: {e}")
-        
-        # Activity Log 작성
-        try:
-            # 전반적인 업데이트 로그
-            log_task_activity(
-                db=db,
-                user=current_user,
-                task_id=task.task_id,
-                action="update",
-                project_id=task.project_id,
-                task_title=task.title
-            )
-            
-            # 특정 변경사항에 대한 상세 로그
-            if status_changed:
-                log_task_activity(
-                    db=db,
-                    user=current_user,
-                    task_id=task.task_id,
-                    action="status_change",
-                    project_id=task.project_id,
-                    task_title=task.title,
-                    old_status=old_status,
-                    new_status=task.status
-                )
-            
-            if assignee_changed:
-                # 새 담당자 이름 조회
-                new_assignee = db.query(User).filter(User.user_id == task.assignee_id).first()
-                assignee_name = new_assignee.name if new_assignee else None
-                
-                log_task_activity(
-                    db=db,
-                    user=current_user,
-                    task_id=task.task_id,
-                    action="assign",
-                    project_id=task.project_id,
-                    task_title=task.title,
-                    assignee_name=assignee_name
-                )
-            
-        except Exception as e:
-            print(f"Task 업데이트 로그 작성 실패: {e}")
-        
-        # 특정 필드 변경에 대한 알림 생성
-        try:
-            if priority_changed and task.assignee_id and task.assignee_id != current_user.user_id:
-                await create_task_notification(
-                    db=db,
-                    user_id=task.assignee_id,
-                    task_id=task.task_id,
-                    task_title=task.title,
-                    notification_type="task_priority_changed",
-                    actor_name=current_user.name,
-                    project_id=task.project_id
-                )
-            
-            if status_changed and task.assignee_id and task.assignee_id != current_user.user_id:
-                await create_task_notification(
-                    db=db,
-                    user_id=task.assignee_id,
-                    task_id=task.task_id,
-                    task_title=task.title,
-                    notification_type="task_status_changed",
-                    actor_name=current_user.name,
-                    project_id=task.project_id
-                )
-            
-            if due_date_changed and task.assignee_id and task.assignee_id != current_user.user_id:
-                await create_task_notification(
-                    db=db,
-                    user_id=task.assignee_id,
-                    task_id=task.task_id,
-                    task_title=task.title,
-                    notification_type="task_due_date_changed",
-                    actor_name=current_user.name,
-                    project_id=task.project_id
-                )
-            
-            # 변경 사항이 있으면 추가 커밋
-            if priority_changed or status_changed or due_date_changed:
-                db.commit()
-                
-        except Exception as e:
-            print(f"Task 변경 알림 생성 실패: {e}")
-    
-    # 응답에 member_ids와 parent_task_title 포함
-    task_members = db.query(TaskMember).filter(TaskMember.task_id == task_id).all()
-    member_ids = [tm.user_id for tm in task_members]
-    
-    # 태그 조회
-    task_tags = db.query(TaskTag).filter(TaskTag.task_id == task_id).all()
-    tag_names = [tt.tag_name for tt in task_tags]
-    
-    # 상위 업무 제목 조회
-    parent_task_title = None
-    if task.parent_task_id:
-        parent_task = db.query(TaskModel).filter(TaskModel.task_id == task.parent_task_id).first()
-        parent_task_title = parent_task.title if parent_task else None
-    
-    return TaskResponse(
-        **task.__dict__,
-        assignee_name=task.assignee.name if task.assignee else None,
-        parent_task_title=parent_task_title,
-        member_ids=member_ids,
-        tag_names=tag_names
+    if not updated:
+        response.headers["ETag"] = make_task_etag(task.version)
+        return build_task_response(db, task)
+
+    uow = TaskUnitOfWork(db, current_user)
+
+    # updated_at은 onupdate로 자동 설정되지만 명시적으로 설정
+    task.updated_at = datetime.now(timezone.utc)
+    task.sync_version = bump_project_task_version(db, task.project_id)
+    # 버전 조건부 UPDATE (동시 수정 시 412)
+    flush_task_update(db, task)
+    # 상위 업무 변경 시 클로저 테이블도 같은 트랜잭션에서 갱신
+    if parent_changed:
+        move_task_in_closure(db, task.task_id, task.parent_task_id)
+    if stats_changed:
+        new_tag_names = task_update.tag_names if task_update.tag_names is not None else old_tag_names
+        apply_task_stats(
+            db,
+            added=[(task.project_id, task.status, task.assignee_id, new_tag_names)],
+            removed=[(task.project_id, old_status, old_assignee_id, old_tag_names)]
+        )
+    # 제목/설명 변경 시 검색 색인 갱신
+    if "title" in update_data or "description" in update_data:
+        refresh_task_search(db, [task.task_id])
+
+    # 담당자 정보 조회 (응답, 이벤트, 할당 로그에 사용)
+    assignee = db.query(User).filter(User.user_id == task.assignee_id).first() if task.assignee_id else None
+    assignee_name = assignee.name if assignee else None
+
+    # Activity Log: 전반적인 업데이트 로그 + 특정 변경사항에 대한 상세 로그
+    uow.log_task(task.task_id, "update", task.project_id, task_title=task.title)
+    if status_changed:
+        uow.log_task(
+            task.task_id, "status_change", task.project_id,
+            task_title=task.title, old_status=old_status, new_status=task.status
+        )
+    if assignee_changed:
+        uow.log_task(
+            task.task_id, "assign", task.project_id,
+            task_title=task.title, assignee_name=assignee_name
+        )
+
+    # 특정 필드 변경에 대한 알림
+    if task.assignee_id and task.assignee_id != current_user.user_id:
+        for changed, notification_type in (
+            (priority_changed, "task_priority_changed"),
+            (status_changed, "task_status_changed"),
+            (due_date_changed, "task_due_date_changed"),
+        ):
+            if changed:
+                uow.notify_task(task.assignee_id, task.task_id, task.title, notification_type, task.project_id)
+
+    # 응답은 커밋 전에 메모리에 있는 값으로 생성 (요청에 포함된 멤버/태그/상위 업무는 재조회하지 않음)
+    known = {"assignee_name": assignee_name}
+    if task_update.member_ids is not None:
+        known["member_ids"] = list(task_update.member_ids)
+    if task_update.tag_names is not None:
+        known["tag_names"] = list(task_update.tag_names)
+    if task.parent_task_id is None:
+        known["parent_task_title"] = None
+    elif parent_changed:
+        known["parent_task_title"] = parent_task.title
+    task_response = build_task_response_from_state(db, task, **known)
+
+    # WebSocket 이벤트 발행 (커밋 성공 후)
+    uow.after_commit(
+        event_emitter.emit_task_updated,
+        task_id=task.task_id,
+        project_id=task.project_id,
+        title=task.title,
+        updated_by=current_user.user_id,
+        status=task.status,
+        assignee_id=task.assignee_id,
+        assignee_name=assignee_name,
+        description=task.description,
+        due_date=task_response.due_date.strftime('%Y-%m-%dT00:00:00') if task_response.due_date else None,
+        priority=task.priority,
+        tags=task_response.tag_names or []
     )
 
+    await uow.commit()
+    invalidate_dashboard(task_response.project_id)
+
+    # 응답에 member_ids와 parent_task_title 포함
+    response.headers["ETag"] = make_task_etag(task_response.version)
+    return task_response
+
 
 # 3) Task 삭제 엔드포인트
 @router.delete(
@@ -732,12 +1384,19 @@ async def delete_task(
         )
     
     # 하위 업무 존재 여부 확인 - 하위 업무가 있는 상위 업무는 삭제 불가
-    child_tasks = db.query(TaskModel).filter(TaskModel.parent_task_id == task_id).all()
-    if child_tasks:
-        child_task_titles = [child.title for child in child_tasks]
+    child_count = count_descendants(db, task_id, max_depth=1)
+    if child_count:
+        # 오류 메시지용 제목은 일부만 조회
+        child_task_titles = [
+            title for (title,) in db.query(TaskModel.title)
+                                    .filter(TaskModel.parent_task_id == task_id)
+                                    .limit(MAX_CHILD_TITLES_IN_ERROR)
+        ]
+        if child_count > len(child_task_titles):
+            child_task_titles.append(f"외 {child_count - len(child_task_titles)}개")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"상위 업무는 하위 업무가 있을 때 삭제할 수 없습니다. 먼저 {len(child_tasks)}개의 하위 업무를 삭제하거나 다른 상위 업무로 이동해주세요.\n\n하위 업무: {', '.join(child_task_titles)}"
+            detail=f"상위 업무는 하위 업무가 있을 때 삭제할 수 없습니다. 먼저 {child_count}개의 하위 업무를 삭제하거나 다른 상위 업무로 이동해주세요.\n\n하위 업무: {', '.join(child_task_titles)}"
         )
     
     # Task 삭제 전에 관련 정보 저장 (WebSocket 이벤트용)
@@ -746,47 +1405,127 @@ async def delete_task(
         "project_id": task.project_id,
         "title": task.title
     }
+
+    # 업무 집계 카운터에서 제외
+    apply_task_stats(db, removed=[
+        (task.project_id, task.status, task.assignee_id, load_task_tag_names(db, [task_id])[task_id])
+    ])
     
-    # Activity Log 작성 (삭제 전에)
-    try:
-        log_task_activity(
-            db=db,
-            user=current_user,
-            task_id=task.task_id,
-            action="delete",
-            project_id=task.project_id,
-            task_title=task.title
-        )
-        db.commit()  # 로그를 먼저 커밋
-    except Exception as e:
-        print(f"Task 삭제 로그 작성 실패: {e}")
-    
-    # Task 삭제 (관련 TaskMember도 CASCADE로 삭제됨)
+    # Activity Log, Task 삭제, tombstone을 한 번에 커밋 (관련 TaskMember는 CASCADE로 삭제됨)
+    uow = TaskUnitOfWork(db, current_user)
+    uow.log_task(task_info["task_id"], "delete", task_info["project_id"], task_title=task_info["title"])
+    remove_task_from_closure(db, task_info["task_id"])
+    remove_task_from_search(db, task_info["task_id"])
     db.delete(task)
-    db.commit()
+    # DELETE ... WHERE version = 읽은 버전 (조회 후 다른 요청이 먼저 수정했으면 롤백 후 412)
+    flush_task_update(db, task)
+    uow.add(TaskTombstone(
+        task_id=task_info["task_id"],
+        project_id=task_info["project_id"],
+        sync_version=bump_project_task_version(db, task_info["project_id"])
+    ))
     
-    # WebSocket 이벤트 발행 (Task 삭제)
-    try:
-        await event_emitter.emit_task_deleted(
-            task_id=task_info["task_id"],
-            project_id=task_info["project_id"],
-            title=task_info["title"],
-            deleted_by=current_user.user_id
-        )
-    except Exception as e:
-        print(f"Task 삭제 WebSocket 이벤트 발행 실패: {e}")
+    # WebSocket 이벤트 발행 (커밋 성공 후)
+    uow.after_commit(
+        event_emitter.emit_task_deleted,
+        task_id=task_info["task_id"],
+        project_id=task_info["project_id"],
+        title=task_info["title"],
+        deleted_by=current_user.user_id
+    )
+    await uow.commit()
+    invalidate_dashboard(task_info["project_id"])
     
     return None  # 204 No Content
 
 
+# 타임라인(간트) 조회 엔드포인트: [from, to] 기간과 겹치는 업무만 반환
+@router.get("/projects/{project_id}/timeline", response_model=TimelineResponse)
+def read_project_timeline(
+    project_id: int,
+    date_from: date = Query(..., alias="from", description="조회 시작일 (YYYY-MM-DD)"),
+    date_to: date = Query(..., alias="to", description="조회 종료일 (YYYY-MM-DD)"),
+    db: Session = Depends(get_db),
+    current_user = Depends(verify_token),
+):
+    """
+    시작일~마감일 구간이 조회 기간과 겹치는 업무를 타임라인 표시에 필요한 필드만 담아 반환합니다.
+    (project_id, start_date, due_date) 인덱스를 사용하며, 상위/하위 업무 연결 정보도 함께 반환합니다.
+    """
+    if date_from > date_to:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="조회 시작일은 종료일보다 늦을 수 없습니다."
+        )
+
+    member = db.query(ProjectMember).filter(
+        ProjectMember.project_id == project_id,
+        ProjectMember.user_id == current_user.user_id
+    ).first()
+    if not member:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="프로젝트 접근 권한이 없습니다.")
+
+    # 필요한 컬럼만 조회 (ORM 객체 생성 없음)
+    rows = db.query(
+        TaskModel.task_id,
+        TaskModel.parent_task_id,
+        TaskModel.title,
+        TaskModel.status,
+        TaskModel.priority,
+        TaskModel.assignee_id,
+        TaskModel.is_parent_task,
+        TaskModel.start_date,
+        TaskModel.due_date,
+    ).filter(
+        TaskModel.project_id == project_id,
+        TaskModel.start_date <= date_to,
+        TaskModel.due_date >= date_from
+    ).order_by(TaskModel.start_date, TaskModel.task_id).all()
+
+    tasks = [dict(row._mapping, child_ids=[]) for row in rows]
+    task_map = {task["task_id"]: task for task in tasks}
+    for task in tasks:
+        parent = task_map.get(task["parent_task_id"])
+        if parent:
+            parent["child_ids"].append(task["task_id"])
+
+    # 기간 밖에 있는 상위 업무는 제목/기간만 따로 조회 (클라이언트 추가 조회 방지)
+    outside_parent_ids = {
+        task["parent_task_id"] for task in tasks
+        if task["parent_task_id"] and task["parent_task_id"] not in task_map
+    }
+    parents = []
+    if outside_parent_ids:
+        parents = [
+            dict(row._mapping) for row in db.query(
+                TaskModel.task_id, TaskModel.title, TaskModel.start_date, TaskModel.due_date
+            ).filter(TaskModel.task_id.in_(outside_parent_ids)).all()
+        ]
+
+    return TimelineResponse(
+        project_id=project_id,
+        date_from=date_from,
+        date_to=date_to,
+        tasks=tasks,
+        parents=parents
+    )
+
+
 # 상위업무만 조회하는 엔드포인트
 @router.get("/parent-tasks", response_model=List[TaskResponse])
 def read_parent_tasks(
     project_id: int,
+    request: Request,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
     current_user = Depends(verify_token),
 ):
     """프로젝트의 상위업무(is_parent_task=True)만 조회"""
+    etag = make_task_list_etag(request, project_id, get_project_task_version(db, project_id))
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
     tasks = (
         db.query(TaskModel)
           .filter(TaskModel.project_id == project_id)
@@ -794,277 +1533,160 @@ def read_parent_tasks(
           .all()
     )
     
-    result = []
-    for task in tasks:
-        # task_members 조회
-        task_members = db.query(TaskMember).filter(TaskMember.task_id == task.task_id).all()
-        member_ids = [tm.user_id for tm in task_members]
-        
-        # 태그 조회
-        task_tags = db.query(TaskTag).filter(TaskTag.task_id == task.task_id).all()
-        tag_names = [tt.tag_name for tt in task_tags]
-        
-        # 상위 업무 제목 조회
-        parent_task_title = None
-        if task.parent_task_id:
-            parent_task = db.query(TaskModel).filter(TaskModel.task_id == task.parent_task_id).first()
-            parent_task_title = parent_task.title if parent_task else None
-        
-        result.append(TaskResponse(
-            **task.__dict__,
-            assignee_name=task.assignee.name if task.assignee else None,
-            parent_task_title=parent_task_title,
-            member_ids=member_ids,
-            tag_names=tag_names
-        ))
-    
-    return result
+    response.headers["ETag"] = etag
+    return build_task_responses(db, tasks)
 
 
 # Task 상태 변경 요청 모델
 class TaskStatusUpdateRequest(BaseModel):
     status: str
 
-# 4) Task 상태 변경 전용 엔드포인트
+
+def prefers_full_representation(prefer: Optional[str]) -> bool:
+    """Prefer: return=representation 헤더가 있으면 True (전체 TaskResponse 응답 요청)"""
+    return bool(prefer) and "return=representation" in prefer.replace(" ", "").lower()
+
+
+# 4) Task 상태 변경 전용 엔드포인트 (칸반 보드 드래그)
 @router.patch(
     "/tasks/{task_id}/status",
-    response_model=TaskResponse,
+    response_model=Union[TaskResponse, TaskStatusResponse],
     status_code=status.HTTP_200_OK
 )
 async def update_task_status(
     task_id: int,
     status_payload: TaskStatusUpdateRequest,  # Pydantic 모델 사용
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    prefer: Optional[str] = Header(None),
     db: Session = Depends(get_db),
     current_user = Depends(verify_token),
 ):
-    # 🔍 COMPREHENSIVE DEBUG LOGGING - START
-    print(f"\n{'='*80}")
-    print(f"🔍 TASK STATUS UPDATE DEBUG LOG")
-    print(f"{'='*80}")
-    
-    # 1. 요청 정보 로깅
-    print(f"📥 REQUEST INFO:")
-    print(f"   Task ID: {task_id} (type: {type(task_id)})")
-    print(f"   Raw payload: {status_payload}")
-    print(f"   Payload dict: {status_payload.dict()}")
-    print(f"   Status value: '{status_payload.status}' (type: {type(status_payload.status)})")
-    print(f"   Status length: {len(status_payload.status) if status_payload.status else 'None'}")
-    
-    # 2. 사용자 정보 로깅
-    print(f"👤 USER INFO:")
-    print(f"   User ID: {current_user.user_id}")
-    print(f"   User name: {current_user.name}")
-    print(f"   User email: {getattr(current_user, 'email', 'N/A')}")
-    
-    # 3. Task 조회 및 검증
-    print(f"🔍 TASK LOOKUP:")
-    try:
-        task = db.query(TaskModel).filter(TaskModel.task_id == task_id).first()
-        if not task:
-            print(f"❌ Task not found with ID: {task_id}")
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="업무를 찾을 수 없습니다.")
-        else:
-            print(f"✅ Task found:")
-            print(f"   Task ID: {task.task_id}")
-            print(f"   Title: {task.title}")
-            print(f"   Current status: '{task.status}'")
-            print(f"   Project ID: {task.project_id}")
-            print(f"   Assignee ID: {task.assignee_id}")
-    except Exception as e:
-        print(f"💥 ERROR during task lookup: {e}")
-        print(f"   Exception type: {type(e)}")
-        raise
-
-    # 4. 권한 검증 로깅
-    print(f"🔐 PERMISSION CHECK:")
-    try:
-        project_member = db.query(ProjectMember).filter(
-            ProjectMember.project_id == task.project_id,
-            ProjectMember.user_id == current_user.user_id
-        ).first()
-        
-        if not project_member:
-            print(f"❌ User is not a project member")
-            print(f"   Project ID: {task.project_id}")
-            print(f"   User ID: {current_user.user_id}")
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="해당 프로젝트의 멤버만 업무 상태를 변경할 수 있습니다."
-            )
-        else:
-            print(f"✅ User is project member:")
-            print(f"   Role: {project_member.role}")
-            print(f"   Project ID: {project_member.project_id}")
-            print(f"   User ID: {project_member.user_id}")
-    except HTTPException as he:
-        print(f"🚫 Permission denied: {he.detail}")
-        raise
-    except Exception as e:
-        print(f"💥 ERROR during permission check: {e}")
-        print(f"   Exception type: {type(e)}")
-        raise
-    
-    # 5. 뷰어 권한 체크
-    if project_member.role == 'viewer':
-        print(f"❌ User is viewer - cannot modify tasks")
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="뷰어는 업무 상태를 변경할 수 없습니다."
-        )
-    
-    # 6. 멤버 권한 체크 (본인 담당 업무만)
-    if project_member.role == 'member' and task.assignee_id != current_user.user_id:
-        print(f"❌ Member can only modify own tasks")
-        print(f"   Task assignee: {task.assignee_id}")
-        print(f"   Current user: {current_user.user_id}")
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="멤버는 본인이 담당한 업무의 상태만 변경할 수 있습니다."
-        )
-    
-    print(f"✅ Permission check passed")
+    """
+    업무 상태를 변경합니다.
 
-    # 7. 상태 값 검증
-    print(f"✅ STATUS VALIDATION:")
+    권한 검증과 버전 검증(If-Match)을 조건에 포함한 UPDATE ... RETURNING 한 문장으로 변경하고
+    활동 로그를 같은 트랜잭션에서 기록합니다. 변경되지 않은 경우에만 업무를 조회해 원인(404/403/412)을 확인합니다.
+    기본 응답은 task_id, status, updated_at, version이며 Prefer: return=representation이면 전체 업무를 반환합니다.
+    """
     new_status = status_payload.status
-    print(f"   New status: '{new_status}'")
-    print(f"   Status type: {type(new_status)}")
-    print(f"   Status repr: {repr(new_status)}")
-    
     if not new_status:
-        print(f"❌ Empty status value")
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="상태 값이 필요합니다.")
-    
-    # 유효한 상태 값 검증 (프론트엔드 형식)
-    valid_frontend_statuses = ["todo", "in_progress", "pending", "complete"]
-    print(f"   Valid statuses: {valid_frontend_statuses}")
-    
-    if new_status not in valid_frontend_statuses:
-        print(f"❌ Invalid status value: '{new_status}'")
-        print(f"   Status in valid list: {new_status in valid_frontend_statuses}")
-        print(f"   Checking each valid status:")
-        for vs in valid_frontend_statuses:
-            print(f"     '{vs}' == '{new_status}': {vs == new_status}")
-            print(f"     '{vs}' repr: {repr(vs)}")
-            print(f"     '{new_status}' repr: {repr(new_status)}")
-        
-        error_msg = f"올바르지 않은 상태입니다. 다음 중 하나여야 합니다: {', '.join(valid_frontend_statuses)}"
-        print(f"   Error message: {error_msg}")
+    if new_status not in VALID_TASK_STATUSES:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, 
-            detail=error_msg
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"올바르지 않은 상태입니다. 다음 중 하나여야 합니다: {', '.join(VALID_TASK_STATUSES)}"
         )
-    
-    # 8. 상태값 그대로 사용 (변환하지 않음)
-    print(f"   Status validation passed - using status as-is: '{new_status}'")
-    
-    print(f"   Final status: '{new_status}'")
-    
-    # 9. 상태 업데이트
-    print(f"🔄 STATUS UPDATE:")
-    print(f"   Current status: '{task.status}'")
-    print(f"   New status: '{new_status}'")
-    print(f"   Status changed: {task.status != new_status}")
-    
-    if task.status != new_status:
-        old_status = task.status
-        print(f"   Updating status from '{old_status}' to '{new_status}'")
-        
-        try:
-            task.status = new_status
-            db.commit()
-            db.refresh(task)
-            print(f"✅ Status updated successfully")
-            print(f"   Task status after update: '{task.status}'")
-        except Exception as e:
-            print(f"💥 ERROR during database update: {e}")
-            print(f"   Exception type: {type(e)}")
-            db.rollback()
-            raise
-        
-        # WebSocket 이벤트 발행 (Task 상태 변경)
-        try:
-            print(f"📡 Emitting WebSocket event...")
-            await event_emitter.emit_task_status_changed(
-                task_id=task.task_id,
-                project_id=task.project_id,
-                title=task.title,
-                old_status=old_status,
-                new_status=new_status,
-                updated_by=current_user.user_id,
-                assignee_id=task.assignee_id
+
+    def build_response(task_id: int, task_status: str, updated_at: datetime, version: int):
+        response.headers["ETag"] = make_task_etag(version)
+        if prefers_full_representation(prefer):
+            task = db.query(TaskModel).filter(TaskModel.task_id == task_id).first()
+            return build_task_response(db, task)
+        return TaskStatusResponse(task_id=task_id, status=task_status, updated_at=updated_at, version=version)
+
+    # 권한: 뷰어 불가, 멤버는 본인 담당 업무만, 소유자/관리자는 모든 업무
+    permitted = exists().where(
+        ProjectMember.project_id == TaskModel.project_id,
+        ProjectMember.user_id == current_user.user_id,
+        ProjectMember.role != "viewer",
+        or_(ProjectMember.role != "member", TaskModel.assignee_id == current_user.user_id)
+    )
+    conditions = [TaskModel.status != new_status, permitted]
+    expected_versions = parse_if_match_versions(if_match)
+    if expected_versions is not None:
+        conditions.append(TaskModel.version.in_(expected_versions))
+
+    row = None
+    bumped = bump_task_project_version(db, task_id)
+    if bumped:
+        project_id, sync_version = bumped
+        statement = update(TaskModel).values(
+            status=new_status,
+            updated_at=datetime.now(timezone.utc),
+            sync_version=sync_version,
+            version=TaskModel.version + 1
+        ).execution_options(synchronize_session=False)
+        returning = [
+            TaskModel.task_id, TaskModel.project_id, TaskModel.title, TaskModel.assignee_id,
+            TaskModel.status, TaskModel.updated_at, TaskModel.version
+        ]
+
+        if db.get_bind().dialect.name == "sqlite":
+            # SQLite는 RETURNING에서 변경 전 값을 읽을 수 없음. 프로젝트 버전 UPDATE로 이미 쓰기 잠금을 잡았으므로
+            # 같은 트랜잭션에서 읽은 이전 상태는 UPDATE 시점까지 바뀌지 않음
+            old_status = db.query(TaskModel.status).filter(TaskModel.task_id == task_id).scalar()
+            row = db.execute(
+                statement.where(TaskModel.task_id == task_id, *conditions).returning(*returning)
+            ).first()
+        else:
+            # 잠근 이전 행과 조인하여 변경 전 상태를 함께 반환
+            previous = select(TaskModel.task_id, TaskModel.status).where(
+                TaskModel.task_id == task_id
+            ).with_for_update().subquery("previous")
+            row = db.execute(
+                statement.where(TaskModel.task_id == previous.c.task_id, *conditions).returning(
+                    *returning, previous.c.status.label("old_status")
+                )
+            ).first()
+            old_status = row.old_status if row else None
+
+    if row is None:
+        db.rollback()
+
+        # 변경되지 않은 원인 확인
+        found = db.query(TaskModel, ProjectMember.role).outerjoin(
+            ProjectMember,
+            and_(
+                ProjectMember.project_id == TaskModel.project_id,
+                ProjectMember.user_id == current_user.user_id
             )
-            print(f"✅ WebSocket event emitted successfully")
-        except Exception as e:
-            print(f"⚠️ WebSocket event emission failed: {e}")
-            print(f"   Exception type: {type(e)}")
-            # Don't raise - WebSocket failure shouldn't break the API
-        
-        # Activity Log 작성
-        try:
-            print(f"📝 Writing activity log...")
-            log_task_activity(
-                db=db,
-                user=current_user,
-                task_id=task.task_id,
-                action="status_change",
-                project_id=task.project_id,
-                task_title=task.title,
-                old_status=old_status,
-                new_status=new_status
+        ).filter(TaskModel.task_id == task_id).first()
+        if not found:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="업무를 찾을 수 없습니다.")
+        task, role = found
+        if role is None:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="해당 프로젝트의 멤버만 업무 상태를 변경할 수 있습니다."
             )
-            db.commit()
-            print(f"✅ Activity log written successfully")
-        except Exception as e:
-            print(f"⚠️ Activity log writing failed: {e}")
-            print(f"   Exception type: {type(e)}")
-            # Don't raise - Log failure shouldn't break the API
-    else:
-        print(f"⏭️ Status unchanged - skipping update")
-    
-    # 10. 응답 준비
-    print(f"📤 PREPARING RESPONSE:")
+        if role == "viewer":
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="뷰어는 업무 상태를 변경할 수 없습니다."
+            )
+        if role == "member" and task.assignee_id != current_user.user_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="멤버는 본인이 담당한 업무의 상태만 변경할 수 있습니다."
+            )
+        if if_match_satisfied(if_match, task.version) and task.status == new_status:
+            # 이미 요청한 상태이면 변경 없이 현재 값 반환
+            return build_response(task.task_id, task.status, task.updated_at, task.version)
+        # If-Match 버전 불일치 또는 동시 변경
+        raise_task_conflict(db, task_id)
+
+    log_task_status_change(db, current_user, row.task_id, row.project_id, old_status, new_status)
+    tag_names = load_task_tag_names(db, [row.task_id])[row.task_id]
+    apply_task_stats(
+        db,
+        added=[(row.project_id, new_status, row.assignee_id, tag_names)],
+        removed=[(row.project_id, old_status, row.assignee_id, tag_names)]
+    )
+    db.commit()
+    invalidate_dashboard(row.project_id)
+
     try:
-        # TaskResponse 형태로 반환
-        task_members = db.query(TaskMember).filter(TaskMember.task_id == task_id).all()
-        member_ids = [tm.user_id for tm in task_members]
-        print(f"   Task members: {member_ids}")
-        
-        # 태그 조회
-        task_tags = db.query(TaskTag).filter(TaskTag.task_id == task_id).all()
-        tag_names = [tt.tag_name for tt in task_tags]
-        print(f"   Task tags: {tag_names}")
-        
-        # 상위 업무 제목 조회
-        parent_task_title = None
-        if task.parent_task_id:
-            parent_task = db.query(TaskModel).filter(TaskModel.task_id == task.parent_task_id).first()
-            parent_task_title = parent_task.title if parent_task else None
-        print(f"   Parent task title: {parent_task_title}")
-        
-        response = TaskResponse(
-            **task.__dict__,
-            assignee_name=task.assignee.name if task.assignee else None,
-            parent_task_title=parent_task_title,
-            member_ids=member_ids,
-            tag_names=tag_names
+        await event_emitter.emit_task_status_changed(
+            task_id=row.task_id,
+            project_id=row.project_id,
+            title=row.title,
+            old_status=old_status,
+            new_status=new_status,
+            updated_by=current_user.user_id,
+            assignee_id=row.assignee_id
         )
-        print(f"✅ Response prepared successfully")
-        print(f"   Response status: '{response.status}'")
-        print(f"{'='*80}")
-        print(f"🎉 TASK STATUS UPDATE COMPLETED SUCCESSFULLY")
-        print(f"{'='*80}\n")
-        
-        return response
-        
     except Exception as e:
-        print(f"💥 ERROR during response preparation: {e}")
-        print(f"   Exception type: {type(e)}")
-        print(f"   Task dict: {task.__dict__}")
-        import traceback
-        traceback.print_exc()
-        print(f"{'='*80}")
-        print(f"💥 TASK STATUS UPDATE FAILED")
-        print(f"{'='*80}\n")
-        raise
+        print(f"❌ Task 상태 변경 WebSocket 이벤트 발행 실패: {e}")
 
+    return build_response(row.task_id, row.status, row.updated_at, row.version)
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Body
 from sqlalchemy.orm import Session
-from sqlalchemy import case
+from sqlalchemy import case, or_
 from pydantic import BaseModel
 from typing import Optional
 from backend.models.user import User
@@ -14,6 +14,9 @@ from backend.models.workspace import Workspace
 from backend.models.task import Task, TaskMember
 from backend.database.base import get_db
 from backend.middleware.auth import verify_token
+from backend.utils.task_stats import rebuild_project_task_stats
+from backend.utils.task_version import bump_project_task_version
+from backend.utils.dashboard_cache import invalidate_dashboard
 import bcrypt
 
 router = APIRouter(prefix="/api/v1/user", tags=["UserDelete"])
@@ -106,10 +109,34 @@ def delete_account(
             )
     # 소셜 계정의 경우 (provider != "local") 비밀번호 확인 건너뛰기
 
+    # 사용자가 담당자 또는 업무 멤버인 업무 (프로젝트별 업무 목록 버전 갱신 대상)
+    affected_tasks = {}
+    for task_id, project_id in db.query(Task.task_id, Task.project_id).filter(
+        or_(
+            Task.assignee_id == user_id,
+            Task.task_id.in_(db.query(TaskMember.task_id).filter(TaskMember.user_id == user_id))
+        )
+    ):
+        affected_tasks.setdefault(project_id, []).append(task_id)
+    assigned_project_ids = [
+        project_id for (project_id,) in db.query(Task.project_id).filter(Task.assignee_id == user_id).distinct()
+    ]
+
     # 1. 태스크 멤버 삭제
     db.query(TaskMember).filter(TaskMember.user_id == user_id).delete()
-    # 2. 사용자가 담당자인 태스크의 assignee_id를 NULL로 설정
-    db.query(Task).filter(Task.assignee_id == user_id).update({"assignee_id": None})
+    # 2. 사용자가 담당자인 태스크의 assignee_id를 NULL로 설정하고 업무 버전 증가
+    #    (프로젝트별 업무 목록 ETag 갱신, 변경 동기화 대상으로 표시)
+    for project_id, task_ids in affected_tasks.items():
+        db.query(Task).filter(Task.task_id.in_(task_ids)).update(
+            {
+                Task.assignee_id: case((Task.assignee_id == user_id, None), else_=Task.assignee_id),
+                Task.sync_version: bump_project_task_version(db, project_id),
+                Task.version: Task.version + 1,
+            },
+            synchronize_session=False
+        )
+    # 해당 프로젝트의 업무 집계 카운터 재계산
+    rebuild_project_task_stats(db, assigned_project_ids)
     # 3. 댓글의 user_id를 NULL로 설정 (댓글 내용은 유지)
     db.query(Comment).filter(Comment.user_id == user_id).update({"user_id": None})
     # 4. 알림 삭제
@@ -118,7 +145,10 @@ def delete_account(
     # 5. 사용자의 활동 로그 삭제
     db.query(ActivityLog).filter(ActivityLog.user_id == user_id).delete()
     
-    # 6. 사용자 본인의 프로젝트 멤버 관계 삭제
+    # 6. 사용자 본인의 프로젝트 멤버 관계 삭제 (해당 프로젝트의 대시보드 캐시는 커밋 후 무효화)
+    member_project_ids = [
+        project_id for (project_id,) in db.query(ProjectMember.project_id).filter(ProjectMember.user_id == user_id)
+    ]
     db.query(ProjectMember).filter(ProjectMember.user_id == user_id).delete()
     
     # 7. 사용자가 초대한 초대 내역 삭제
@@ -130,4 +160,5 @@ def delete_account(
     # 15. 사용자 계정 삭제
     db.delete(current_user)
     db.commit()
+    invalidate_dashboard(*assigned_project_ids, *member_project_ids)
     return 
\ No newline at end of file
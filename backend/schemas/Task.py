@@ -1,6 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List
-from datetime import datetime
+from datetime import datetime, date
 
 class TaskCreateRequest(BaseModel):
     title: str
@@ -17,6 +17,9 @@ class TaskCreateRequest(BaseModel):
     class Config:
         from_attributes = True
 
+class TaskBulkCreateRequest(BaseModel):
+    tasks: List[TaskCreateRequest] = Field(..., min_length=1, max_length=1000)  # 한 번에 생성할 업무 목록
+
 class TaskUpdateRequest(BaseModel):
     title: Optional[str] = None
     assignee_id: Optional[int] = None
@@ -34,6 +37,13 @@ class TaskUpdateRequest(BaseModel):
     class Config:
         from_attributes = True
 
+class TaskBulkUpdateRequest(BaseModel):
+    task_ids: List[int] = Field(..., min_length=1, max_length=1000)  # 변경할 업무 ID 목록
+    status: Optional[str] = None  # 일괄 변경할 상태
+    assignee_id: Optional[int] = None  # 일괄 변경할 담당자
+    priority: Optional[str] = None  # 일괄 변경할 우선순위
+    due_date: Optional[datetime] = None  # 일괄 변경할 마감일
+
 class TaskResponse(BaseModel):
     task_id: int
     project_id: int
@@ -46,6 +56,7 @@ class TaskResponse(BaseModel):
     status: str
     is_parent_task: Optional[bool] = False  # 상위업무 여부
     updated_at: Optional[datetime] = None  # 생성/수정일
+    version: int = 1  # 업무 버전 (수정 시 If-Match 헤더로 전달)
     description: Optional[str] = None  # 업무 설명
     assignee_name: Optional[str] = None  # 담당자 이름
     parent_task_title: Optional[str] = None  # 상위 업무 제목
@@ -54,3 +65,99 @@ class TaskResponse(BaseModel):
     
     class Config:
         from_attributes = True
+
+class TaskStatusResponse(BaseModel):
+    # 상태 변경 기본 응답 (전체 업무는 Prefer: return=representation 요청 시)
+    task_id: int
+    status: str
+    updated_at: datetime
+    version: int
+
+class TaskSearchResult(TaskResponse):
+    rank: float  # 검색 관련도 점수 (높을수록 관련도 높음)
+
+class TaskTombstoneResponse(BaseModel):
+    task_id: int
+    deleted_at: datetime  # 삭제 시각
+
+    class Config:
+        from_attributes = True
+
+class TaskChangesResponse(BaseModel):
+    changed: List[TaskResponse]  # cursor 이후 생성/수정된 업무
+    deleted: List[TaskTombstoneResponse]  # cursor 이후 삭제된 업무
+    cursor: int  # 다음 요청의 since 값
+
+class TaskTreeItem(BaseModel):
+    task_id: int
+    parent_task_id: Optional[int]
+    title: str
+    status: str
+    assignee_id: Optional[int] = None
+    depth: int  # 기준 업무로부터의 거리 (상위: 1=부모, 하위: 0=자신, 1=자식)
+
+class TaskTreeResponse(BaseModel):
+    task_id: int
+    ancestors: List[TaskTreeItem]  # 가까운 상위 업무부터
+    subtree: List[TaskTreeItem]  # 자신과 모든 하위 업무 (depth 순)
+
+class TimelineTask(BaseModel):
+    task_id: int
+    parent_task_id: Optional[int] = None
+    title: str
+    status: str
+    priority: str
+    assignee_id: Optional[int] = None
+    is_parent_task: bool = False
+    start_date: date
+    due_date: date
+    child_ids: List[int] = []  # 기간 내 하위 업무 ID
+
+class TimelineParent(BaseModel):
+    task_id: int
+    title: str
+    start_date: date
+    due_date: date
+
+class TimelineResponse(BaseModel):
+    project_id: int
+    date_from: date
+    date_to: date
+    tasks: List[TimelineTask]  # 기간과 겹치는 업무 (시작일 순)
+    parents: List[TimelineParent] = []  # 기간 밖에 있지만 기간 내 업무의 상위 업무인 업무
+
+class TaskImportRecord(BaseModel):
+    # 가져오기 NDJSON의 업무 레코드 (type="task"). ID는 원본 환경 기준이며 사용자는 이메일로 지정
+    task_id: Optional[int] = None  # 원본 업무 ID (parent_task_id, 댓글의 task_id가 참조)
+    parent_task_id: Optional[int] = None  # 원본 상위 업무 ID
+    title: str = Field(..., min_length=1)
+    description: Optional[str] = None
+    assignee_email: Optional[str] = None  # 없으면 가져오기를 실행한 사용자가 담당자
+    priority: str = "medium"
+    start_date: Optional[date] = None
+    due_date: Optional[date] = None
+    status: str = "todo"
+    is_parent_task: bool = False
+    member_emails: List[str] = []
+    tag_names: List[str] = []
+
+class CommentImportRecord(BaseModel):
+    # 가져오기 NDJSON의 댓글 레코드 (type="comment")
+    task_id: int  # 원본 업무 ID
+    content: str = Field(..., min_length=1)
+    user_email: Optional[str] = None
+    updated_at: Optional[datetime] = None
+    is_updated: int = 0
+
+class ImportRowError(BaseModel):
+    line: int  # NDJSON 줄 번호 (1부터)
+    error: str
+
+class ProjectImportResponse(BaseModel):
+    project_id: int
+    imported_tasks: int
+    imported_comments: int
+    created_tags: List[str]
+    skipped: int  # 가져오지 않는 레코드 수 (project, log 등)
+    error_count: int
+    errors: List[ImportRowError]  # 최대 MAX_IMPORT_ERRORS개
@@ -1,6 +1,8 @@
+import re
 from datetime import datetime, timezone
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import insert, select
 from backend.models.logs_notification import ActivityLog
 from backend.models.user import User
 from backend.models.project import Project
@@ -56,6 +58,111 @@ def log_activity(
         db.rollback()
 
 
+def build_task_activity_details(
+    action: str,
+    task_title: Optional[str] = None,
+    old_status: Optional[str] = None,
+    new_status: Optional[str] = None,
+    assignee_name: Optional[str] = None
+) -> Optional[str]:
+    """Task 활동 로그의 상세 내용 문자열을 생성합니다."""
+    if action == "create" and task_title:
+        return f"업무 '{task_title}' 생성"
+    elif action == "update" and task_title:
+        return f"업무 '{task_title}' 수정"
+    elif action == "delete" and task_title:
+        return f"업무 '{task_title}' 삭제"
+    elif action == "status_change" and old_status and new_status:
+        return f"상태 변경: {old_status} → {new_status}"
+    elif action == "assign" and assignee_name:
+        return f"{assignee_name}에게 할당"
+    return None
+
+
+def parse_status_change_details(details: Optional[str]) -> Optional[Tuple[str, str]]:
+    """상태 변경 로그의 상세 내용에서 (이전 상태, 새 상태)를 추출합니다. (build_task_activity_details의 역)"""
+    match = re.fullmatch(r"상태 변경: (\S+) → (\S+)", details or "")
+    return (match.group(1), match.group(2)) if match else None
+
+
+def bulk_log_task_activity(
+    db: Session,
+    user: User,
+    entries: List[Dict]
+):
+    """
+    여러 Task 활동 로그를 한 번의 INSERT로 기록합니다.
+
+    log_activity와 달리 커밋하지 않으므로 호출한 쪽의 트랜잭션에 포함됩니다.
+
+    Args:
+        db: 데이터베이스 세션
+        user: 작업을 수행한 사용자
+        entries: task_id, action, project_id 및 log_task_activity의 선택 인자를 담은 dict 목록
+    """
+    if not entries:
+        return
+
+    # 프로젝트 이름 일괄 조회
+    project_ids = {entry["project_id"] for entry in entries if entry.get("project_id")}
+    project_names = {}
+    if project_ids:
+        project_names = dict(
+            db.query(Project.project_id, Project.title).filter(
+                Project.project_id.in_(project_ids)
+            ).all()
+        )
+
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "user_id": user.user_id,
+            "user_name": user.name,
+            "entity_type": "task",
+            "entity_id": entry["task_id"],
+            "action": entry["action"],
+            "project_id": entry.get("project_id"),
+            "project_name": project_names.get(entry.get("project_id")),
+            "details": build_task_activity_details(
+                entry["action"],
+                entry.get("task_title"),
+                entry.get("old_status"),
+                entry.get("new_status"),
+                entry.get("assignee_name")
+            ),
+            "timestamp": now,
+        }
+        for entry in entries
+    ]
+    db.execute(insert(ActivityLog), rows)
+
+
+def log_task_status_change(
+    db: Session,
+    user: User,
+    task_id: int,
+    project_id: int,
+    old_status: str,
+    new_status: str
+):
+    """
+    Task 상태 변경 로그를 INSERT 한 문장으로 기록합니다. (프로젝트 이름은 서브쿼리로 채움)
+
+    커밋하지 않으므로 호출한 쪽의 트랜잭션에 포함됩니다.
+    """
+    db.execute(insert(ActivityLog).values(
+        user_id=user.user_id,
+        user_name=user.name,
+        entity_type="task",
+        entity_id=task_id,
+        action="status_change",
+        project_id=project_id,
+        project_name=select(Project.title).where(Project.project_id == project_id).scalar_subquery(),
+        details=build_task_activity_details("status_change", old_status=old_status, new_status=new_status),
+        timestamp=datetime.now(timezone.utc)
+    ))
+
+
 def log_task_activity(
     db: Session,
     user: User,
@@ -68,18 +175,7 @@ def log_task_activity(
     assignee_name: Optional[str] = None
 ):
     """Task 관련 활동 로그를 기록합니다."""
-    details = None
-    
-    if action == "create" and task_title:
-        details = f"업무 '{task_title}' 생성"
-    elif action == "update" and task_title:
-        details = f"업무 '{task_title}' 수정"
-    elif action == "delete" and task_title:
-        details = f"업무 '{task_title}' 삭제"
-    elif action == "status_change" and old_status and new_status:
-        details = f"상태 변경: {old_status} → {new_status}"
-    elif action == "assign" and assignee_name:
-        details = f"{assignee_name}에게 할당"
+    details = build_task_activity_details(action, task_title, old_status, new_status, assignee_name)
     
     log_activity(
         db=db,
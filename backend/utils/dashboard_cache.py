@@ -0,0 +1,197 @@
+import json
+import os
+from abc import ABC, abstractmethod
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import redis
+except ImportError:  # redis 미설치 환경에서는 프로세스 내 LRU 캐시만 사용
+    redis = None
+
+
+# 캐시 유지 시간(초). 무효화 대상이 아닌 변경(알림, 사용자 이름 등)도 이 시간 안에 반영됨
+DASHBOARD_CACHE_TTL_SECONDS = int(os.getenv("DASHBOARD_CACHE_TTL_SECONDS", 30))
+
+# 프로세스 내 LRU 캐시의 최대 항목 수 (프로젝트 x 대시보드 항목)
+DASHBOARD_CACHE_MAX_ENTRIES = int(os.getenv("DASHBOARD_CACHE_MAX_ENTRIES", 1024))
+
+# 워커 간 공유 저장소 주소 (예: redis://localhost:6379/0). 설정하지 않으면 프로세스 내 LRU 사용
+DASHBOARD_CACHE_URL = os.getenv("DASHBOARD_CACHE_URL")
+
+
+class DashboardCacheBackend(ABC):
+    """
+    대시보드 캐시 저장소 인터페이스.
+
+    캐시 키에 프로젝트 세대(generation)를 포함하고, 무효화는 세대를 증가시키는 방식입니다.
+    계산 도중 무효화되면 결과가 이전 세대 키에 저장되므로 다시 읽히지 않습니다.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 값 조회 (없거나 만료되었으면 None)"""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: int):
+        """캐시 값 저장 (ttl초 후 만료)"""
+
+    @abstractmethod
+    def get_generation(self, project_id: int) -> int:
+        """프로젝트 캐시 세대 조회 (기록이 없으면 0)"""
+
+    @abstractmethod
+    def bump_generation(self, project_id: int):
+        """프로젝트 캐시 세대 증가 (이전 세대 키는 더 이상 읽히지 않음)"""
+
+
+class LRUDashboardCache(DashboardCacheBackend):
+    """프로세스 내 LRU 캐시 (기본값, 단일 워커용)"""
+
+    def __init__(self, max_entries: int = DASHBOARD_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        # key -> (값, 만료 시각)
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        # project_id -> 세대 (LRU에서 제거되지 않도록 별도 보관)
+        self._generations: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: str, value: Any, ttl: int):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_generation(self, project_id: int) -> int:
+        with self._lock:
+            return self._generations.get(project_id, 0)
+
+    def bump_generation(self, project_id: int):
+        with self._lock:
+            self._generations[project_id] = self._generations.get(project_id, 0) + 1
+
+
+class RedisDashboardCache(DashboardCacheBackend):
+    """Redis 공유 저장소 (여러 워커 프로세스가 같은 캐시와 무효화를 공유)"""
+
+    def __init__(self, url: str):
+        self.client = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self.client.get(key)
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value: Any, ttl: int):
+        self.client.set(key, json.dumps(value, ensure_ascii=False, separators=(",", ":")), ex=ttl)
+
+    def get_generation(self, project_id: int) -> int:
+        return int(self.client.get(f"dashboard:gen:{project_id}") or 0)
+
+    def bump_generation(self, project_id: int):
+        self.client.incr(f"dashboard:gen:{project_id}")
+
+
+class _Call:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """같은 키에 대한 동시 계산을 하나로 합칩니다. (먼저 온 요청이 계산하고 나머지는 결과를 기다림)"""
+
+    def __init__(self):
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+        return call.result
+
+
+def _create_backend() -> DashboardCacheBackend:
+    if DASHBOARD_CACHE_URL:
+        if redis is not None:
+            return RedisDashboardCache(DASHBOARD_CACHE_URL)
+        print("redis 패키지가 설치되지 않아 대시보드 캐시를 프로세스 내 LRU로 사용합니다.")
+    return LRUDashboardCache()
+
+
+_backend: DashboardCacheBackend = _create_backend()
+_single_flight = SingleFlight()
+
+
+def set_dashboard_cache_backend(backend: DashboardCacheBackend):
+    """대시보드 캐시 저장소를 교체합니다."""
+    global _backend
+    _backend = backend
+
+
+def get_cached_dashboard(project_id: int, section: str, compute: Callable[[], Any]) -> Any:
+    """
+    프로젝트 대시보드 항목(사용자 공통 항목)을 캐시에서 반환합니다.
+    캐시 미스 시 같은 프로젝트/항목의 동시 요청은 한 번만 계산합니다.
+    저장소 오류가 나면 캐시 없이 계산합니다.
+    """
+    try:
+        key = f"dashboard:{project_id}:{_backend.get_generation(project_id)}:{section}"
+        cached = _backend.get(key)
+    except Exception as e:
+        print(f"대시보드 캐시 조회 실패: {e}")
+        return compute()
+    if cached is not None:
+        return cached
+
+    def compute_and_store():
+        value = compute()
+        try:
+            _backend.set(key, value, DASHBOARD_CACHE_TTL_SECONDS)
+        except Exception as e:
+            print(f"대시보드 캐시 저장 실패: {e}")
+        return value
+
+    return _single_flight.do(key, compute_and_store)
+
+
+def invalidate_dashboard(*project_ids: int):
+    """프로젝트 대시보드 캐시를 무효화합니다. (업무/태그/멤버 변경 커밋 후 호출)"""
+    for project_id in dict.fromkeys(project_ids):
+        try:
+            _backend.bump_generation(project_id)
+        except Exception as e:
+            print(f"대시보드 캐시 무효화 실패: {e}")
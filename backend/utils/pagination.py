@@ -0,0 +1,36 @@
+import base64
+from datetime import datetime
+from typing import Any, Callable, Optional, Tuple
+from fastapi import HTTPException, status
+
+
+def encode_cursor(value: Any, row_id: int) -> str:
+    """(정렬 키 값, id) 쌍을 URL에 안전한 커서 문자열로 인코딩합니다."""
+    text_value = value.isoformat() if hasattr(value, "isoformat") else str(value)
+    raw = f"{text_value}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(
+    cursor: Optional[str],
+    parse: Callable[[str], Any] = datetime.fromisoformat
+) -> Optional[Tuple[Any, int]]:
+    """
+    커서 문자열을 (정렬 키 값, id) 쌍으로 디코딩합니다. 잘못된 커서는 400 에러.
+
+    Args:
+        cursor: encode_cursor로 만든 커서 문자열
+        parse: 정렬 키 값 변환 함수 (기본값: datetime)
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        value, row_id = raw.rsplit("|", 1)
+        return parse(value), int(row_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="잘못된 커서 값입니다."
+        )
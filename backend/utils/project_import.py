@@ -0,0 +1,361 @@
+import json
+from datetime import date, datetime, timezone
+from typing import Dict, List, Set, Tuple
+from pydantic import ValidationError
+from sqlalchemy import bindparam, insert, update
+from sqlalchemy.orm import Session
+
+from backend.models.comment_file import Comment
+from backend.models.project import ProjectMember
+from backend.models.tag import Tag, TaskTag
+from backend.models.task import Task, TaskMember
+from backend.models.user import User
+from backend.schemas.Task import CommentImportRecord, TaskImportRecord
+from backend.utils.tag_registry import get_project_tag_names, invalidate_project_tags
+from backend.utils.task_hierarchy import add_tasks_to_closure, creates_cycle, move_task_in_closure
+from backend.utils.task_search import refresh_task_search
+from backend.utils.task_stats import apply_task_stats
+from backend.utils.dashboard_cache import invalidate_dashboard
+from backend.utils.task_version import bump_project_task_version
+
+
+# 한 번에 INSERT/커밋하는 레코드 수
+IMPORT_BATCH_SIZE = 1000
+
+# 응답에 포함하는 최대 오류 수 (전체 개수는 error_count)
+MAX_IMPORT_ERRORS = 1000
+
+IMPORT_TASK_STATUSES = {"todo", "in_progress", "pending", "complete"}
+IMPORT_TASK_PRIORITIES = {"low", "medium", "high"}
+
+# 가져오지 않고 건너뛰는 레코드 타입 (내보내기 파일 호환)
+SKIPPED_RECORD_TYPES = {"project", "log"}
+
+
+def _first_error(e: ValidationError) -> str:
+    error = e.errors()[0]
+    location = ".".join(str(part) for part in error["loc"])
+    return f"{location}: {error['msg']}" if location else error["msg"]
+
+
+class ProjectImporter:
+    """
+    NDJSON 레코드를 받아 프로젝트에 배치 단위로 저장하는 가져오기 작업.
+
+    원본 업무 ID는 remap 테이블(원본 ID -> 새 ID)로 변환하며, 상위 업무가 아직 나오지 않은 업무는
+    최상위 업무로 저장한 뒤 마지막에 상위 업무를 연결합니다.
+    IMPORT_BATCH_SIZE개마다 한 번 커밋하므로 중간에 실패해도 이전 배치는 유지됩니다.
+
+    사용 예:
+        importer = ProjectImporter(db, current_user, project_id)
+        for line_no, line in enumerate(lines, start=1):
+            importer.feed_line(line_no, line)
+        report = importer.finish()
+    """
+
+    def __init__(self, db: Session, user: User, project_id: int):
+        self.db = db
+        self.user = user
+        self.project_id = project_id
+
+        # 프로젝트 멤버 이메일 -> user_id (담당자/업무 멤버는 프로젝트 멤버만 허용)
+        self.member_ids: Dict[str, int] = dict(
+            db.query(User.email, User.user_id)
+            .join(ProjectMember, ProjectMember.user_id == User.user_id)
+            .filter(ProjectMember.project_id == project_id)
+            .all()
+        )
+        self.known_tags: Set[str] = set(get_project_tag_names(db, project_id))
+
+        self.remap: Dict[int, int] = {}  # 원본 업무 ID -> 새 업무 ID
+        self._source_task_ids: Set[int] = set()
+        self._tasks: List[Tuple[int, TaskImportRecord]] = []
+        self._comments: List[Tuple[int, CommentImportRecord]] = []
+        self._new_tags: List[str] = []
+        # 상위 업무가 나중에 나오는 업무 (새 업무 ID, 원본 상위 업무 ID, 줄 번호)
+        self._deferred_parents: List[Tuple[int, int, int]] = []
+        # 업무가 아직 나오지 않은 댓글
+        self._pending_comments: List[Tuple[int, CommentImportRecord]] = []
+
+        self.imported_tasks = 0
+        self.imported_comments = 0
+        self.created_tags: List[str] = []
+        self.skipped = 0
+        self.error_count = 0
+        self.errors: List[Dict] = []
+
+    def error(self, line_no: int, message: str):
+        self.error_count += 1
+        if len(self.errors) < MAX_IMPORT_ERRORS:
+            self.errors.append({"line": line_no, "error": message})
+
+    # --- 레코드 파싱/검증 ---
+
+    def feed_line(self, line_no: int, line: bytes):
+        """NDJSON 한 줄을 처리합니다. (빈 줄은 무시)"""
+        if not line.strip():
+            return
+        try:
+            record = json.loads(line)
+        except ValueError:
+            self.error(line_no, "JSON 형식이 올바르지 않습니다.")
+            return
+        if not isinstance(record, dict):
+            self.error(line_no, "레코드는 JSON 객체여야 합니다.")
+            return
+
+        record_type = record.get("type")
+        if record_type == "task":
+            self._feed_task(line_no, record)
+        elif record_type == "comment":
+            self._feed_comment(line_no, record)
+        elif record_type == "tag":
+            tag_name = record.get("tag_name")
+            if not isinstance(tag_name, str) or not tag_name:
+                self.error(line_no, "tag_name이 필요합니다.")
+            else:
+                self._register_tag(tag_name)
+        elif record_type in SKIPPED_RECORD_TYPES:
+            self.skipped += 1
+        else:
+            self.error(line_no, f"지원하지 않는 레코드 타입입니다: {record_type}")
+
+        if len(self._tasks) >= IMPORT_BATCH_SIZE or len(self._comments) >= IMPORT_BATCH_SIZE:
+            self.flush()
+
+    def feed_lines(self, lines: List[Tuple[int, bytes]]):
+        """(줄 번호, 줄) 목록을 차례로 처리합니다. (스레드풀에서 여러 줄을 한 번에 처리할 때 사용)"""
+        for line_no, line in lines:
+            self.feed_line(line_no, line)
+
+    def _feed_task(self, line_no: int, record: Dict):
+        try:
+            item = TaskImportRecord.model_validate(record)
+        except ValidationError as e:
+            self.error(line_no, _first_error(e))
+            return
+
+        if item.status not in IMPORT_TASK_STATUSES:
+            self.error(line_no, f"유효하지 않은 상태입니다: {item.status}")
+            return
+        if item.priority not in IMPORT_TASK_PRIORITIES:
+            self.error(line_no, f"유효하지 않은 우선순위입니다: {item.priority}")
+            return
+        if item.start_date and item.due_date and item.start_date > item.due_date:
+            self.error(line_no, "시작일은 마감일보다 늦을 수 없습니다.")
+            return
+        if item.task_id is not None and item.task_id in self._source_task_ids:
+            self.error(line_no, f"업무 ID {item.task_id}가 중복되었습니다.")
+            return
+        unknown_emails = [
+            email for email in [item.assignee_email, *item.member_emails]
+            if email and email not in self.member_ids
+        ]
+        if unknown_emails:
+            self.error(line_no, f"'{unknown_emails[0]}' 사용자가 해당 프로젝트의 멤버가 아닙니다.")
+            return
+
+        if item.task_id is not None:
+            self._source_task_ids.add(item.task_id)
+        for tag_name in item.tag_names:
+            self._register_tag(tag_name)
+        self._tasks.append((line_no, item))
+
+    def _feed_comment(self, line_no: int, record: Dict):
+        try:
+            item = CommentImportRecord.model_validate(record)
+        except ValidationError as e:
+            self.error(line_no, _first_error(e))
+            return
+        self._comments.append((line_no, item))
+
+    def _register_tag(self, tag_name: str):
+        if tag_name not in self.known_tags:
+            self.known_tags.add(tag_name)
+            self._new_tags.append(tag_name)
+
+    # --- 배치 저장 ---
+
+    def flush(self):
+        """버퍼에 모인 태그/업무/댓글을 저장하고 커밋합니다."""
+        if not (self._tasks or self._comments or self._new_tags):
+            return
+
+        changed_task_ids: Set[int] = set()
+        try:
+            if self._new_tags:
+                self.db.execute(insert(Tag), [
+                    {"project_id": self.project_id, "tag_name": tag_name} for tag_name in self._new_tags
+                ])
+            if self._tasks:
+                changed_task_ids.update(self._insert_tasks(self._tasks))
+            if self._comments:
+                changed_task_ids.update(self._insert_comments(self._comments))
+            refresh_task_search(self.db, changed_task_ids)
+            self.db.commit()
+            invalidate_dashboard(self.project_id)
+        except Exception:
+            self.db.rollback()
+            raise
+
+        if self._new_tags:
+            invalidate_project_tags(self.project_id)
+            self.created_tags.extend(self._new_tags)
+        self._new_tags = []
+        self._tasks = []
+        self._comments = []
+
+    def _insert_tasks(self, batch: List[Tuple[int, TaskImportRecord]]) -> List[int]:
+        version = bump_project_task_version(self.db, self.project_id)
+        today = date.today()
+        inserted: List[Tuple[int, TaskImportRecord]] = []
+
+        # 상위 업무가 이미 저장된 업무부터 여러 차례로 나누어 저장 (같은 배치 안의 상위-하위 관계 처리)
+        remaining = batch
+        while remaining:
+            wave = [
+                (line_no, item) for line_no, item in remaining
+                if item.parent_task_id is None or item.parent_task_id in self.remap
+            ]
+            if not wave:
+                # 상위 업무가 아직 나오지 않은 업무는 최상위로 저장하고 마지막에 연결
+                wave = remaining
+            wave_ids = {id(item) for _, item in wave}
+            remaining = [(line_no, item) for line_no, item in remaining if id(item) not in wave_ids]
+
+            rows = [self._task_row(item, version, today) for _, item in wave]
+            task_ids = self.db.scalars(
+                insert(Task.__table__).returning(Task.task_id, sort_by_parameter_order=True),
+                rows
+            ).all()
+            add_tasks_to_closure(self.db, [
+                (task_id, row["parent_task_id"]) for task_id, row in zip(task_ids, rows)
+            ])
+
+            for task_id, row, (line_no, item) in zip(task_ids, rows, wave):
+                if item.task_id is not None:
+                    self.remap[item.task_id] = task_id
+                if item.parent_task_id is not None and row["parent_task_id"] is None:
+                    self._deferred_parents.append((task_id, item.parent_task_id, line_no))
+                inserted.append((task_id, item))
+
+        member_rows = []
+        tag_rows = []
+        for task_id, item in inserted:
+            user_ids = [self._assignee_id(item), *(self.member_ids[email] for email in item.member_emails if email)]
+            for user_id in dict.fromkeys(user_ids):
+                member_rows.append({"task_id": task_id, "user_id": user_id})
+            for tag_name in dict.fromkeys(item.tag_names):
+                tag_rows.append({"task_id": task_id, "tag_name": tag_name})
+        if member_rows:
+            self.db.execute(insert(TaskMember), member_rows)
+        if tag_rows:
+            self.db.execute(insert(TaskTag), tag_rows)
+        apply_task_stats(self.db, added=[
+            (
+                self.project_id,
+                item.status,
+                self._assignee_id(item),
+                item.tag_names
+            )
+            for _, item in inserted
+        ])
+
+        self.imported_tasks += len(inserted)
+        return [task_id for task_id, _ in inserted]
+
+    def _assignee_id(self, item: TaskImportRecord) -> int:
+        """담당자 user_id (assignee_email이 없으면 가져오기를 실행한 사용자)"""
+        if item.assignee_email:
+            return self.member_ids[item.assignee_email]
+        return self.user.user_id
+
+    def _task_row(self, item: TaskImportRecord, version: int, today: date) -> Dict:
+        start_date = item.start_date or item.due_date or today
+        return {
+            "project_id": self.project_id,
+            "parent_task_id": self.remap.get(item.parent_task_id) if item.parent_task_id is not None else None,
+            "title": item.title,
+            "description": item.description,
+            "assignee_id": self._assignee_id(item),
+            "priority": item.priority,
+            "start_date": start_date,
+            "due_date": item.due_date or start_date,
+            "status": item.status,
+            "is_parent_task": item.is_parent_task,
+            "sync_version": version,
+        }
+
+    def _insert_comments(self, batch: List[Tuple[int, CommentImportRecord]]) -> Set[int]:
+        rows = []
+        for line_no, item in batch:
+            task_id = self.remap.get(item.task_id)
+            if task_id is None:
+                self._pending_comments.append((line_no, item))
+                continue
+            rows.append({
+                "task_id": task_id,
+                # 프로젝트 멤버가 아닌 작성자의 댓글은 작성자 없이 저장
+                "user_id": self.member_ids.get(item.user_email) if item.user_email else None,
+                "content": item.content,
+                "updated_at": item.updated_at or datetime.now(timezone.utc),
+                "is_updated": item.is_updated,
+            })
+
+        if rows:
+            self.db.execute(insert(Comment.__table__), rows)
+            self.imported_comments += len(rows)
+        return {row["task_id"] for row in rows}
+
+    # --- 마무리 ---
+
+    def finish(self) -> Dict:
+        """남은 배치를 저장하고, 뒤늦게 나온 상위 업무 연결과 업무가 없는 댓글을 처리한 뒤 결과를 반환합니다."""
+        self.flush()
+
+        links = []
+        for task_id, source_parent_id, line_no in self._deferred_parents:
+            parent_id = self.remap.get(source_parent_id)
+            if parent_id is None:
+                self.error(line_no, f"상위 업무(원본 ID {source_parent_id})를 찾을 수 없어 최상위 업무로 가져왔습니다.")
+            elif creates_cycle(self.db, task_id, parent_id):
+                self.error(line_no, "상위 업무 지정이 순환 참조를 만들어 최상위 업무로 가져왔습니다.")
+            else:
+                move_task_in_closure(self.db, task_id, parent_id)
+                links.append({"b_task_id": task_id, "b_parent_id": parent_id})
+
+        if links:
+            version = bump_project_task_version(self.db, self.project_id)
+            self.db.execute(
+                update(Task.__table__)
+                .where(Task.__table__.c.task_id == bindparam("b_task_id"))
+                .values(
+                    parent_task_id=bindparam("b_parent_id"),
+                    sync_version=version,
+                    version=Task.__table__.c.version + 1
+                ),
+                links
+            )
+            self.db.commit()
+            invalidate_dashboard(self.project_id)
+        self._deferred_parents = []
+
+        pending = self._pending_comments
+        self._pending_comments = []
+        if pending:
+            self._comments = [(line_no, item) for line_no, item in pending if item.task_id in self.remap]
+            for line_no, item in pending:
+                if item.task_id not in self.remap:
+                    self.error(line_no, f"댓글의 업무(원본 ID {item.task_id})를 찾을 수 없습니다.")
+            self.flush()
+
+        self.errors.sort(key=lambda error: error["line"])
+        return {
+            "project_id": self.project_id,
+            "imported_tasks": self.imported_tasks,
+            "imported_comments": self.imported_comments,
+            "created_tags": self.created_tags,
+            "skipped": self.skipped,
+            "error_count": self.error_count,
+            "errors": self.errors,
+        }
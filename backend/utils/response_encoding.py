@@ -0,0 +1,95 @@
+import json
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+from fastapi import HTTPException, Response, status
+
+try:
+    import msgpack
+except ImportError:  # msgpack 미설치 환경에서는 MessagePack 응답만 비활성화
+    msgpack = None
+
+
+# 목록 응답 형식 (Accept 헤더로 선택, 지정하지 않으면 기존 JSON 객체 배열)
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+COLUMNAR_JSON_MEDIA_TYPE = "application/vnd.columnar+json"
+
+FORMAT_MSGPACK = "msgpack"
+FORMAT_COLUMNAR = "columnar"
+
+
+def negotiate_list_format(accept: Optional[str]) -> Optional[str]:
+    """
+    Accept 헤더로 목록 응답 형식을 결정합니다.
+
+    Returns:
+        FORMAT_MSGPACK, FORMAT_COLUMNAR 또는 None (기존 JSON 응답)
+    """
+    if not accept:
+        return None
+
+    # (q값, 순서, 미디어 타입) - q값이 높고 먼저 나온 타입 우선
+    media_ranges = []
+    for index, part in enumerate(accept.split(",")):
+        media_type, *params = [p.strip() for p in part.split(";")]
+        q = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    q = float(param[2:])
+                except ValueError:
+                    q = 0.0
+        if q > 0:
+            media_ranges.append((-q, index, media_type.lower()))
+
+    for _, _, media_type in sorted(media_ranges):
+        if media_type in MSGPACK_MEDIA_TYPES:
+            if msgpack is not None:
+                return FORMAT_MSGPACK
+            continue
+        if media_type == COLUMNAR_JSON_MEDIA_TYPE:
+            return FORMAT_COLUMNAR
+        if media_type in ("application/json", "application/*", "*/*"):
+            return None
+
+    if any(media_type in MSGPACK_MEDIA_TYPES for _, _, media_type in media_ranges):
+        raise HTTPException(
+            status_code=status.HTTP_406_NOT_ACCEPTABLE,
+            detail="이 서버는 MessagePack 응답을 지원하지 않습니다."
+        )
+    return None
+
+
+def rows_to_columns(rows: Iterable[Mapping[str, Any]], columns: Sequence[str]) -> Dict[str, List[Any]]:
+    """행 목록을 컬럼별 값 목록으로 변환합니다. ({"task_id": [...], "status": [...]})"""
+    result: Dict[str, List[Any]] = {column: [] for column in columns}
+    for row in rows:
+        for column in columns:
+            result[column].append(row[column])
+    return result
+
+
+def _encode_default(value: Any):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"직렬화할 수 없는 타입입니다: {type(value).__name__}")
+
+
+def encode_columns(
+    data: Dict[str, List[Any]],
+    fmt: str,
+    headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """
+    컬럼 형식 데이터를 Pydantic 검증 없이 바로 인코딩한 응답을 반환합니다.
+    (MessagePack 응답도 같은 컬럼 구조를 사용)
+    """
+    if fmt == FORMAT_MSGPACK:
+        content = msgpack.packb(data, default=_encode_default, use_bin_type=True)
+        media_type = MSGPACK_MEDIA_TYPES[0]
+    else:
+        content = json.dumps(data, default=_encode_default, ensure_ascii=False, separators=(",", ":")).encode()
+        media_type = COLUMNAR_JSON_MEDIA_TYPE
+
+    response_headers = {"Vary": "Accept"}
+    response_headers.update(headers or {})
+    return Response(content=content, media_type=media_type, headers=response_headers)
@@ -0,0 +1,177 @@
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from itertools import groupby
+from typing import Dict, List, Optional
+
+from sqlalchemy import delete, func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from backend.database.base import SessionLocal
+from backend.models.logs_notification import ActivityLog
+from backend.models.project import ProjectStatusSnapshot, ProjectTaskStat
+from backend.models.task import Task
+from backend.utils.activity_logger import parse_status_change_details
+from backend.utils.task_stats import ALL_TAGS
+
+
+# 백필 시 상태를 알 수 없는 업무(상태 변경 기록 없이 삭제된 업무)의 상태
+DEFAULT_TASK_STATUS = "todo"
+
+# 백필 시 한 번에 읽고 저장하는 행 수
+SNAPSHOT_BATCH_SIZE = 1000
+
+
+def _local_day(timestamp: datetime) -> date:
+    """로그 시각을 서버 기준 날짜로 변환 (SQLite는 시간대 없는 UTC 값을 반환)"""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.astimezone().date()
+
+
+def take_status_snapshot(db: Session, day: Optional[date] = None):
+    """
+    모든 프로젝트의 현재 상태별 업무 수를 day(기본값 오늘)의 스냅샷으로 저장합니다.
+    같은 날 여러 번 실행하면 마지막 실행 결과로 덮어씁니다.
+    """
+    day = day or date.today()
+    db.execute(delete(ProjectStatusSnapshot).where(ProjectStatusSnapshot.day == day))
+    total = func.sum(ProjectTaskStat.count)
+    db.execute(insert(ProjectStatusSnapshot).from_select(
+        ["project_id", "day", "status", "count"],
+        select(ProjectTaskStat.project_id, literal(day), ProjectTaskStat.status, total)
+        .where(ProjectTaskStat.tag_name == ALL_TAGS)
+        .group_by(ProjectTaskStat.project_id, ProjectTaskStat.status)
+        .having(total > 0)
+    ))
+
+
+def backfill_status_snapshots(db: Session, until: Optional[date] = None):
+    """
+    활동 로그(업무 생성/삭제/상태 변경)를 재생하여 until(기본값 어제)까지의 일별 스냅샷을 채웁니다.
+
+    업무마다 상태가 유지된 구간을 구해 (프로젝트, 날짜, 상태)별 증감으로 바꾼 뒤 누적합으로 일별 개수를 계산하므로
+    비용은 로그 수 + 프로젝트 기간(일)에 비례합니다.
+    생성 로그가 없는 업무(가져오기 등)는 프로젝트의 첫 로그 날짜부터 있었던 것으로 계산합니다.
+    """
+    until = until or date.today() - timedelta(days=1)
+
+    # 현재 업무 상태 (task_id -> (project_id, status))
+    current = {
+        task_id: (project_id, task_status)
+        for task_id, project_id, task_status in db.execute(
+            select(Task.task_id, Task.project_id, Task.status)
+        )
+    }
+
+    # (project_id, 날짜) -> 상태별 증감, 프로젝트별 첫 로그 날짜
+    deltas: Dict[int, Dict[date, Dict[str, int]]] = defaultdict(lambda: defaultdict(lambda: defaultdict(int)))
+    first_day: Dict[int, date] = {}
+    # 프로젝트 첫 로그 날짜부터 시작하는 구간 (project_id, status) - 첫 로그 날짜를 모두 구한 뒤 반영
+    open_segments = []
+    logged_task_ids = set()
+
+    logs = db.execute(
+        select(ActivityLog.entity_id, ActivityLog.project_id, ActivityLog.action, ActivityLog.details, ActivityLog.timestamp)
+        .where(
+            ActivityLog.entity_type == "task",
+            ActivityLog.action.in_(("create", "delete", "status_change")),
+            ActivityLog.project_id.isnot(None)
+        )
+        .order_by(ActivityLog.entity_id, ActivityLog.timestamp, ActivityLog.log_id)
+        .execution_options(yield_per=SNAPSHOT_BATCH_SIZE)
+    )
+    for task_id, task_logs in groupby(logs, key=lambda row: row.entity_id):
+        task_logs = list(task_logs)
+        logged_task_ids.add(task_id)
+        project_id = current[task_id][0] if task_id in current else task_logs[0].project_id
+        for row in task_logs:
+            day = _local_day(row.timestamp)
+            if project_id not in first_day or day < first_day[project_id]:
+                first_day[project_id] = day
+
+        created = next((_local_day(row.timestamp) for row in task_logs if row.action == "create"), None)
+        deleted = next((_local_day(row.timestamp) for row in task_logs if row.action == "delete"), None)
+        if task_id not in current and deleted is None:
+            # 삭제 기록 없이 사라진 업무 (프로젝트 삭제 등)는 언제까지 있었는지 알 수 없으므로 제외
+            continue
+
+        changes = [
+            (_local_day(row.timestamp), parse_status_change_details(row.details))
+            for row in task_logs if row.action == "status_change"
+        ]
+        changes = [(day, parsed) for day, parsed in changes if parsed]
+
+        # 상태 구간: 첫 상태 변경 전 상태 -> 각 변경 후 상태 (현재 업무는 마지막 구간을 현재 상태로)
+        if changes:
+            task_status = changes[0][1][0]
+        else:
+            task_status = current[task_id][1] if task_id in current else DEFAULT_TASK_STATUS
+        start = created
+        for change_day, (_, new_status) in changes:
+            _add_segment(deltas, open_segments, project_id, task_status, start, change_day)
+            task_status, start = new_status, change_day
+        if task_id in current:
+            task_status = current[task_id][1]
+        _add_segment(deltas, open_segments, project_id, task_status, start, deleted)
+
+    # 로그가 전혀 없는 현재 업무는 프로젝트의 첫 로그 날짜부터 현재 상태로 계산
+    for task_id, (project_id, task_status) in current.items():
+        if project_id in first_day and task_id not in logged_task_ids:
+            _add_segment(deltas, open_segments, project_id, task_status, None, None)
+
+    # 시작 날짜가 없는 구간을 프로젝트 첫 로그 날짜에 반영
+    for project_id, task_status in open_segments:
+        deltas[project_id][first_day[project_id]][task_status] += 1
+
+    # 프로젝트별 누적합으로 일별 스냅샷 생성
+    db.execute(delete(ProjectStatusSnapshot).where(ProjectStatusSnapshot.day <= until))
+    rows: List[Dict] = []
+    for project_id, project_deltas in deltas.items():
+        counts: Dict[str, int] = defaultdict(int)
+        day = first_day[project_id]
+        while day <= until:
+            for task_status, delta in project_deltas.get(day, {}).items():
+                counts[task_status] += delta
+            rows.extend(
+                {"project_id": project_id, "day": day, "status": task_status, "count": count}
+                for task_status, count in counts.items() if count > 0
+            )
+            if len(rows) >= SNAPSHOT_BATCH_SIZE:
+                db.execute(insert(ProjectStatusSnapshot), rows)
+                rows = []
+            day += timedelta(days=1)
+    if rows:
+        db.execute(insert(ProjectStatusSnapshot), rows)
+
+
+def _add_segment(deltas, open_segments, project_id, task_status, start, end):
+    """업무가 [start, end) 기간 동안 task_status였음을 증감으로 기록 (start None = 프로젝트 첫 로그 날짜부터)"""
+    if start is not None and end is not None and start >= end:
+        return
+    if start is None:
+        open_segments.append((project_id, task_status))
+    else:
+        deltas[project_id][start][task_status] += 1
+    if end is not None:
+        deltas[project_id][end][task_status] -= 1
+
+
+def ensure_status_snapshots(db: Session):
+    """스냅샷 테이블이 비어 있으면 활동 로그로 과거 스냅샷을 백필하고 오늘 스냅샷을 기록합니다. (backfill_task_tables.py에서 호출)"""
+    if db.query(ProjectStatusSnapshot.project_id).first() is None:
+        backfill_status_snapshots(db)
+        take_status_snapshot(db)
+        db.commit()
+
+
+def run_status_snapshot_job():
+    """스케줄러 작업: 오늘 스냅샷 기록 (하루에 여러 번 실행되며 마지막 실행 결과가 그날의 값)"""
+    db = SessionLocal()
+    try:
+        take_status_snapshot(db)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"상태 스냅샷 기록 실패: {e}")
+    finally:
+        db.close()
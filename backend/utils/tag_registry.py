@@ -0,0 +1,75 @@
+import threading
+import time
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+from backend.models.tag import Tag
+
+
+# 캐시 유지 시간(초). 다른 워커 프로세스에서 변경된 태그도 이 시간 안에 반영됨
+TAG_CACHE_TTL_SECONDS = 60
+
+# project_id -> (태그 이름 집합, 캐시 시각)
+_project_tags: Dict[int, Tuple[FrozenSet[str], float]] = {}
+# project_id -> 무효화 횟수 (조회 도중 무효화된 결과를 캐시에 저장하지 않기 위함)
+_generations: Dict[int, int] = {}
+_lock = threading.Lock()
+
+
+def _load_project_tags(db: Session, project_id: int) -> FrozenSet[str]:
+    """DB에서 프로젝트 태그를 읽어 캐시에 저장합니다."""
+    with _lock:
+        generation = _generations.get(project_id, 0)
+
+    tag_names = frozenset(
+        tag_name for (tag_name,) in db.query(Tag.tag_name).filter(Tag.project_id == project_id).all()
+    )
+
+    with _lock:
+        if _generations.get(project_id, 0) == generation:
+            _project_tags[project_id] = (tag_names, time.monotonic())
+    return tag_names
+
+
+def get_project_tag_names(db: Session, project_id: int) -> FrozenSet[str]:
+    """프로젝트의 태그 이름 집합을 반환합니다. (캐시 미스 또는 만료 시에만 조회)"""
+    with _lock:
+        cached = _project_tags.get(project_id)
+    if cached and time.monotonic() - cached[1] < TAG_CACHE_TTL_SECONDS:
+        return cached[0]
+    return _load_project_tags(db, project_id)
+
+
+def invalidate_project_tags(project_id: int):
+    """프로젝트 태그 캐시를 무효화합니다. (태그 생성/수정/삭제 커밋 후 호출)"""
+    with _lock:
+        _project_tags.pop(project_id, None)
+        _generations[project_id] = _generations.get(project_id, 0) + 1
+
+
+def find_missing_tags(db: Session, project_id: int, tag_names: Iterable[str]) -> List[str]:
+    """
+    프로젝트에 존재하지 않는 태그 이름을 요청 순서대로 반환합니다.
+
+    캐시된 집합과의 차집합으로 검사하고, 누락된 태그가 있을 때만 다른 워커에서 방금 생성된 태그일 수 있으므로
+    한 번 다시 조회해 확인합니다.
+    """
+    tag_names = list(dict.fromkeys(tag_names))
+    if not tag_names:
+        return []
+
+    missing = set(tag_names) - get_project_tag_names(db, project_id)
+    if missing:
+        missing -= _load_project_tags(db, project_id)
+    return [tag_name for tag_name in tag_names if tag_name in missing]
+
+
+def validate_task_tags(db: Session, project_id: int, tag_names: Iterable[str]):
+    """업무에 할당할 태그가 모두 프로젝트에 존재하는지 검증합니다. 없으면 400 에러."""
+    missing = find_missing_tags(db, project_id, tag_names or [])
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"태그 '{missing[0]}'이 해당 프로젝트에 존재하지 않습니다."
+        )
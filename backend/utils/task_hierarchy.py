@@ -0,0 +1,188 @@
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import delete, exists, func, insert, literal, select, or_
+from sqlalchemy.orm import Session, aliased
+
+from backend.models.task import Task, TaskClosure
+
+
+# 잘못된 데이터(이미 존재하는 순환)로 인한 무한 재귀 방지용 최대 깊이
+MAX_HIERARCHY_DEPTH = 1000
+
+CLOSURE_COLUMNS = ["ancestor_id", "descendant_id", "depth"]
+
+
+# --- 클로저 테이블 유지 (업무 생성/상위 업무 변경/삭제 트랜잭션 안에서 호출) ---
+
+def add_task_to_closure(db: Session, task_id: int, parent_task_id: Optional[int]):
+    """새 업무의 자기 자신 행과 상위 업무들과의 관계를 클로저 테이블에 추가합니다."""
+    db.execute(insert(TaskClosure).values(ancestor_id=task_id, descendant_id=task_id, depth=0))
+    if parent_task_id:
+        ancestors = select(
+            TaskClosure.ancestor_id,
+            literal(task_id),
+            TaskClosure.depth + 1
+        ).where(TaskClosure.descendant_id == parent_task_id)
+        db.execute(insert(TaskClosure).from_select(CLOSURE_COLUMNS, ancestors))
+
+
+def add_tasks_to_closure(db: Session, tasks: List[Tuple[int, Optional[int]]]):
+    """
+    여러 새 업무를 클로저 테이블에 한 번에 추가합니다.
+
+    Args:
+        tasks: (task_id, parent_task_id) 목록. 상위 업무는 이미 클로저 테이블에 있어야 함
+    """
+    if not tasks:
+        return
+
+    # 상위 업무들의 조상 관계 일괄 조회
+    parent_ids = {parent_id for _, parent_id in tasks if parent_id}
+    parent_paths: Dict[int, List[Tuple[int, int]]] = {parent_id: [] for parent_id in parent_ids}
+    if parent_ids:
+        rows = db.execute(
+            select(TaskClosure.descendant_id, TaskClosure.ancestor_id, TaskClosure.depth).where(
+                TaskClosure.descendant_id.in_(parent_ids)
+            )
+        ).all()
+        for parent_id, ancestor_id, depth in rows:
+            parent_paths[parent_id].append((ancestor_id, depth))
+
+    values = []
+    for task_id, parent_id in tasks:
+        values.append({"ancestor_id": task_id, "descendant_id": task_id, "depth": 0})
+        for ancestor_id, depth in parent_paths.get(parent_id, []):
+            values.append({"ancestor_id": ancestor_id, "descendant_id": task_id, "depth": depth + 1})
+    db.execute(insert(TaskClosure), values)
+
+
+def move_task_in_closure(db: Session, task_id: int, new_parent_id: Optional[int]):
+    """업무(와 그 하위 트리)를 new_parent_id 아래로 옮깁니다."""
+    subtree = select(TaskClosure.descendant_id).where(TaskClosure.ancestor_id == task_id)
+
+    # 하위 트리와 기존 상위 업무들 사이의 관계 제거 (하위 트리 내부 관계는 유지)
+    db.execute(
+        delete(TaskClosure).where(
+            TaskClosure.descendant_id.in_(subtree),
+            TaskClosure.ancestor_id.not_in(subtree)
+        )
+    )
+
+    # 새 상위 업무의 모든 조상 x 하위 트리의 모든 업무 관계 추가
+    if new_parent_id:
+        upper = aliased(TaskClosure)
+        lower = aliased(TaskClosure)
+        pairs = select(
+            upper.ancestor_id,
+            lower.descendant_id,
+            upper.depth + lower.depth + 1
+        ).select_from(upper).join(
+            lower, lower.ancestor_id == task_id
+        ).where(upper.descendant_id == new_parent_id)
+        db.execute(insert(TaskClosure).from_select(CLOSURE_COLUMNS, pairs))
+
+
+def remove_task_from_closure(db: Session, task_id: int):
+    """삭제되는 업무와 관련된 클로저 행을 제거합니다."""
+    db.execute(
+        delete(TaskClosure).where(
+            or_(TaskClosure.ancestor_id == task_id, TaskClosure.descendant_id == task_id)
+        )
+    )
+
+
+def rebuild_task_closure(db: Session):
+    """
+    tasks.parent_task_id로부터 클로저 테이블 전체를 재구성합니다. (초기 백필/복구용)
+    재귀 CTE 한 번으로 모든 상위-하위 쌍을 계산합니다.
+    """
+    paths = select(
+        Task.task_id.label("ancestor_id"),
+        Task.task_id.label("descendant_id"),
+        literal(0).label("depth")
+    ).cte("task_paths", recursive=True)
+    parent = select(
+        Task.parent_task_id,
+        paths.c.descendant_id,
+        paths.c.depth + 1
+    ).join(paths, Task.task_id == paths.c.ancestor_id).where(
+        Task.parent_task_id.isnot(None),
+        paths.c.depth < MAX_HIERARCHY_DEPTH
+    )
+    paths = paths.union_all(parent)
+
+    db.execute(delete(TaskClosure))
+    db.execute(insert(TaskClosure).from_select(CLOSURE_COLUMNS, select(paths)))
+
+
+def ensure_task_closure(db: Session):
+    """클로저 테이블이 비어 있는데 업무가 존재하면 초기 백필을 수행합니다. (backfill_task_tables.py에서 호출)"""
+    has_closure = db.execute(select(exists().where(TaskClosure.depth == 0))).scalar()
+    has_tasks = db.execute(select(exists().where(Task.task_id.isnot(None)))).scalar()
+    if has_tasks and not has_closure:
+        rebuild_task_closure(db)
+        db.commit()
+
+
+# --- 조회 (클로저 테이블 인덱스를 사용하는 단일 쿼리) ---
+
+def _tree_columns(depth_column):
+    return (
+        Task.task_id,
+        Task.parent_task_id,
+        Task.title,
+        Task.status,
+        Task.assignee_id,
+        depth_column.label("depth")
+    )
+
+
+def get_ancestors(db: Session, task_id: int) -> List[dict]:
+    """
+    업무의 모든 상위 업무를 한 번의 쿼리로 조회합니다.
+    가까운 상위 업무부터 반환하며, 직속 상위 업무의 depth는 1입니다.
+    """
+    rows = db.execute(
+        select(*_tree_columns(TaskClosure.depth))
+        .join(TaskClosure, Task.task_id == TaskClosure.ancestor_id)
+        .where(TaskClosure.descendant_id == task_id, TaskClosure.depth > 0)
+        .order_by(TaskClosure.depth)
+    ).mappings().all()
+    return [dict(row) for row in rows]
+
+
+def get_subtree(db: Session, task_id: int) -> List[dict]:
+    """
+    업무 자신(depth 0)과 모든 하위 업무를 한 번의 쿼리로 조회합니다.
+    depth, task_id 순으로 정렬하여 반환합니다.
+    """
+    rows = db.execute(
+        select(*_tree_columns(TaskClosure.depth))
+        .join(TaskClosure, Task.task_id == TaskClosure.descendant_id)
+        .where(TaskClosure.ancestor_id == task_id)
+        .order_by(TaskClosure.depth, Task.task_id)
+    ).mappings().all()
+    return [dict(row) for row in rows]
+
+
+def count_descendants(db: Session, task_id: int, max_depth: Optional[int] = None) -> int:
+    """하위 업무 수 조회 (max_depth=1이면 직속 하위 업무만)"""
+    query = select(func.count()).select_from(TaskClosure).where(
+        TaskClosure.ancestor_id == task_id,
+        TaskClosure.depth > 0
+    )
+    if max_depth is not None:
+        query = query.where(TaskClosure.depth <= max_depth)
+    return db.execute(query).scalar() or 0
+
+
+def creates_cycle(db: Session, task_id: int, new_parent_id: int) -> bool:
+    """
+    task_id의 상위 업무를 new_parent_id로 변경하면 순환 참조가 생기는지 확인합니다.
+    (new_parent_id가 task_id 자신이거나 그 하위 업무이면 순환)
+    """
+    return bool(db.execute(
+        select(exists().where(
+            TaskClosure.ancestor_id == task_id,
+            TaskClosure.descendant_id == new_parent_id
+        ))
+    ).scalar())
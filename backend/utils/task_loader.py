@@ -0,0 +1,183 @@
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+from backend.models.task import Task, TaskMember
+from backend.models.tag import TaskTag
+from backend.models.user import User
+from backend.schemas.Task import TaskResponse
+
+
+# TaskResponse 중 tasks 테이블 외의 추가 조회가 필요한 필드
+RELATED_FIELDS = {"member_ids", "tag_names", "parent_task_title", "assignee_name"}
+
+# 컬럼 형식 응답에서 tasks 테이블로부터 직접 조회하는 컬럼
+TASK_COLUMNS = [getattr(Task, field) for field in TaskResponse.model_fields if field not in RELATED_FIELDS]
+
+
+def parse_task_fields(fields: Optional[str]) -> Optional[Set[str]]:
+    """
+    fields 쿼리 파라미터("task_id,title,status")를 필드 집합으로 변환합니다.
+    TaskResponse에 없는 필드가 포함되면 400 에러를 발생시킵니다.
+    """
+    if not fields:
+        return None
+    requested = {f.strip() for f in fields.split(",") if f.strip()}
+    invalid = requested - set(TaskResponse.model_fields)
+    if invalid:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"존재하지 않는 필드입니다: {', '.join(sorted(invalid))}"
+        )
+    return requested
+
+
+def load_task_relations(
+    db: Session,
+    tasks: Sequence,
+    needed: Set[str]
+) -> Tuple[Dict[int, List[int]], Dict[int, List[str]], Dict[int, str], Dict[int, str]]:
+    """
+    업무 목록의 멤버, 태그, 상위 업무 제목, 담당자 이름을 각각 한 번의 쿼리로 일괄 조회합니다.
+
+    Args:
+        tasks: task_id, parent_task_id, assignee_id, title 속성을 가진 Task 객체 또는 조회 행
+        needed: 조회할 추가 정보 (RELATED_FIELDS의 부분집합)
+
+    Returns:
+        (멤버 맵, 태그 맵, 업무 제목 맵, 담당자 이름 맵)
+    """
+    task_ids = [task.task_id for task in tasks]
+
+    # task_members 일괄 조회
+    member_map: Dict[int, List[int]] = {task_id: [] for task_id in task_ids}
+    if "member_ids" in needed:
+        task_members = db.query(TaskMember.task_id, TaskMember.user_id).filter(
+            TaskMember.task_id.in_(task_ids)
+        ).all()
+        for task_id, user_id in task_members:
+            member_map[task_id].append(user_id)
+
+    # 태그 일괄 조회
+    tag_map: Dict[int, List[str]] = {task_id: [] for task_id in task_ids}
+    if "tag_names" in needed:
+        task_tags = db.query(TaskTag.task_id, TaskTag.tag_name).filter(
+            TaskTag.task_id.in_(task_ids)
+        ).all()
+        for task_id, tag_name in task_tags:
+            tag_map[task_id].append(tag_name)
+
+    # 상위 업무 제목 일괄 조회 (이미 로드된 업무는 재조회하지 않음)
+    title_map: Dict[int, str] = {}
+    if "parent_task_title" in needed:
+        title_map = {task.task_id: task.title for task in tasks}
+        missing_parent_ids = {
+            task.parent_task_id for task in tasks
+            if task.parent_task_id and task.parent_task_id not in title_map
+        }
+        if missing_parent_ids:
+            parents = db.query(Task.task_id, Task.title).filter(
+                Task.task_id.in_(missing_parent_ids)
+            ).all()
+            for task_id, title in parents:
+                title_map[task_id] = title
+
+    # 담당자 이름 일괄 조회 (task.assignee 지연 로딩 방지)
+    assignee_map: Dict[int, str] = {}
+    if "assignee_name" in needed:
+        assignee_ids = {task.assignee_id for task in tasks if task.assignee_id}
+        if assignee_ids:
+            assignees = db.query(User.user_id, User.name).filter(
+                User.user_id.in_(assignee_ids)
+            ).all()
+            assignee_map = {user_id: name for user_id, name in assignees}
+
+    return member_map, tag_map, title_map, assignee_map
+
+
+def build_task_responses(
+    db: Session,
+    tasks: List[Task],
+    fields: Optional[Iterable[str]] = None
+) -> List[TaskResponse]:
+    """
+    여러 업무를 TaskResponse 목록으로 변환합니다.
+
+    업무 수와 관계없이 멤버, 태그, 상위 업무 제목, 담당자 이름을
+    각각 한 번의 쿼리로 일괄 조회합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        tasks: 변환할 Task 객체 목록 (순서 유지)
+        fields: 응답에 필요한 필드 (None이면 전체). 요청되지 않은 추가 정보는 조회하지 않음
+    """
+    if not tasks:
+        return []
+
+    needed = RELATED_FIELDS if fields is None else RELATED_FIELDS & set(fields)
+    member_map, tag_map, title_map, assignee_map = load_task_relations(db, tasks, needed)
+
+    result = []
+    for task in tasks:
+        result.append(TaskResponse(
+            **task.__dict__,
+            assignee_name=assignee_map.get(task.assignee_id),
+            parent_task_title=title_map.get(task.parent_task_id) if task.parent_task_id else None,
+            member_ids=member_map[task.task_id],
+            tag_names=tag_map[task.task_id]
+        ))
+
+    return result
+
+
+def build_task_columns(
+    db: Session,
+    rows: Sequence,
+    fields: Optional[Iterable[str]] = None
+) -> Dict[str, list]:
+    """
+    TASK_COLUMNS로 조회한 행을 컬럼 형식({"task_id": [...], "status": [...]})으로 변환합니다.
+    TaskResponse 객체를 만들지 않으므로 대량 목록의 직렬화 비용이 작습니다.
+
+    Args:
+        rows: db.query(*TASK_COLUMNS)로 조회한 행 목록 (순서 유지)
+        fields: 응답에 포함할 필드 (None이면 TaskResponse 전체 필드)
+    """
+    columns = list(TaskResponse.model_fields) if fields is None else [
+        field for field in TaskResponse.model_fields if field in set(fields)
+    ]
+    needed = RELATED_FIELDS & set(columns)
+    member_map, tag_map, title_map, assignee_map = load_task_relations(db, rows, needed)
+
+    related_values = {
+        "member_ids": lambda row: member_map[row.task_id],
+        "tag_names": lambda row: tag_map[row.task_id],
+        "parent_task_title": lambda row: title_map.get(row.parent_task_id) if row.parent_task_id else None,
+        "assignee_name": lambda row: assignee_map.get(row.assignee_id),
+    }
+    result = {}
+    for column in columns:
+        if column in related_values:
+            result[column] = [related_values[column](row) for row in rows]
+        else:
+            result[column] = [getattr(row, column) for row in rows]
+    return result
+
+
+def build_task_response(db: Session, task: Task) -> TaskResponse:
+    """단일 업무를 TaskResponse로 변환합니다."""
+    return build_task_responses(db, [task])[0]
+
+
+def build_task_response_from_state(db: Session, task: Task, **known) -> TaskResponse:
+    """
+    쓰기 직후 이미 알고 있는 값으로 TaskResponse를 생성합니다. (커밋 전에 호출)
+
+    known에 담긴 추가 정보(member_ids, tag_names, parent_task_title, assignee_name)는 그대로 사용하고,
+    없는 정보만 조회합니다. 생성 직후처럼 모든 값을 알고 있으면 쿼리를 실행하지 않습니다.
+    """
+    missing = RELATED_FIELDS - set(known)
+    if missing:
+        loaded = build_task_responses(db, [task], fields=missing)[0]
+        known = {**{field: getattr(loaded, field) for field in missing}, **known}
+    return TaskResponse(**{**task.__dict__, **known})
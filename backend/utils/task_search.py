@@ -0,0 +1,141 @@
+import re
+from typing import Iterable, List, Tuple
+from sqlalchemy import bindparam, func, select, text, update
+from sqlalchemy.orm import Session
+
+from backend.models.comment_file import Comment
+from backend.models.task import Task, TASK_SEARCH_FTS5_DDL
+
+
+# PostgreSQL 텍스트 검색 설정 (한국어 형태소 사전이 없으므로 simple + 접두사 검색 사용)
+SEARCH_CONFIG = "simple"
+
+# 검색어에서 사용할 최대 단어 수
+MAX_SEARCH_TERMS = 10
+
+
+def _is_sqlite(db: Session) -> bool:
+    return db.get_bind().dialect.name == "sqlite"
+
+
+def split_search_terms(q: str) -> List[str]:
+    """검색어를 단어 목록으로 분리합니다. (특수문자 제거, 연산자 주입 방지)"""
+    return re.findall(r"\w+", q or "")[:MAX_SEARCH_TERMS]
+
+
+# --- 검색 색인 유지 (업무/댓글 쓰기 트랜잭션 안에서 호출) ---
+
+def refresh_task_search(db: Session, task_ids: Iterable[int]):
+    """업무의 제목/설명/댓글로 검색 색인을 다시 계산합니다."""
+    task_ids = list(task_ids)
+    if not task_ids:
+        return
+
+    if _is_sqlite(db):
+        db.execute(
+            text("DELETE FROM task_search WHERE rowid IN :task_ids").bindparams(
+                bindparam("task_ids", expanding=True)
+            ),
+            {"task_ids": task_ids}
+        )
+        db.execute(
+            text(
+                "INSERT INTO task_search (rowid, title, description, comments, project_id) "
+                "SELECT t.task_id, t.title, coalesce(t.description, ''), "
+                "coalesce((SELECT group_concat(c.content, ' ') FROM comments c WHERE c.task_id = t.task_id), ''), "
+                "t.project_id "
+                "FROM tasks t WHERE t.task_id IN :task_ids"
+            ).bindparams(bindparam("task_ids", expanding=True)),
+            {"task_ids": task_ids}
+        )
+        return
+
+    db.execute(search_vector_update(task_ids))
+
+
+def search_vector_update(task_ids: List[int]):
+    """
+    업무의 search_vector를 다시 계산하는 PostgreSQL UPDATE 문.
+    색인 갱신은 업무 변경이 아니므로 updated_at을 그대로 두어 onupdate가 적용되지 않게 합니다.
+    (댓글 작성/수정/삭제가 업무 목록 ETag, 변경 동기화, updated_at 커서 순서에 영향을 주지 않음)
+    """
+    comments = select(
+        func.coalesce(func.string_agg(Comment.content, " "), "")
+    ).where(Comment.task_id == Task.task_id).scalar_subquery()
+
+    def weighted(value, weight):
+        return func.setweight(func.to_tsvector(SEARCH_CONFIG, func.coalesce(value, "")), weight)
+
+    return (
+        update(Task)
+        .where(Task.task_id.in_(task_ids))
+        .values(
+            search_vector=weighted(Task.title, "A").op("||")(
+                weighted(Task.description, "B")
+            ).op("||")(
+                weighted(comments, "C")
+            ),
+            updated_at=Task.updated_at
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def remove_task_from_search(db: Session, task_id: int):
+    """삭제되는 업무를 검색 색인에서 제거합니다. (PostgreSQL은 tasks 행과 함께 삭제됨)"""
+    if _is_sqlite(db):
+        db.execute(text("DELETE FROM task_search WHERE rowid = :task_id"), {"task_id": task_id})
+
+
+def ensure_task_search(db: Session):
+    """
+    검색 색인이 비어 있는 업무를 백필합니다. (backfill_task_tables.py에서 호출)
+    SQLite는 tasks 테이블 생성 이후에 추가된 task_search 테이블이 없으면 먼저 생성합니다.
+    """
+    if _is_sqlite(db):
+        db.execute(text(TASK_SEARCH_FTS5_DDL))
+        missing = db.execute(text(
+            "SELECT task_id FROM tasks WHERE task_id NOT IN (SELECT rowid FROM task_search)"
+        )).scalars().all()
+    else:
+        missing = db.execute(
+            select(Task.task_id).where(Task.search_vector.is_(None))
+        ).scalars().all()
+
+    if missing:
+        refresh_task_search(db, missing)
+        db.commit()
+
+
+# --- 검색 ---
+
+def search_tasks(db: Session, project_id: int, q: str, limit: int) -> List[Tuple[int, float]]:
+    """
+    프로젝트 업무를 전문 검색하여 (task_id, 점수) 목록을 관련도 순으로 반환합니다.
+    모든 단어를 포함(접두사 일치)하는 업무만 반환합니다.
+    """
+    terms = split_search_terms(q)
+    if not terms:
+        return []
+
+    if _is_sqlite(db):
+        match = " ".join(f'"{term}"*' for term in terms)
+        rows = db.execute(
+            text(
+                "SELECT rowid, -bm25(task_search, 10.0, 5.0, 1.0) AS rank FROM task_search "
+                "WHERE task_search MATCH :match AND project_id = :project_id "
+                "ORDER BY rank DESC, rowid LIMIT :limit"
+            ),
+            {"match": match, "project_id": project_id, "limit": limit}
+        ).all()
+        return [(task_id, float(rank)) for task_id, rank in rows]
+
+    query = func.to_tsquery(SEARCH_CONFIG, " & ".join(f"{term}:*" for term in terms))
+    rank = func.ts_rank_cd(Task.search_vector, query)
+    rows = db.execute(
+        select(Task.task_id, rank.label("rank"))
+        .where(Task.project_id == project_id, Task.search_vector.op("@@")(query))
+        .order_by(rank.desc(), Task.task_id)
+        .limit(limit)
+    ).all()
+    return [(task_id, float(rank)) for task_id, rank in rows]
@@ -0,0 +1,168 @@
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from sqlalchemy import delete, func, insert, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from backend.models.project import ProjectTaskStat
+from backend.models.tag import TaskTag
+from backend.models.task import Task
+
+
+# project_task_stats의 담당자 없음 / 업무 단위 행 표시값
+UNASSIGNED = 0
+ALL_TAGS = ""
+
+# 업무 집계 상태 (대시보드 상태별 카운트 순서)
+TASK_STATUSES = ("todo", "in_progress", "pending", "complete")
+
+# (project_id, status, assignee_id, tag_names) - 집계에 반영할 업무 상태
+TaskStatsState = Tuple[int, str, Optional[int], Sequence[str]]
+
+
+def _stat_keys(state: TaskStatsState) -> List[Tuple[int, str, int, str]]:
+    """업무 하나가 차지하는 카운터 키 목록 (업무 단위 행 + 태그별 행)"""
+    project_id, task_status, assignee_id, tag_names = state
+    assignee_key = assignee_id or UNASSIGNED
+    return [(project_id, task_status, assignee_key, ALL_TAGS)] + [
+        (project_id, task_status, assignee_key, tag_name) for tag_name in dict.fromkeys(tag_names or [])
+    ]
+
+
+# --- 카운터 유지 (업무 생성/수정/삭제 트랜잭션 안에서 호출) ---
+
+def apply_task_stats(
+    db: Session,
+    added: Iterable[TaskStatsState] = (),
+    removed: Iterable[TaskStatsState] = ()
+):
+    """
+    업무 변경을 집계 카운터에 반영합니다.
+
+    Args:
+        added: 새로 생겼거나 변경 후의 업무 상태 목록
+        removed: 삭제되었거나 변경 전의 업무 상태 목록
+    """
+    deltas = Counter()
+    for state in added:
+        deltas.update(_stat_keys(state))
+    for state in removed:
+        deltas.subtract(_stat_keys(state))
+
+    rows = [
+        {"project_id": project_id, "status": task_status, "assignee_id": assignee_id, "tag_name": tag_name, "count": delta}
+        for (project_id, task_status, assignee_id, tag_name), delta in deltas.items()
+        if delta
+    ]
+    if not rows:
+        return
+
+    upsert = sqlite_insert if db.get_bind().dialect.name == "sqlite" else pg_insert
+    statement = upsert(ProjectTaskStat)
+    db.execute(
+        statement.on_conflict_do_update(
+            index_elements=["project_id", "status", "assignee_id", "tag_name"],
+            set_={"count": ProjectTaskStat.count + statement.excluded.count}
+        ),
+        rows
+    )
+
+
+def load_task_tag_names(db: Session, task_ids: Iterable[int]) -> Dict[int, List[str]]:
+    """업무별 태그 이름 일괄 조회 (집계 키 계산용)"""
+    task_ids = list(task_ids)
+    tag_map: Dict[int, List[str]] = {task_id: [] for task_id in task_ids}
+    if task_ids:
+        for task_id, tag_name in db.query(TaskTag.task_id, TaskTag.tag_name).filter(TaskTag.task_id.in_(task_ids)).all():
+            tag_map[task_id].append(tag_name)
+    return tag_map
+
+
+def rebuild_project_task_stats(db: Session, project_ids: Optional[Iterable[int]] = None):
+    """
+    tasks/task_tags로 집계 카운터를 다시 계산합니다. (project_ids가 None이면 전체)
+    태그 이름 변경/삭제, 담당자 일괄 해제처럼 여러 업무가 한 번에 바뀌는 경우에 사용합니다.
+    """
+    if project_ids is not None:
+        project_ids = list(project_ids)
+        if not project_ids:
+            return
+
+    def scoped(query, column):
+        return query if project_ids is None else query.where(column.in_(project_ids))
+
+    db.execute(scoped(delete(ProjectTaskStat), ProjectTaskStat.project_id))
+
+    assignee_key = func.coalesce(Task.assignee_id, UNASSIGNED)
+    columns = ["project_id", "status", "assignee_id", "tag_name", "count"]
+    db.execute(insert(ProjectTaskStat).from_select(columns, scoped(
+        select(Task.project_id, Task.status, assignee_key, literal(ALL_TAGS), func.count())
+        .group_by(Task.project_id, Task.status, assignee_key),
+        Task.project_id
+    )))
+    db.execute(insert(ProjectTaskStat).from_select(columns, scoped(
+        select(Task.project_id, Task.status, assignee_key, TaskTag.tag_name, func.count())
+        .join(TaskTag, TaskTag.task_id == Task.task_id)
+        .group_by(Task.project_id, Task.status, assignee_key, TaskTag.tag_name),
+        Task.project_id
+    )))
+
+
+def ensure_project_task_stats(db: Session):
+    """집계 카운터가 비어 있고 업무가 있으면 전체를 계산합니다. (backfill_task_tables.py에서 호출)"""
+    has_stats = db.query(ProjectTaskStat.project_id).first() is not None
+    has_tasks = db.query(Task.task_id).first() is not None
+    if has_tasks and not has_stats:
+        rebuild_project_task_stats(db)
+        db.commit()
+
+
+# --- 조회 (O(버킷 수)) ---
+
+def get_status_counts(db: Session, project_id: int, assignee_id: Optional[int] = None) -> Dict[str, int]:
+    """프로젝트(또는 담당자)의 상태별 업무 수"""
+    query = db.query(ProjectTaskStat.status, func.sum(ProjectTaskStat.count)).filter(
+        ProjectTaskStat.project_id == project_id,
+        ProjectTaskStat.tag_name == ALL_TAGS
+    )
+    if assignee_id is not None:
+        query = query.filter(ProjectTaskStat.assignee_id == assignee_id)
+    return {task_status: int(count) for task_status, count in query.group_by(ProjectTaskStat.status).all() if count}
+
+
+def get_grouped_status_counts(db: Session, project_id: int, by: str) -> Dict:
+    """
+    담당자별("assignee") 또는 태그별("tag") 상태별 업무 수
+
+    Returns:
+        {assignee_id 또는 tag_name: {status: count}}
+    """
+    if by == "tag":
+        key, condition = ProjectTaskStat.tag_name, ProjectTaskStat.tag_name != ALL_TAGS
+    else:
+        key, condition = ProjectTaskStat.assignee_id, ProjectTaskStat.tag_name == ALL_TAGS
+    rows = db.query(key, ProjectTaskStat.status, func.sum(ProjectTaskStat.count)).filter(
+        ProjectTaskStat.project_id == project_id,
+        condition
+    ).group_by(key, ProjectTaskStat.status).all()
+
+    result: Dict = {}
+    for group, task_status, count in rows:
+        if count:
+            result.setdefault(group, {})[task_status] = int(count)
+    return result
+
+
+def get_assignee_status_counts(db: Session, project_ids: Sequence[int]) -> List[Tuple[int, int, str, int]]:
+    """여러 프로젝트의 (project_id, assignee_id, status, 업무 수) 목록 (워크스페이스 대시보드용)"""
+    if not project_ids:
+        return []
+    rows = db.query(
+        ProjectTaskStat.project_id, ProjectTaskStat.assignee_id, ProjectTaskStat.status, ProjectTaskStat.count
+    ).filter(
+        ProjectTaskStat.project_id.in_(project_ids),
+        ProjectTaskStat.tag_name == ALL_TAGS,
+        ProjectTaskStat.count > 0
+    ).all()
+    return [(project_id, assignee_id, task_status, count) for project_id, assignee_id, task_status, count in rows]
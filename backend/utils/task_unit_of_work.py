@@ -0,0 +1,117 @@
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from sqlalchemy.orm import Session
+
+from backend.models.logs_notification import Notification
+from backend.models.user import User
+from backend.routers.notifications import build_task_notification_message, emit_notification_realtime
+from backend.utils.activity_logger import bulk_log_task_activity
+
+
+class TaskUnitOfWork:
+    """
+    업무 변경 작업 단위.
+
+    업무 행, 멤버/태그 매핑, 활동 로그, 알림을 세션에 모아 한 번에 커밋하고,
+    WebSocket 이벤트는 커밋이 성공한 뒤에만 발행합니다.
+
+    사용 예:
+        uow = TaskUnitOfWork(db, current_user)
+        uow.add(task)
+        uow.log_task(task.task_id, "create", task.project_id, task_title=task.title)
+        uow.after_commit(event_emitter.emit_task_created, task_id=task.task_id, ...)
+        await uow.commit()
+    """
+
+    def __init__(self, db: Session, user: User):
+        self.db = db
+        self.user = user
+        self._log_entries: List[Dict] = []
+        self._notifications: List[Dict] = []
+        self._after_commit: List[tuple] = []
+
+    def add(self, obj: Any):
+        """세션에 저장할 객체 추가 (업무, TaskMember, TaskTag 등)"""
+        self.db.add(obj)
+
+    def log_task(self, task_id: int, action: str, project_id: int, **details):
+        """
+        Task 활동 로그 예약
+
+        Args:
+            details: log_task_activity의 선택 인자 (task_title, old_status, new_status, assignee_name)
+        """
+        self._log_entries.append({
+            "task_id": task_id,
+            "action": action,
+            "project_id": project_id,
+            **details
+        })
+
+    def notify_task(
+        self,
+        user_id: int,
+        task_id: int,
+        task_title: str,
+        notification_type: str,
+        project_id: Optional[int] = None
+    ):
+        """Task 관련 알림 예약 (저장은 커밋 시, 실시간 발행은 커밋 후)"""
+        self._notifications.append({
+            "user_id": user_id,
+            "task_id": task_id,
+            "type": notification_type,
+            "message": build_task_notification_message(task_title, notification_type, self.user.name),
+            "project_id": project_id,
+        })
+
+    def after_commit(self, callback: Callable[..., Awaitable[Any]], *args, **kwargs):
+        """커밋 성공 후 실행할 비동기 작업 (WebSocket 이벤트 등) 예약"""
+        self._after_commit.append((callback, args, kwargs))
+
+    async def commit(self):
+        """
+        예약된 변경을 한 번에 커밋한 뒤 이벤트를 발행합니다.
+        커밋이 실패하면 롤백하고 예외를 다시 발생시키며, 이벤트는 발행하지 않습니다.
+        """
+        notifications = [
+            Notification(
+                user_id=item["user_id"],
+                type=item["type"],
+                message=item["message"],
+                channel="task",
+                is_read=False,
+                related_id=item["task_id"]
+            )
+            for item in self._notifications
+        ]
+
+        try:
+            bulk_log_task_activity(self.db, self.user, self._log_entries)
+            self.db.add_all(notifications)
+            self.db.flush()
+            # 커밋 후에는 객체가 만료되므로 알림 ID를 미리 읽어 둠
+            notification_ids = [notification.notification_id for notification in notifications]
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        for callback, args, kwargs in self._after_commit:
+            try:
+                await callback(*args, **kwargs)
+            except Exception as e:
+                print(f"커밋 후 이벤트 발행 실패: {e}")
+
+        for item, notification_id in zip(self._notifications, notification_ids):
+            await emit_notification_realtime(
+                user_id=item["user_id"],
+                type=item["type"],
+                message=item["message"],
+                notification_id=notification_id,
+                related_id=item["task_id"],
+                project_id=item["project_id"]
+            )
+
+        self._log_entries.clear()
+        self._notifications.clear()
+        self._after_commit.clear()
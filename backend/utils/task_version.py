@@ -0,0 +1,148 @@
+import hashlib
+from typing import List, Optional, Set, Tuple
+from fastapi import Request
+from sqlalchemy import bindparam, event, inspect, literal, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from backend.models.project import ProjectMember, ProjectTaskVersion
+from backend.models.task import Task
+from backend.models.user import User
+
+
+def bump_project_task_version(db: Session, project_id: int) -> int:
+    """
+    프로젝트 업무 목록 버전을 1 증가시키고 새 버전을 반환합니다.
+
+    업무/태그/업무 멤버를 변경하는 트랜잭션 안에서 커밋 전에 호출해야 합니다.
+    반환된 버전은 변경된 업무의 sync_version(변경 동기화 커서)으로 사용됩니다.
+    버전 행이 없으면 같은 문장에서 생성하므로(upsert) 프로젝트의 첫 쓰기가 동시에 일어나도 충돌하지 않습니다.
+    """
+    # 테이블에 직접 실행 (세션 flush 없이 실행되어 대기 중인 업무 변경이 버전 조건부 UPDATE보다 먼저 실행되지 않음)
+    table = ProjectTaskVersion.__table__
+    upsert = sqlite_insert if db.get_bind().dialect.name == "sqlite" else pg_insert
+    statement = upsert(table).values(project_id=project_id, version=1)
+    return db.execute(
+        statement.on_conflict_do_update(
+            index_elements=[table.c.project_id],
+            set_={"version": table.c.version + 1}
+        ).returning(table.c.version)
+    ).scalar_one()
+
+
+def bump_task_project_version(db: Session, task_id: int) -> Optional[Tuple[int, int]]:
+    """
+    업무가 속한 프로젝트의 업무 버전을 한 문장으로 증가시키고 (project_id, 새 버전)을 반환합니다.
+    업무를 미리 조회하지 않는 쓰기 경로용이며, 업무가 없으면 None을 반환합니다.
+    """
+    project_id = select(Task.project_id).where(Task.task_id == task_id).scalar_subquery()
+    row = db.execute(
+        update(ProjectTaskVersion)
+        .where(ProjectTaskVersion.project_id == project_id)
+        .values(version=ProjectTaskVersion.version + 1)
+        .returning(ProjectTaskVersion.project_id, ProjectTaskVersion.version)
+        .execution_options(synchronize_session=False)
+    ).first()
+    if row:
+        return row.project_id, row.version
+
+    # 프로젝트 버전 기록이 아직 없는 경우
+    task_project_id = db.query(Task.project_id).filter(Task.task_id == task_id).scalar()
+    if task_project_id is None:
+        return None
+    return task_project_id, bump_project_task_version(db, task_project_id)
+
+
+def bump_user_project_versions(connection: Connection, user_id: int) -> List[Tuple[int, int]]:
+    """
+    사용자가 속한 모든 프로젝트의 업무 버전을 증가시키고 (project_id, 새 버전) 목록을 반환합니다.
+
+    업무 목록 응답의 assignee_name처럼 사용자 정보가 바뀌면 업무 쓰기 없이도 응답이 달라지므로,
+    프로젝트 ETag를 갱신하고 사용자가 담당한 업무를 변경 동기화 대상으로 표시합니다.
+    """
+    table = ProjectTaskVersion.__table__
+    upsert = sqlite_insert if connection.dialect.name == "sqlite" else pg_insert
+    statement = upsert(table).from_select(
+        ["project_id", "version"],
+        select(ProjectMember.project_id, literal(1)).where(ProjectMember.user_id == user_id)
+    )
+    versions = connection.execute(
+        statement.on_conflict_do_update(
+            index_elements=[table.c.project_id],
+            set_={"version": table.c.version + 1}
+        ).returning(table.c.project_id, table.c.version)
+    ).all()
+
+    if versions:
+        tasks = Task.__table__
+        connection.execute(
+            update(tasks)
+            .where(tasks.c.project_id == bindparam("b_project_id"), tasks.c.assignee_id == user_id)
+            .values(sync_version=bindparam("b_version")),
+            [{"b_project_id": project_id, "b_version": version} for project_id, version in versions]
+        )
+    return [(project_id, version) for project_id, version in versions]
+
+
+@event.listens_for(User, "after_update")
+def _bump_versions_on_user_rename(mapper, connection, target):
+    """사용자 이름이 바뀌면 같은 flush에서 소속 프로젝트의 업무 버전을 증가시킵니다. (ORM 수정에만 적용)"""
+    if inspect(target).attrs.name.history.has_changes():
+        bump_user_project_versions(connection, target.user_id)
+
+
+def get_project_task_version(db: Session, project_id: int) -> int:
+    """프로젝트 업무 목록 버전 조회 (기록이 없으면 0)"""
+    version = db.query(ProjectTaskVersion.version).filter(
+        ProjectTaskVersion.project_id == project_id
+    ).scalar()
+    return version or 0
+
+
+def make_task_list_etag(request: Request, project_id: int, version: int, variant: Optional[str] = None) -> str:
+    """
+    업무 목록 응답의 strong ETag 생성.
+    같은 버전이라도 쿼리 파라미터(필터, 필드, 커서)나 응답 형식(variant)이 다르면 다른 ETag가 됩니다.
+    """
+    params = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    digest = hashlib.sha1(f"{request.url.path}?{params}#{variant or ''}".encode()).hexdigest()[:16]
+    return f'"p{project_id}-v{version}-{digest}"'
+
+
+def make_task_etag(version: int) -> str:
+    """단일 업무 응답의 ETag (업무 version 기반, 수정 요청의 If-Match 값으로 사용)"""
+    return f'"t{version}"'
+
+
+def parse_if_match_versions(if_match: Optional[str]) -> Optional[Set[int]]:
+    """
+    If-Match 헤더에서 업무 버전 집합을 추출합니다. (ETag 또는 버전 숫자 허용)
+    헤더가 없거나 "*"이면 None (버전 조건 없음), 해석할 수 없는 값은 어떤 버전과도 일치하지 않습니다.
+    """
+    if not if_match:
+        return None
+    versions = set()
+    for tag in if_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return None
+        tag = tag.removeprefix("W/").strip('"').removeprefix("t")
+        if tag.isdigit():
+            versions.add(int(tag))
+    return versions
+
+
+def if_match_satisfied(if_match: Optional[str], version: int) -> bool:
+    """If-Match 헤더가 없거나 현재 업무 버전과 일치하면 True"""
+    versions = parse_if_match_versions(if_match)
+    return versions is None or version in versions
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더 값이 ETag와 일치하는지 확인"""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
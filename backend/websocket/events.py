@@ -4,7 +4,7 @@ from sqlalchemy.orm import Session
 
 from .connection_manager import connection_manager
 from .message_types import (
-    MessageType, TaskEventData, CommentEventData, ProjectEventData,
+    MessageType, WebSocketMessage, TaskEventData, CommentEventData, ProjectEventData,
     NotificationEventData, UserStatusEventData,
     create_task_message, create_comment_message, create_project_message,
     create_notification_message, create_user_status_message,
@@ -79,6 +79,49 @@ class WebSocketEventEmitter:
         else:
             print(f"⏭️ 개인 알림 생략 (동일 사용자)")
     
+    async def _broadcast_task_batch(
+        self,
+        message_type: MessageType,
+        project_id: int,
+        tasks: List[TaskEventData],
+        user_id: int
+    ):
+        """여러 Task 이벤트를 하나의 메시지로 묶어 프로젝트 룸에 발행"""
+        project_room = get_project_room_id(project_id)
+        message = WebSocketMessage(
+            type=message_type,
+            room_id=project_room,
+            user_id=user_id,
+            data={
+                "project_id": project_id,
+                "count": len(tasks),
+                "tasks": [task.dict() for task in tasks]
+            }
+        )
+
+        try:
+            await self.manager.broadcast_to_room(project_room, message.to_dict())
+        except Exception as e:
+            logger.warning(f"Failed to broadcast {message_type.value} to project {project_id}: {e}")
+
+    async def emit_tasks_created_batch(
+        self,
+        project_id: int,
+        tasks: List[TaskEventData],
+        created_by: int
+    ):
+        """여러 Task 생성 이벤트를 프로젝트 룸에 한 번에 발행"""
+        await self._broadcast_task_batch(MessageType.TASK_BATCH_CREATED, project_id, tasks, created_by)
+
+    async def emit_tasks_updated_batch(
+        self,
+        project_id: int,
+        tasks: List[TaskEventData],
+        updated_by: int
+    ):
+        """여러 Task 업데이트 이벤트를 프로젝트 룸에 한 번에 발행"""
+        await self._broadcast_task_batch(MessageType.TASK_BATCH_UPDATED, project_id, tasks, updated_by)
+    
     async def emit_task_updated(
         self,
         task_id: int,
@@ -21,7 +21,9 @@ class MessageType(str, Enum):
     
     # Task 관련
     TASK_CREATED = "task_created"
+    TASK_BATCH_CREATED = "task_batch_created"
     TASK_UPDATED = "task_updated"
+    TASK_BATCH_UPDATED = "task_batch_updated"
     TASK_DELETED = "task_deleted"
     TASK_STATUS_CHANGED = "task_status_changed"
     TASK_ASSIGNED = "task_assigned"
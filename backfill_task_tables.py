@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+업무 파생 테이블 초기 백필 스크립트
+배포 시 서버 시작 전에 한 번 실행합니다. (이미 채워진 테이블은 건너뜀)
+
+- task_closure: 업무 계층 클로저 테이블
+- 검색 색인: tasks.search_vector (PostgreSQL) / task_search (SQLite FTS5, 테이블이 없으면 생성)
+- project_task_stats: 대시보드 업무 집계 카운터
+- project_status_snapshot: 일별 상태 스냅샷 (활동 로그 재생)
+"""
+
+from sqlalchemy import text
+
+from backend.database.base import engine, SessionLocal
+from backend.models import user, workspace, project, project_invitation, logs_notification, workspace_project_order, user_setting, tag, task, comment_file  # noqa: F401 (테이블 등록)
+from backend.utils.task_hierarchy import ensure_task_closure
+from backend.utils.task_search import ensure_task_search
+from backend.utils.task_stats import ensure_project_task_stats
+from backend.utils.status_snapshot import ensure_status_snapshots
+
+# 백필이 동시에 두 번 실행되지 않도록 잡는 PostgreSQL advisory lock 키
+BACKFILL_LOCK_KEY = 7310001
+
+BACKFILL_STEPS = [
+    ("업무 계층 클로저 테이블", ensure_task_closure),
+    ("업무 검색 색인", ensure_task_search),
+    ("업무 집계 카운터", ensure_project_task_stats),
+    ("일별 상태 스냅샷", ensure_status_snapshots),
+]
+
+
+def backfill_task_tables():
+    """비어 있는 업무 파생 테이블을 순서대로 백필합니다."""
+    user.Base.metadata.create_all(bind=engine)
+
+    print("Starting task table backfill...")
+    with SessionLocal() as db:
+        use_lock = db.get_bind().dialect.name == "postgresql"
+        if use_lock:
+            # 세션 단위 잠금 (각 단계의 커밋과 관계없이 스크립트가 끝날 때까지 유지)
+            db.execute(text("SELECT pg_advisory_lock(:key)"), {"key": BACKFILL_LOCK_KEY})
+        try:
+            for name, ensure in BACKFILL_STEPS:
+                try:
+                    ensure(db)
+                    print(f"✓ {name}")
+                except Exception as e:
+                    db.rollback()
+                    print(f"❌ {name} 백필 실패: {e}")
+                    raise
+        finally:
+            if use_lock:
+                db.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": BACKFILL_LOCK_KEY})
+                db.commit()
+    print("\n🎉 Task table backfill completed successfully!")
+
+
+if __name__ == "__main__":
+    backfill_task_tables()
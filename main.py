@@ -5,9 +5,11 @@ from backend.routers import tag as tag_router
 from backend.routers import user_profile
 from backend.websocket import websocket_router
 from backend.database.base import engine, check_db_connection
+from backend.utils.status_snapshot import run_status_snapshot_job
 from backend.models import user, workspace as workspace_model, project as project_model, project_invitation, logs_notification, workspace_project_order as wpo_model, user_setting as user_setting_model, tag, task as task_model
 from backend.routers import deadline_notification
 from backend.routers import logs
+from backend.routers import project_transfer
 
 # 데이터베이스 연결 확인
 check_db_connection()
@@ -23,6 +25,18 @@ user_setting_model.Base.metadata.create_all(bind=engine)
 tag.Base.metadata.create_all(bind=engine)
 task_model.Base.metadata.create_all(bind=engine)
 
+# 업무 계층 클로저 테이블 / 전문 검색 색인 / 집계 카운터 / 상태 스냅샷 초기 백필은
+# 워커마다 실행되지 않도록 배포 시 backfill_task_tables.py로 한 번 실행
+
+# 일별 상태 스냅샷 기록 (번다운 / 누적 흐름도) - 매시간 59분에 오늘 스냅샷 갱신 (23:59 실행 결과가 그날의 값)
+deadline_notification.scheduler.add_job(
+    run_status_snapshot_job,
+    'cron',
+    minute=59,
+    id="status_snapshot",
+    replace_existing=True
+)
+
 
 app = FastAPI(
     title="Software Engineering Backend API",
@@ -38,6 +52,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  # 모든 HTTP 메서드 허용
     allow_headers=["*"],  # 모든 헤더 허용
+    expose_headers=["X-Next-Cursor", "ETag", "X-Total-Count", "Content-Disposition"],  # 페이지네이션 커서 / ETag / 전체 개수 / 다운로드 파일명 헤더 노출
 )
 
 # 라우터 등록 (새로운 구조)
@@ -55,6 +70,7 @@ app.include_router(task_project_member.router) # 프로젝트 멤버 관리
 app.include_router(comment.router)        # 댓글 관리
 app.include_router(tag_router.router)     # 태그 관리
 app.include_router(logs.router)
+app.include_router(project_transfer.router) # 프로젝트 내보내기/가져오기 (NDJSON)
 app.include_router(user_delete.router)
 app.include_router(user_password.router)
 app.include_router(user_profile.router)
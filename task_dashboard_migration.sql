@@ -0,0 +1,8 @@
+-- ===================================================================
+-- 대시보드 집계 마이그레이션 스크립트
+-- 목적: GET /api/v1/dashboard/{project_id} 의 상위 업무 진행률(parent_task_id x status GROUP BY) 집계 지원
+-- (project_task_stats 집계 테이블은 서버 시작 시 create_all 로 생성, backfill_task_tables.py로 백필)
+-- ===================================================================
+
+CREATE INDEX IF NOT EXISTS ix_tasks_project_parent_status
+    ON public.tasks (project_id, parent_task_id, status);
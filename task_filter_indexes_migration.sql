@@ -0,0 +1,16 @@
+-- ===================================================================
+-- 업무 목록 서버 측 필터/정렬 인덱스 마이그레이션 스크립트
+-- 목적: GET /api/v1/tasks 의 status / assignee_id / due_date / tag 필터 지원
+-- ===================================================================
+
+CREATE INDEX IF NOT EXISTS ix_tasks_project_status
+    ON public.tasks (project_id, status);
+
+CREATE INDEX IF NOT EXISTS ix_tasks_project_assignee
+    ON public.tasks (project_id, assignee_id);
+
+CREATE INDEX IF NOT EXISTS ix_tasks_project_due_date
+    ON public.tasks (project_id, due_date);
+
+CREATE INDEX IF NOT EXISTS ix_task_tags_tag_name_task_id
+    ON public.task_tags (tag_name, task_id);
@@ -0,0 +1,7 @@
+-- ===================================================================
+-- 업무 목록 커서 페이지네이션 인덱스 마이그레이션 스크립트
+-- 목적: GET /api/v1/tasks?project_id=&limit=&cursor= 의 keyset 조회 지원
+-- ===================================================================
+
+CREATE INDEX IF NOT EXISTS ix_tasks_project_updated_at_task_id
+    ON public.tasks (project_id, updated_at, task_id);
@@ -0,0 +1,10 @@
+-- ===================================================================
+-- 업무 전문 검색 마이그레이션 스크립트
+-- 목적: GET /api/v1/tasks/search 의 tsvector + GIN 인덱스 기반 검색 지원
+-- (기존 업무의 search_vector는 backfill_task_tables.py로 백필)
+-- ===================================================================
+
+ALTER TABLE public.tasks ADD COLUMN IF NOT EXISTS search_vector tsvector;
+
+CREATE INDEX IF NOT EXISTS ix_tasks_search_vector
+    ON public.tasks USING gin (search_vector);
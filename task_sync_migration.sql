@@ -0,0 +1,10 @@
+-- ===================================================================
+-- 업무 변경분 동기화 마이그레이션 스크립트
+-- 목적: GET /api/v1/tasks/changes 의 sync_version 기반 변경 조회 지원
+-- (task_tombstones, project_task_versions 테이블은 서버 시작 시 자동 생성)
+-- ===================================================================
+
+ALTER TABLE public.tasks ADD COLUMN IF NOT EXISTS sync_version integer NOT NULL DEFAULT 0;
+
+CREATE INDEX IF NOT EXISTS ix_tasks_project_sync_version
+    ON public.tasks (project_id, sync_version);
@@ -0,0 +1,7 @@
+-- ===================================================================
+-- 타임라인(간트) 조회 인덱스 마이그레이션 스크립트
+-- 목적: GET /api/v1/projects/{project_id}/timeline 의 기간 겹침 조회 지원
+-- ===================================================================
+
+CREATE INDEX IF NOT EXISTS ix_tasks_project_start_due
+    ON public.tasks (project_id, start_date, due_date);
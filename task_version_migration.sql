@@ -0,0 +1,6 @@
+-- ===================================================================
+-- 업무 낙관적 동시성 제어 마이그레이션 스크립트
+-- 목적: PATCH /api/v1/tasks/{task_id}, /status 의 If-Match(업무 version) 검사 지원
+-- ===================================================================
+
+ALTER TABLE public.tasks ADD COLUMN IF NOT EXISTS version integer NOT NULL DEFAULT 1;
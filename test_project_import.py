@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+프로젝트 가져오기 테스트
+담당자 없이 가져온 업무가 가져오기를 실행한 사용자에게 배정되고 업무 목록 응답을 만들 수 있는지 검증
+"""
+
+import json
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.database.base import Base
+from backend.models.user import User
+from backend.models.project import Project, ProjectMember
+from backend.models.task import Task, TaskMember
+from backend.models import comment_file, logs_notification, tag, workspace, workspace_project_order  # noqa: F401 (테이블 등록)
+from backend.utils.project_import import ProjectImporter
+from backend.utils.task_loader import build_task_responses
+
+
+def make_session():
+    """테스트용 인메모리 SQLite 세션 생성"""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine, autoflush=False)()
+
+
+def seed_project(db):
+    """소유자 1명만 있는 프로젝트 생성"""
+    user = User(email="owner@example.com", password="x", name="소유자")
+    db.add(user)
+    db.flush()
+
+    project = Project(title="가져오기 프로젝트", owner_id=user.user_id)
+    db.add(project)
+    db.flush()
+    db.add(ProjectMember(project_id=project.project_id, user_id=user.user_id, role="owner"))
+    db.commit()
+    return user, project.project_id
+
+
+def run_import(db, user, project_id, records):
+    importer = ProjectImporter(db, user, project_id)
+    for line_no, record in enumerate(records, start=1):
+        importer.feed_line(line_no, json.dumps(record).encode())
+    return importer.finish()
+
+
+def test_import_without_assignee():
+    """assignee_email이 없는 업무는 가져오기를 실행한 사용자가 담당자가 되어야 함"""
+    db = make_session()
+    try:
+        user, project_id = seed_project(db)
+        report = run_import(db, user, project_id, [{"type": "task", "title": "noassignee"}])
+
+        assert report["imported_tasks"] == 1
+        assert report["errors"] == []
+
+        tasks = db.query(Task).filter(Task.project_id == project_id).all()
+        assert [task.assignee_id for task in tasks] == [user.user_id]
+        assert db.query(TaskMember.user_id).filter(TaskMember.task_id == tasks[0].task_id).scalar() == user.user_id
+
+        responses = build_task_responses(db, tasks)
+        assert responses[0].assignee_id == user.user_id
+        assert responses[0].assignee_name == "소유자"
+    finally:
+        db.close()
+
+
+def test_import_with_non_member_assignee():
+    """프로젝트 멤버가 아닌 담당자는 저장하지 않고 오류로 보고해야 함"""
+    db = make_session()
+    try:
+        user, project_id = seed_project(db)
+        report = run_import(db, user, project_id, [
+            {"type": "task", "title": "outsider", "assignee_email": "outsider@example.com"},
+        ])
+
+        assert report["imported_tasks"] == 0
+        assert report["error_count"] == 1
+        assert report["errors"][0]["line"] == 1
+        assert db.query(Task).filter(Task.project_id == project_id).count() == 0
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    test_import_without_assignee()
+    test_import_with_non_member_assignee()
+    print("✅ 프로젝트 가져오기 테스트 통과")
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+업무 낙관적 동시성 제어 테스트
+읽은 버전이 오래된 수정 요청이 412/409로 거부되고 업무 행이 바뀌지 않는지 검증
+"""
+
+import asyncio
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from fastapi import HTTPException, Response
+from sqlalchemy import update
+
+import backend.routers.task as task_router
+from backend.models.task import Task
+from backend.models.user import User
+from backend.schemas.Task import TaskBulkUpdateRequest, TaskUpdateRequest
+from backend.utils.task_version import make_task_etag
+from test_task_loader import make_session, seed_project
+
+
+def task_row(db, task_id):
+    """업무의 (title, status, version)"""
+    db.expire_all()
+    task = db.get(Task, task_id)
+    return task.title, task.status, task.version
+
+
+def concurrent_write(db, task_ids):
+    """
+    핸들러가 업무를 읽은 뒤 쓰기 전에 다른 요청의 수정이 먼저 반영된 상황을 만듭니다.
+    (핸들러가 쓰기 직전에 호출하는 bump_project_task_version에서 업무 version을 올림)
+    """
+    bump = task_router.bump_project_task_version
+
+    def bump_after_concurrent_write(session, project_id):
+        session.execute(
+            update(Task.__table__)
+            .where(Task.__table__.c.task_id.in_(task_ids))
+            .values(version=Task.__table__.c.version + 1)
+        )
+        return bump(session, project_id)
+
+    task_router.bump_project_task_version = bump_after_concurrent_write
+    return bump
+
+
+def child_task_ids(db, project_id):
+    return [
+        task_id for (task_id,) in db.query(Task.task_id)
+        .filter(Task.project_id == project_id, Task.parent_task_id.isnot(None))
+        .order_by(Task.task_id)
+    ]
+
+
+def test_stale_if_match_returns_412():
+    """If-Match가 현재 버전과 다르면 412와 최신 ETag를 반환하고 업무는 바뀌지 않아야 함"""
+    engine, db = make_session()
+    try:
+        project_id = seed_project(db, 1)
+        user = db.query(User).first()
+        task_id = child_task_ids(db, project_id)[0]
+        before = task_row(db, task_id)
+
+        try:
+            asyncio.run(task_router.update_task(
+                task_id, TaskUpdateRequest(title="덮어쓰기"), Response(),
+                if_match=make_task_etag(before[2] + 1), db=db, current_user=user
+            ))
+            assert False, "412가 발생해야 함"
+        except HTTPException as e:
+            assert e.status_code == 412
+            assert e.headers["ETag"] == make_task_etag(before[2])
+
+        assert task_row(db, task_id) == before
+    finally:
+        db.close()
+
+
+def test_concurrent_update_returns_412():
+    """읽은 뒤 다른 요청이 먼저 수정하면 flush의 StaleDataError가 412로 바뀌고 업무는 바뀌지 않아야 함"""
+    engine, db = make_session()
+    try:
+        project_id = seed_project(db, 1)
+        user = db.query(User).first()
+        task_id = child_task_ids(db, project_id)[0]
+        before = task_row(db, task_id)
+
+        bump = concurrent_write(db, [task_id])
+        try:
+            asyncio.run(task_router.update_task(
+                task_id, TaskUpdateRequest(title="덮어쓰기"), Response(),
+                if_match=None, db=db, current_user=user
+            ))
+            assert False, "412가 발생해야 함"
+        except HTTPException as e:
+            assert e.status_code == 412
+        finally:
+            task_router.bump_project_task_version = bump
+
+        assert task_row(db, task_id) == before
+    finally:
+        db.close()
+
+
+def test_concurrent_bulk_update_returns_409():
+    """일괄 수정 중 일부 업무가 먼저 수정되면 409를 반환하고 어떤 업무도 바뀌지 않아야 함"""
+    engine, db = make_session()
+    try:
+        project_id = seed_project(db, 3)
+        user = db.query(User).first()
+        task_ids = child_task_ids(db, project_id)
+        before = [task_row(db, task_id) for task_id in task_ids]
+
+        bump = concurrent_write(db, task_ids[:1])
+        try:
+            asyncio.run(task_router.update_tasks_bulk(
+                TaskBulkUpdateRequest(task_ids=task_ids, status="complete"), db=db, current_user=user
+            ))
+            assert False, "409가 발생해야 함"
+        except HTTPException as e:
+            assert e.status_code == 409
+        finally:
+            task_router.bump_project_task_version = bump
+
+        assert [task_row(db, task_id) for task_id in task_ids] == before
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    test_stale_if_match_returns_412()
+    test_concurrent_update_returns_412()
+    test_concurrent_bulk_update_returns_409()
+    print("✅ 업무 동시성 제어 테스트 통과")
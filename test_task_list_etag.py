@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+업무 목록 ETag 테스트
+같은 버전의 If-None-Match 요청은 304를 받고, 업무 쓰기 후에는 ETag가 바뀌는지 검증
+"""
+
+import asyncio
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from fastapi import Request, Response
+
+from backend.models.task import Task
+from backend.models.user import User
+from backend.routers.task import read_tasks, update_task
+from backend.schemas.Task import TaskUpdateRequest
+from test_task_loader import make_session, seed_project
+
+
+def get_task_list(db, user, project_id, if_none_match=None):
+    """GET /api/v1/tasks?project_id= 호출 후 (상태 코드, ETag, 본문) 반환"""
+    request = Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/api/v1/tasks",
+        "query_string": f"project_id={project_id}".encode(),
+        "headers": [],
+    })
+    response = Response()
+    result = read_tasks(
+        project_id, request, response,
+        status_filter=None, assignee_id=None, priority=None, tag=None, due_from=None, due_to=None,
+        sort=None, limit=None, cursor=None, fields=None,
+        if_none_match=if_none_match, accept=None, db=db, current_user=user
+    )
+    if isinstance(result, Response):
+        return result.status_code, result.headers["ETag"], None
+    return 200, response.headers["ETag"], result
+
+
+def test_matching_if_none_match_returns_304():
+    """목록이 바뀌지 않았으면 받은 ETag로 다시 요청할 때 304를 반환해야 함"""
+    engine, db = make_session()
+    try:
+        project_id = seed_project(db, 3)
+        user = db.query(User).first()
+
+        status_code, etag, tasks = get_task_list(db, user, project_id)
+        assert status_code == 200
+        assert len(tasks) == 4
+
+        status_code, not_modified_etag, body = get_task_list(db, user, project_id, if_none_match=etag)
+        assert status_code == 304
+        assert not_modified_etag == etag
+        assert body is None
+    finally:
+        db.close()
+
+
+def test_write_changes_etag():
+    """업무를 수정하면 ETag가 바뀌고 이전 ETag로 요청하면 새 목록을 반환해야 함"""
+    engine, db = make_session()
+    try:
+        project_id = seed_project(db, 3)
+        user = db.query(User).first()
+        _, etag, _ = get_task_list(db, user, project_id)
+
+        task_id = db.query(Task.task_id).filter(Task.project_id == project_id, Task.parent_task_id.isnot(None)).first()[0]
+        asyncio.run(update_task(
+            task_id, TaskUpdateRequest(title="새 제목"), Response(), if_match=None, db=db, current_user=user
+        ))
+
+        status_code, new_etag, tasks = get_task_list(db, user, project_id, if_none_match=etag)
+        assert status_code == 200
+        assert new_etag != etag
+        assert "새 제목" in [task.title for task in tasks]
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    test_matching_if_none_match_returns_304()
+    test_write_changes_etag()
+    print("✅ 업무 목록 ETag 테스트 통과")
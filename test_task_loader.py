@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+업무 일괄 로더 테스트
+build_task_responses가 업무 수와 관계없이 고정된 수의 쿼리를 실행하는지 검증
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from datetime import date
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.database.base import Base
+from backend.models.user import User
+from backend.models.project import Project, ProjectMember
+from backend.models.task import Task, TaskMember
+from backend.models.tag import Tag, TaskTag
+from backend.models import comment_file, logs_notification, workspace, workspace_project_order  # noqa: F401 (테이블 등록)
+from backend.utils.task_loader import build_task_responses
+
+
+def make_session():
+    """테스트용 인메모리 SQLite 세션 생성"""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    return engine, sessionmaker(bind=engine, autoflush=False)()
+
+
+def seed_project(db, task_count):
+    """상위 업무 1개와 하위 업무 task_count개를 가진 프로젝트 생성"""
+    user = User(email=f"user{task_count}@example.com", password="x", name=f"사용자{task_count}")
+    db.add(user)
+    db.flush()
+
+    project = Project(title=f"프로젝트{task_count}", owner_id=user.user_id)
+    db.add(project)
+    db.flush()
+    db.add(ProjectMember(project_id=project.project_id, user_id=user.user_id, role="owner"))
+    db.add(Tag(project_id=project.project_id, tag_name="backend"))
+
+    parent = Task(
+        project_id=project.project_id,
+        title="상위 업무",
+        assignee_id=user.user_id,
+        is_parent_task=True,
+        start_date=date.today(),
+        due_date=date.today(),
+    )
+    db.add(parent)
+    db.flush()
+
+    for i in range(task_count):
+        task = Task(
+            project_id=project.project_id,
+            parent_task_id=parent.task_id,
+            title=f"업무 {i}",
+            assignee_id=user.user_id,
+            start_date=date.today(),
+            due_date=date.today(),
+        )
+        db.add(task)
+        db.flush()
+        db.add(TaskMember(task_id=task.task_id, user_id=user.user_id))
+        db.add(TaskTag(task_id=task.task_id, tag_name="backend"))
+
+    db.commit()
+    return project.project_id
+
+
+def count_loader_queries(engine, db, project_id):
+    """프로젝트 업무 목록 조회 + 응답 생성에 사용된 SQL 문 수 측정"""
+    db.expire_all()
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        tasks = db.query(Task).filter(Task.project_id == project_id).all()
+        responses = build_task_responses(db, tasks)
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    return len(statements), responses
+
+
+def test_query_count_is_constant():
+    """업무 수가 늘어나도 쿼리 수가 증가하지 않아야 함"""
+    engine, db = make_session()
+    try:
+        small_project = seed_project(db, 5)
+        large_project = seed_project(db, 50)
+
+        small_count, small_responses = count_loader_queries(engine, db, small_project)
+        large_count, large_responses = count_loader_queries(engine, db, large_project)
+
+        assert len(small_responses) == 6
+        assert len(large_responses) == 51
+        assert small_count == large_count, f"쿼리 수 증가: {small_count} -> {large_count}"
+    finally:
+        db.close()
+
+
+def test_response_fields():
+    """멤버/태그/상위 업무 제목/담당자 이름이 올바르게 채워져야 함"""
+    engine, db = make_session()
+    try:
+        project_id = seed_project(db, 3)
+        tasks = db.query(Task).filter(Task.project_id == project_id).order_by(Task.task_id).all()
+        responses = build_task_responses(db, tasks)
+
+        parent, child = responses[0], responses[1]
+        assert parent.parent_task_title is None
+        assert parent.tag_names == []
+        assert child.parent_task_title == "상위 업무"
+        assert child.tag_names == ["backend"]
+        assert child.member_ids == [child.assignee_id]
+        assert child.assignee_name == "사용자3"
+        assert [r.task_id for r in responses] == [t.task_id for t in tasks]
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    test_query_count_is_constant()
+    test_response_fields()
+    print("✅ 업무 일괄 로더 테스트 통과")
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+업무 검색 색인 테스트
+댓글 작성/수정/삭제에 따른 검색 색인 갱신이 업무의 updated_at과 버전을 바꾸지 않는지 검증
+"""
+
+import asyncio
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from sqlalchemy.dialects import postgresql
+
+from backend.models.task import Task
+from backend.models.user import User
+from backend.routers.comment import CommentCreate, CommentUpdate, create_comment, delete_comment, update_comment
+from backend.utils.task_search import search_tasks, search_vector_update
+from backend.utils.task_version import get_project_task_version
+from test_task_loader import make_session, seed_project
+
+
+def task_state(db, task_id):
+    """업무의 (updated_at, version, sync_version)"""
+    db.expire_all()
+    task = db.get(Task, task_id)
+    return task.updated_at, task.version, task.sync_version
+
+
+def test_comment_write_keeps_task_version():
+    """댓글 작성/수정/삭제 후에도 업무 updated_at, 버전, 프로젝트 업무 버전이 그대로여야 함"""
+    engine, db = make_session()
+    try:
+        project_id = seed_project(db, 1)
+        user = db.query(User).first()
+        task_id = db.query(Task.task_id).filter(Task.project_id == project_id, Task.parent_task_id.isnot(None)).scalar()
+        before = task_state(db, task_id)
+        project_version = get_project_task_version(db, project_id)
+
+        comment = asyncio.run(create_comment(CommentCreate(task_id=task_id, content="검색용댓글"), db, user))
+        assert [found for found, _ in search_tasks(db, project_id, "검색용댓글", 10)] == [task_id]
+        assert task_state(db, task_id) == before
+
+        asyncio.run(update_comment(comment.comment_id, CommentUpdate(content="수정된댓글"), db, user))
+        assert task_state(db, task_id) == before
+
+        asyncio.run(delete_comment(comment.comment_id, db, user))
+        assert task_state(db, task_id) == before
+        assert get_project_task_version(db, project_id) == project_version
+    finally:
+        db.close()
+
+
+def test_search_vector_update_keeps_updated_at():
+    """PostgreSQL 색인 갱신 UPDATE는 updated_at을 자기 자신으로 유지해야 함 (onupdate 미적용)"""
+    sql = str(search_vector_update([1]).compile(dialect=postgresql.dialect()))
+    assert "updated_at=tasks.updated_at" in sql
+    assert "version=" not in sql
+
+
+if __name__ == "__main__":
+    test_comment_write_keeps_task_version()
+    test_search_vector_update_keeps_updated_at()
+    print("✅ 업무 검색 색인 테스트 통과")